@@ -1,11 +1,11 @@
 """Dependency injection for DocFlow HR API."""
 
-from typing import Annotated, Optional
+from functools import lru_cache
+from typing import Annotated, Iterable, Optional
 
 from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.config import settings
 from app.core.exceptions import AuthenticationError
 from app.core.security import decode_token, verify_token_type
 from app.db.zerodb_client import ZeroDBClient, get_zerodb_client
@@ -123,15 +123,41 @@ async def get_current_active_user(
     return current_user
 
 
-def require_role(required_roles: list[str]):
+def normalize_role(role: str) -> str:
+    """Normalize a role name for comparison.
+
+    Tokens carry either the role key ("hr_manager") or its display name
+    ("HR Manager"); both normalize to the key.
+
+    Args:
+        role: Role key or display name
+
+    Returns:
+        Lowercase role key
+    """
+    return role.strip().lower().replace(" ", "_")
+
+
+def require_role(required_roles: Iterable[str]):
     """Create a dependency that requires specific roles.
 
+    Role names are matched case-insensitively, and display names match
+    their role key. The same dependency object is returned for the same
+    set of roles, so FastAPI resolves it once per request however many
+    routes or sub-dependencies use it.
+
     Args:
-        required_roles: List of required role names
+        required_roles: Allowed role names
 
     Returns:
         Dependency function
     """
+    return _role_checker(frozenset(normalize_role(role) for role in required_roles))
+
+
+@lru_cache(maxsize=None)
+def _role_checker(allowed_roles: frozenset):
+    """Build the role-checking dependency for a normalized set of roles."""
 
     async def role_checker(
         current_user: Annotated[dict, Depends(get_current_active_user)],
@@ -147,11 +173,11 @@ def require_role(required_roles: list[str]):
         Raises:
             HTTPException: If user lacks required role
         """
-        user_role = current_user.get("role", "")
-        if user_role not in required_roles:
+        user_role = current_user.get("role") or ""
+        if normalize_role(user_role) not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{user_role}' not authorized. Required: {required_roles}",
+                detail=f"Role '{user_role}' not authorized. Required: {sorted(allowed_roles)}",
             )
         return current_user
 
@@ -3,37 +3,125 @@
 This module provides endpoints for querying and exporting audit events:
 - GET /events - Query audit events with filters
 - GET /events/entity/{entity_type}/{entity_id} - Get events for specific entity
-- GET /export - Export audit events as JSON or CSV
+- GET /export - Quick export of up to 1 000 audit events as JSON or CSV
+- POST /export - Start a background export job
+- GET /export/{job_id} - Get export job status and download URL
 """
 
-import csv
-import io
-import json
+import asyncio
 import logging
 from datetime import datetime
-from typing import Annotated, Optional
+from typing import Annotated, AsyncIterator, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+import orjson
+import zstandard
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
-from app.api.deps import ActiveUserDep, DBDep, require_role
+from app.api.deps import ActiveUserDep, DBDep, normalize_role, require_role
+from app.core.exceptions import NotFoundError
+from app.models.audit_event import AUDIT_ACTION_PATTERN
+from app.models.enums import AuditEntityType
 from app.schemas.audit import (
-    AuditEvent,
     AuditEventListResponse,
+    AuditExportJobResponse,
     DocumentAuditTrailResponse,
 )
-from app.services.audit import AuditService
+from app.services.audit import get_audit_service
+from app.services.audit_export import (
+    CSV_EXPORT_HEADER,
+    format_csv_row,
+    get_audit_export_service,
+    serialize_json_export,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 # Roles allowed to access audit logs
-AUDIT_ACCESS_ROLES = ["super_admin", "org_admin", "hr_manager", "auditor"]
+AUDIT_ACCESS_ROLES = frozenset({"super_admin", "org_admin", "hr_manager", "auditor"})
+
+# Built once so every audit route shares the same dependency object
+_audit_role_dep = require_role(AUDIT_ACCESS_ROLES)
+
+# Filter formats, checked by FastAPI before any query reaches the database.
+# Actor IDs are UUIDs or short system identifiers such as "system".
+AUDIT_ACTOR_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
+AUDIT_FILTER_MAX_LENGTH = 100
+
+# Maximum number of events in a synchronous "quick download" export;
+# larger exports go through POST /export as a background job
+EXPORT_MAX_EVENTS = 1000
+
+# CSV rows joined into each chunk written to the response
+CSV_EXPORT_CHUNK_ROWS = 64
+
+# zstd level for compressed exports (fast, roughly 3x on audit data)
+EXPORT_ZSTD_LEVEL = 3
+
+
+def _make_etag(total: int, first_id: object, last_id: object, *parts: object) -> str:
+    """Build a strong ETag for a page of audit events.
+
+    Audit events are append-only, so the match count changes whenever a
+    matching event is added, and the page's first and last IDs change
+    whenever the page shifts. The value is derived only from data, so it
+    is stable across workers and restarts.
+    """
+    return '"' + ":".join(map(str, (total, first_id, last_id, *parts))) + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def _accepts_zstd(request: Request) -> bool:
+    """Check whether the client advertises zstd in Accept-Encoding."""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "zstd":
+            continue
+        key, _, value = params.partition("=")
+        if key.strip().lower() == "q":
+            try:
+                return float(value) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+async def _zstd_stream(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Compress a stream of text chunks into a zstd frame as they arrive."""
+    compressor = zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL).compressobj()
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk.encode())
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _export_headers(filename: str, compressed: bool) -> Dict[str, str]:
+    """Build response headers for an export download."""
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Vary": "Accept-Encoding",
+    }
+    if compressed:
+        headers["Content-Encoding"] = "zstd"
+    return headers
 
 
 async def get_audit_viewer(
-    current_user: Annotated[dict, Depends(require_role(AUDIT_ACCESS_ROLES))],
+    current_user: Annotated[dict, Depends(_audit_role_dep)],
 ) -> dict:
     """Dependency to ensure user has audit access permissions."""
     return current_user
@@ -49,23 +137,42 @@ AuditViewerDep = Annotated[dict, Depends(get_audit_viewer)]
     description="Query audit events with optional filters. Results are paginated and scoped to the user's organization.",
 )
 async def query_audit_events(
+    request: Request,
     db: DBDep,
     viewer: AuditViewerDep,
-    entity_type: Optional[str] = Query(default=None, description="Filter by entity type (document, employee, legal_hold)"),
+    entity_type: Optional[AuditEntityType] = Query(default=None, description="Filter by entity type"),
     entity_id: Optional[str] = Query(default=None, description="Filter by entity ID"),
-    action: Optional[str] = Query(default=None, description="Filter by action type"),
-    actor_id: Optional[str] = Query(default=None, description="Filter by actor ID"),
+    action: Optional[str] = Query(
+        default=None,
+        max_length=AUDIT_FILTER_MAX_LENGTH,
+        pattern=AUDIT_ACTION_PATTERN,
+        description="Filter by action type (e.g. document.received)",
+    ),
+    actor_id: Optional[str] = Query(
+        default=None,
+        max_length=AUDIT_FILTER_MAX_LENGTH,
+        pattern=AUDIT_ACTOR_ID_PATTERN,
+        description="Filter by actor ID",
+    ),
     start_date: Optional[datetime] = Query(default=None, description="Filter events after this date"),
     end_date: Optional[datetime] = Query(default=None, description="Filter events before this date"),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
-) -> AuditEventListResponse:
+    all_orgs: bool = Query(default=False, description="Query across all organizations (super_admin only)"),
+) -> Response:
     """Query audit events with filters.
 
     Returns a paginated list of audit events filtered by the provided criteria.
-    All results are scoped to the authenticated user's organization.
+    Results are scoped to the authenticated user's organization, except for
+    super admins who explicitly request a cross-organization view.
+
+    Responses carry an ETag computed from the fetched page; a matching
+    If-None-Match yields 304 Not Modified without serializing or sending
+    the page. Event rows are serialized straight to JSON;
+    ``response_model`` only documents the shape.
 
     Args:
+        request: Incoming request (for If-None-Match)
         db: Database client
         viewer: Authenticated user with audit access
         entity_type: Optional filter by entity type
@@ -76,23 +183,25 @@ async def query_audit_events(
         end_date: Optional filter for events before this date
         page: Page number for pagination
         page_size: Number of items per page
+        all_orgs: Drop organization scoping (honored for super_admin only)
 
     Returns:
-        AuditEventListResponse with paginated audit events
+        JSON response shaped like AuditEventListResponse, or a bare 304
     """
+    is_admin = all_orgs and normalize_role(viewer.get("role") or "") == "super_admin"
     org_id = viewer.get("org_id")
-    if not org_id:
+    if not org_id and not is_admin:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User organization ID not found",
         )
 
-    logger.info(f"Querying audit events for org {org_id}")
+    logger.info("Querying audit events for org %s", org_id if not is_admin else "*")
 
-    service = AuditService(db)
-    events, total = await service.query_events(
+    service = get_audit_service(db)
+    rows, total = await service.query_event_rows(
         org_id=org_id,
-        entity_type=entity_type,
+        entity_type=entity_type.value if entity_type else None,
         entity_id=entity_id,
         action=action,
         actor_id=actor_id,
@@ -100,13 +209,28 @@ async def query_audit_events(
         end_date=end_date,
         page=page,
         page_size=page_size,
+        is_admin=is_admin,
     )
 
-    return AuditEventListResponse(
-        events=events,
-        total=total,
-        page=page,
-        page_size=page_size,
+    etag = _make_etag(
+        total,
+        rows[0]["id"] if rows else "-",
+        rows[-1]["id"] if rows else "-",
+        page,
+        page_size,
+    )
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(
+        content=orjson.dumps({
+            "events": rows,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        }),
+        media_type="application/json",
+        headers={"ETag": etag},
     )
 
 
@@ -117,23 +241,35 @@ async def query_audit_events(
     description="Get the complete audit trail for a specific entity (document, employee, etc.).",
 )
 async def get_entity_audit_trail(
-    entity_type: str,
+    entity_type: AuditEntityType,
     entity_id: str,
+    request: Request,
     db: DBDep,
     viewer: AuditViewerDep,
-) -> DocumentAuditTrailResponse:
+    page: int = Query(default=1, ge=1, description="Page number"),
+    page_size: int = Query(default=100, ge=1, le=1000, description="Items per page"),
+) -> Response:
     """Get the audit trail for a specific entity.
 
-    Returns all audit events for the specified entity in chronological order.
+    Returns audit events for the specified entity in chronological order,
+    one page at a time. ``total_events`` always reflects the full trail.
+    Pollers can send If-None-Match to get 304 Not Modified until a new
+    event is recorded.
+
+    The page is serialized straight from the event objects rather than
+    being dumped and re-validated against ``response_model``.
 
     Args:
-        entity_type: Type of entity (document, employee, legal_hold)
+        entity_type: Type of entity (see AuditEntityType)
         entity_id: ID of the entity
+        request: Incoming request (for If-None-Match)
         db: Database client
         viewer: Authenticated user with audit access
+        page: Page number for pagination
+        page_size: Number of items per page
 
     Returns:
-        DocumentAuditTrailResponse with all events for the entity
+        JSON response shaped like DocumentAuditTrailResponse, or a bare 304
     """
     org_id = viewer.get("org_id")
     if not org_id:
@@ -142,50 +278,78 @@ async def get_entity_audit_trail(
             detail="User organization ID not found",
         )
 
-    logger.info(f"Getting audit trail for {entity_type}/{entity_id} in org {org_id}")
+    entity_type_value = entity_type.value
+    logger.info("Getting audit trail for %s/%s in org %s", entity_type_value, entity_id, org_id)
 
-    service = AuditService(db)
+    service = get_audit_service(db)
 
-    # Query all events for this entity
-    events, total = await service.query_events(
+    # Query events for this entity in chronological order
+    events, total = await service.entity_trail(
         org_id=org_id,
-        entity_type=entity_type,
+        entity_type=entity_type_value,
         entity_id=entity_id,
-        page=1,
-        page_size=10000,  # Get all events
+        page=page,
+        page_size=page_size,
     )
 
-    # Sort by created_at in chronological order
-    events.sort(key=lambda e: e.created_at)
+    etag = _make_etag(
+        total,
+        events[0].id if events else "-",
+        events[-1].id if events else "-",
+        page,
+        page_size,
+    )
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-    return DocumentAuditTrailResponse(
+    trail = DocumentAuditTrailResponse.model_construct(
         document_id=entity_id,
         events=events,
         total_events=total,
     )
+    return Response(
+        content=trail.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.get(
     "/export",
     summary="Export Audit Events",
-    description="Export audit events as JSON or CSV file.",
+    description="Quick export of up to 1 000 audit events as a JSON or CSV file. Use POST /export for larger exports.",
 )
 async def export_audit_events(
+    request: Request,
     db: DBDep,
     viewer: AuditViewerDep,
     format: str = Query(default="json", pattern="^(json|csv)$", description="Export format: json or csv"),
-    entity_type: Optional[str] = Query(default=None, description="Filter by entity type"),
+    entity_type: Optional[AuditEntityType] = Query(default=None, description="Filter by entity type"),
     entity_id: Optional[str] = Query(default=None, description="Filter by entity ID"),
-    action: Optional[str] = Query(default=None, description="Filter by action type"),
-    actor_id: Optional[str] = Query(default=None, description="Filter by actor ID"),
+    action: Optional[str] = Query(
+        default=None,
+        max_length=AUDIT_FILTER_MAX_LENGTH,
+        pattern=AUDIT_ACTION_PATTERN,
+        description="Filter by action type (e.g. document.received)",
+    ),
+    actor_id: Optional[str] = Query(
+        default=None,
+        max_length=AUDIT_FILTER_MAX_LENGTH,
+        pattern=AUDIT_ACTOR_ID_PATTERN,
+        description="Filter by actor ID",
+    ),
     start_date: Optional[datetime] = Query(default=None, description="Filter events after this date"),
     end_date: Optional[datetime] = Query(default=None, description="Filter events before this date"),
 ) -> StreamingResponse:
     """Export audit events as a downloadable file.
 
     Supports JSON and CSV formats. All filters from the query endpoint apply.
+    At most EXPORT_MAX_EVENTS events are included; larger exports should be
+    requested as a background job via POST /export. Clients that accept
+    zstd get the file with ``Content-Encoding: zstd``.
 
     Args:
+        request: Incoming request (for Accept-Encoding)
         db: Database client
         viewer: Authenticated user with audit access
         format: Export format (json or csv)
@@ -206,83 +370,186 @@ async def export_audit_events(
             detail="User organization ID not found",
         )
 
-    logger.info(f"Exporting audit events for org {org_id} as {format}")
+    logger.info("Exporting audit events for org %s as %s", org_id, format)
 
-    service = AuditService(db)
-    events, _ = await service.query_events(
-        org_id=org_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        actor_id=actor_id,
-        start_date=start_date,
-        end_date=end_date,
-        page=1,
-        page_size=50000,  # Export limit
-    )
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    service = get_audit_service(db)
+    exported_at = datetime.utcnow()
+    timestamp = exported_at.strftime("%Y%m%d_%H%M%S")
+    compress = _accepts_zstd(request)
 
     if format == "csv":
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row
-        writer.writerow([
-            "id", "entity_type", "entity_id", "action",
-            "actor_id", "actor_email", "created_at", "metadata"
-        ])
-
-        # Data rows
-        for event in events:
-            writer.writerow([
-                event.id,
-                event.entity_type,
-                event.entity_id,
-                event.action,
-                event.actor_id,
-                event.actor_email or "",
-                event.created_at.isoformat(),
-                json.dumps(event.metadata) if event.metadata else "",
-            ])
-
-        output.seek(0)
+        # Stream CSV in small chunks as events arrive from the database,
+        # yielding to the event loop between chunks
+        async def generate_csv() -> AsyncIterator[str]:
+            yield CSV_EXPORT_HEADER
+
+            chunk: list[str] = []
+            async for row in service.stream_event_rows(
+                org_id=org_id,
+                entity_type=entity_type.value if entity_type else None,
+                entity_id=entity_id,
+                action=action,
+                actor_id=actor_id,
+                start_date=start_date,
+                end_date=end_date,
+                limit=EXPORT_MAX_EVENTS,
+            ):
+                chunk.append(format_csv_row(row))
+                if len(chunk) >= CSV_EXPORT_CHUNK_ROWS:
+                    yield "".join(chunk)
+                    chunk.clear()
+                    await asyncio.sleep(0)
+            if chunk:
+                yield "".join(chunk)
+
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _zstd_stream(generate_csv()) if compress else generate_csv(),
             media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=audit_events_{timestamp}.csv"
-            },
+            headers=_export_headers(f"audit_events_{timestamp}.csv", compress),
         )
     else:
         # Generate JSON
-        events_data = [
-            {
-                "id": event.id,
-                "org_id": event.org_id,
-                "entity_type": event.entity_type,
-                "entity_id": event.entity_id,
-                "action": event.action,
-                "actor_id": event.actor_id,
-                "actor_email": event.actor_email,
-                "metadata": event.metadata,
-                "created_at": event.created_at.isoformat(),
-            }
-            for event in events
-        ]
-
-        json_output = json.dumps({
-            "exported_at": datetime.utcnow().isoformat(),
-            "org_id": org_id,
-            "total_events": len(events_data),
-            "events": events_data,
-        }, indent=2)
+        rows, _ = await service.query_event_rows(
+            org_id=org_id,
+            entity_type=entity_type.value if entity_type else None,
+            entity_id=entity_id,
+            action=action,
+            actor_id=actor_id,
+            start_date=start_date,
+            end_date=end_date,
+            page=1,
+            page_size=EXPORT_MAX_EVENTS,
+        )
+
+        # Serializing thousands of events is CPU-bound; keep it off the event loop
+        json_output = await run_in_threadpool(serialize_json_export, org_id, rows, exported_at)
+        if compress:
+            json_output = await run_in_threadpool(
+                zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL).compress, json_output
+            )
 
         return StreamingResponse(
             iter([json_output]),
             media_type="application/json",
-            headers={
-                "Content-Disposition": f"attachment; filename=audit_events_{timestamp}.json"
-            },
+            headers=_export_headers(f"audit_events_{timestamp}.json", compress),
+        )
+
+
+@router.post(
+    "/export",
+    response_model=AuditExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start Audit Export Job",
+    description="Start a background export of audit events. Poll GET /export/{job_id} for the download URL.",
+)
+async def start_audit_export_job(
+    background_tasks: BackgroundTasks,
+    db: DBDep,
+    viewer: AuditViewerDep,
+    format: str = Query(default="csv", pattern="^(json|csv)$", description="Export format: json or csv"),
+    entity_type: Optional[AuditEntityType] = Query(default=None, description="Filter by entity type"),
+    entity_id: Optional[str] = Query(default=None, description="Filter by entity ID"),
+    action: Optional[str] = Query(
+        default=None,
+        max_length=AUDIT_FILTER_MAX_LENGTH,
+        pattern=AUDIT_ACTION_PATTERN,
+        description="Filter by action type (e.g. document.received)",
+    ),
+    actor_id: Optional[str] = Query(
+        default=None,
+        max_length=AUDIT_FILTER_MAX_LENGTH,
+        pattern=AUDIT_ACTOR_ID_PATTERN,
+        description="Filter by actor ID",
+    ),
+    start_date: Optional[datetime] = Query(default=None, description="Filter events after this date"),
+    end_date: Optional[datetime] = Query(default=None, description="Filter events before this date"),
+) -> AuditExportJobResponse:
+    """Start a background audit export.
+
+    The export is written to file storage by a background task, so it has
+    no row cap and is not bound by the request timeout.
+
+    Args:
+        background_tasks: FastAPI background task queue
+        db: Database client
+        viewer: Authenticated user with audit access
+        format: Export format (json or csv)
+        entity_type: Optional filter by entity type
+        entity_id: Optional filter by entity ID
+        action: Optional filter by action type
+        actor_id: Optional filter by actor ID
+        start_date: Optional filter for events after this date
+        end_date: Optional filter for events before this date
+
+    Returns:
+        AuditExportJobResponse for the pending job
+    """
+    org_id = viewer.get("org_id")
+    if not org_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User organization ID not found",
+        )
+
+    service = get_audit_export_service(db)
+    job = await service.create_job(
+        org_id=org_id,
+        requested_by=viewer.get("sub", "unknown"),
+        format=format,
+        filters={
+            "entity_type": entity_type.value if entity_type else None,
+            "entity_id": entity_id,
+            "action": action,
+            "actor_id": actor_id,
+            "start_date": start_date,
+            "end_date": end_date,
+        },
+    )
+    background_tasks.add_task(service.run_job, job["id"], org_id)
+
+    return AuditExportJobResponse(
+        job_id=job["id"],
+        status=job["status"],
+        format=format,
+        created_at=job["created_at"],
+    )
+
+
+@router.get(
+    "/export/{job_id}",
+    response_model=AuditExportJobResponse,
+    summary="Get Audit Export Job",
+    description="Get the status of a background audit export, including a pre-signed download URL once complete.",
+)
+async def get_audit_export_job(
+    job_id: str,
+    db: DBDep,
+    viewer: AuditViewerDep,
+) -> AuditExportJobResponse:
+    """Get the status of a background audit export.
+
+    Args:
+        job_id: ID of the export job
+        db: Database client
+        viewer: Authenticated user with audit access
+
+    Returns:
+        AuditExportJobResponse with a download URL once the job has completed
+
+    Raises:
+        HTTPException: 404 if the job does not exist in the user's organization
+    """
+    org_id = viewer.get("org_id")
+    if not org_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User organization ID not found",
+        )
+
+    try:
+        return await get_audit_export_service(db).get_job(job_id, org_id)
+    except NotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export job {job_id} not found",
         )
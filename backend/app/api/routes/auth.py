@@ -23,7 +23,7 @@ from app.schemas.auth import (
     TokenResponse,
     TokenVerifyRequest,
 )
-from app.services.auth import AuthService
+from app.services.auth import get_auth_service
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ async def request_magic_link(
     Returns:
         MagicLinkResponse with status message
     """
-    service = AuthService(db)
+    service = get_auth_service(db)
     return await service.request_magic_link(data)
 
 
@@ -87,7 +87,7 @@ async def verify_magic_link(
         HTTPException: 401 if token is invalid or expired
     """
     try:
-        service = AuthService(db)
+        service = get_auth_service(db)
         return await service.verify_magic_link(data)
     except AuthenticationError as e:
         logger.warning(f"Magic link verification failed: {e}")
@@ -121,7 +121,7 @@ async def refresh_token(
         HTTPException: 401 if refresh token is invalid
     """
     try:
-        service = AuthService(db)
+        service = get_auth_service(db)
         return await service.refresh_access_token(data.refresh_token)
     except AuthenticationError as e:
         logger.warning(f"Token refresh failed: {e}")
@@ -158,7 +158,7 @@ async def get_current_user(
         HTTPException: 404 if user not found
     """
     try:
-        service = AuthService(db)
+        service = get_auth_service(db)
         return await service.get_current_user(current_user["id"])
     except NotFoundError as e:
         raise HTTPException(
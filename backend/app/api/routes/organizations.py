@@ -15,7 +15,7 @@ from app.schemas.organizations import (
     OrganizationCreate,
     OrganizationResponse,
 )
-from app.services.organization import OrganizationService
+from app.services.organization import get_organization_service
 from app.core.exceptions import ConflictError, NotFoundError
 
 logger = logging.getLogger(__name__)
@@ -54,7 +54,7 @@ async def create_organization(
         HTTPException: 409 if slug already exists.
     """
     try:
-        service = OrganizationService(db)
+        service = get_organization_service(db)
         org = await service.create_organization(
             data=data,
             actor_id=current_user.get("sub", "system"),
@@ -96,7 +96,7 @@ async def get_organization(
         HTTPException: 404 if organization not found.
     """
     try:
-        service = OrganizationService(db)
+        service = get_organization_service(db)
         return await service.get_organization_by_id(org_id)
 
     except NotFoundError as e:
@@ -131,7 +131,7 @@ async def get_organization_by_slug(
         HTTPException: 404 if organization not found.
     """
     try:
-        service = OrganizationService(db)
+        service = get_organization_service(db)
         return await service.get_organization_by_slug(slug)
 
     except NotFoundError as e:
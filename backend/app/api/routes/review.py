@@ -6,11 +6,15 @@ This module provides endpoints for the document review workflow:
 - POST /documents/{id}/reject - Reject a document
 """
 
+import asyncio
+import base64
+import binascii
 import logging
 from datetime import datetime
-from typing import Annotated, Optional
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 
 from app.api.deps import (
     ActiveUserDep,
@@ -21,6 +25,7 @@ from app.api.deps import (
 from app.core.events import EventType, audit_logger
 from app.core.exceptions import AuthorizationError, NotFoundError
 from app.db.zerodb_client import ZeroDBClient
+from app.models.enums import DocumentStatus, can_transition
 from app.schemas.review import (
     ApproveRequest,
     RejectRequest,
@@ -28,17 +33,43 @@ from app.schemas.review import (
     ReviewQueueResponse,
     ReviewResponse,
 )
+from app.services.notifications import notification_buffer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Review Workflow"])
 
-# Roles allowed to perform review actions
-HR_REVIEW_ROLES = ["hr_manager", "hr_admin", "HR Manager", "HR Admin"]
+# Roles allowed to perform review actions (matched case-insensitively, so
+# "HR Manager"/"HR Admin" display names also pass)
+HR_REVIEW_ROLES = frozenset({"hr_manager", "hr_admin"})
+
+# Document statuses from which a review decision can be made: the
+# workflow's pending_review plus the intake statuses that predate it, which
+# are treated as pending_review for transition checks
+REVIEWABLE_STATUSES = (
+    DocumentStatus.PENDING_REVIEW.value,
+    "needs_review",
+    "pending",
+    "submitted",
+)
+
+# Review queue sort order; (submitted_at, id) is also the keyset cursor
+REVIEW_QUEUE_ORDER = "submitted_at DESC, id DESC"
+
+# Columns each query reads; documents carry large fields we never need here
+REVIEW_QUEUE_FIELDS = [
+    "id", "employee_name", "employee_id", "category", "submitted_at", "created_at",
+    "submission_channel", "name", "filename", "file_type", "content_type",
+]
+REVIEW_ACTION_FIELDS = ["id", "org_id", "status", "employee_id", "name", "filename"]
+EMPLOYEE_NAME_FIELDS = ["id", "first_name", "last_name", "name"]
+
+# Built once so every review route shares the same dependency object
+_hr_review_role_dep = require_role(HR_REVIEW_ROLES)
 
 
 async def get_hr_reviewer(
-    current_user: Annotated[dict, Depends(require_role(HR_REVIEW_ROLES))],
+    current_user: Annotated[dict, Depends(_hr_review_role_dep)],
 ) -> dict:
     """Dependency to ensure user has HR review permissions.
 
@@ -72,12 +103,25 @@ async def get_review_queue(
     submission_channel: Optional[str] = Query(
         default=None, description="Filter by submission channel"
     ),
+    disable_count: bool = Query(
+        default=False,
+        description="Skip the total count (for infinite scroll); has_next is still reported",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Keyset cursor from a previous response's next_cursor (page is ignored)",
+    ),
 ) -> ReviewQueueResponse:
     """Get documents pending review for the organization.
 
     This endpoint retrieves all documents with status "needs_review" that belong
-    to the authenticated user's organization. Results are paginated and can be
-    filtered by category or submission channel.
+    to the authenticated user's organization, newest submission first. Results
+    are paginated and can be filtered by category or submission channel.
+
+    Filtering, ordering and pagination all run in ZeroDB. Deep pages should
+    use the cursor instead of page, since a large offset still makes the
+    database walk every skipped row. Documents without a submitted_at come
+    after all others.
 
     Args:
         request: HTTP request object
@@ -88,6 +132,8 @@ async def get_review_queue(
         page_size: Number of items per page
         category: Optional category filter
         submission_channel: Optional submission channel filter
+        disable_count: Skip counting; total is omitted from the response
+        cursor: Keyset cursor from a previous response
 
     Returns:
         ReviewQueueResponse with paginated list of documents pending review
@@ -110,72 +156,80 @@ async def get_review_queue(
     if submission_channel:
         filters["submission_channel"] = submission_channel
 
+    position = _decode_queue_cursor(cursor) if cursor else None
+
     logger.info(
         f"Fetching review queue for org {org_id}, page {page}, "
         f"page_size {page_size}, filters {filters}"
     )
 
     try:
-        # Calculate offset for pagination
-        offset = (page - 1) * page_size
-
-        # Query documents needing review
-        documents = await db.table_query(
-            "documents",
-            filters=filters,
-            limit=page_size,
-            offset=offset,
-        )
+        # Fetch one extra row to learn whether a next page exists
+        if position is not None:
+            page_query = _fetch_queue_after(db, filters, position, page_size + 1)
+        else:
+            page_query = db.table_query(
+                "documents",
+                filters=filters,
+                limit=page_size + 1,
+                offset=(page - 1) * page_size,
+                order_by=REVIEW_QUEUE_ORDER,
+                fields=REVIEW_QUEUE_FIELDS,
+            )
 
-        # Get total count for pagination (query without limit/offset)
-        # For now, we'll make an additional query or estimate
-        # In production, this should use a count endpoint
-        all_docs = await db.table_query(
-            "documents",
-            filters=filters,
-            limit=1000,  # Max reasonable limit for counting
-            offset=0,
-        )
-        total = len(all_docs)
+        total: Optional[int]
+        if disable_count:
+            documents = await page_query
+            total = None
+        else:
+            # Fetch the page and the server-side count concurrently; a
+            # NotFoundError from either lands in the empty-queue fallback
+            documents, total = await asyncio.gather(
+                page_query,
+                db.table_count("documents", filters=filters),
+            )
+        has_next = len(documents) > page_size
+        documents = documents[:page_size]
+
+        # Look up employees whose names are not embedded, in one batched query
+        missing_ids = {
+            doc["employee_id"]
+            for doc in documents
+            if doc.get("employee_id")
+            and (not doc.get("employee_name") or doc["employee_name"] == "Unknown")
+        }
+        employee_names = await _fetch_employee_names(db, missing_ids)
 
         # Transform documents to ReviewQueueItem format
+        now = datetime.utcnow()
+        fromiso = datetime.fromisoformat
         items = []
         for doc in documents:
             # Get employee info if available
             employee_name = doc.get("employee_name", "Unknown")
             employee_id = doc.get("employee_id", "")
 
-            # If employee info is not embedded, fetch it
+            # If employee info is not embedded, use the batched lookup
             if not employee_name or employee_name == "Unknown":
-                if employee_id:
-                    try:
-                        employees = await db.table_query(
-                            "employees",
-                            filters={"id": employee_id},
-                            limit=1,
-                        )
-                        if employees:
-                            emp = employees[0]
-                            employee_name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
-                            if not employee_name:
-                                employee_name = emp.get("name", "Unknown")
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch employee {employee_id}: {e}")
-
-            # Parse submitted_at timestamp
+                employee_name = employee_names.get(employee_id, employee_name)
+
+            # Parse submitted_at timestamp (fromisoformat accepts a trailing
+            # "Z" on Python 3.11+)
             submitted_at_raw = doc.get("submitted_at") or doc.get("created_at")
-            if isinstance(submitted_at_raw, str):
+            if isinstance(submitted_at_raw, datetime):
+                submitted_at = submitted_at_raw
+            elif isinstance(submitted_at_raw, str):
                 try:
-                    submitted_at = datetime.fromisoformat(submitted_at_raw.replace("Z", "+00:00"))
+                    submitted_at = fromiso(submitted_at_raw)
                 except ValueError:
-                    submitted_at = datetime.utcnow()
-            elif isinstance(submitted_at_raw, datetime):
-                submitted_at = submitted_at_raw
+                    submitted_at = now
             else:
-                submitted_at = datetime.utcnow()
+                submitted_at = now
 
+            # Rows come from our own store; skip re-validating each item
+            # (the response model is still validated once on the way out)
             items.append(
-                ReviewQueueItem(
+                ReviewQueueItem.model_construct(
                     document_id=doc.get("id", ""),
                     employee_name=employee_name,
                     employee_id=employee_id,
@@ -187,25 +241,21 @@ async def get_review_queue(
                 )
             )
 
-        # Calculate pagination metadata
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        has_next = page < total_pages
-        has_previous = page > 1
-
         return ReviewQueueResponse(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
             has_next=has_next,
-            has_previous=has_previous,
+            has_previous=page > 1 or position is not None,
+            next_cursor=_encode_queue_cursor(documents[-1]) if has_next else None,
         )
 
     except NotFoundError:
         # Table doesn't exist yet - return empty result
         return ReviewQueueResponse(
             items=[],
-            total=0,
+            total=None if disable_count else 0,
             page=page,
             page_size=page_size,
             has_next=False,
@@ -226,6 +276,7 @@ async def approve_document(
     db: DBDep,
     reviewer: HRReviewerDep,
     request_id: RequestIdDep,
+    background_tasks: BackgroundTasks,
     body: Optional[ApproveRequest] = None,
 ) -> ReviewResponse:
     """Approve a document pending review.
@@ -239,6 +290,7 @@ async def approve_document(
         db: Database client
         reviewer: Authenticated HR reviewer
         request_id: Request tracking ID
+        background_tasks: Tasks run after the response (audit, notification)
         body: Optional approval request with notes
 
     Returns:
@@ -260,103 +312,56 @@ async def approve_document(
 
     logger.info(f"User {user_id} attempting to approve document {document_id}")
 
-    # Fetch the document
-    try:
-        documents = await db.table_query(
-            "documents",
-            filters={"id": document_id},
-            limit=1,
-        )
-    except NotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document {document_id} not found",
-        )
-
-    if not documents:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document {document_id} not found",
-        )
-
-    document = documents[0]
-
-    # Verify document belongs to the reviewer's organization
-    if document.get("org_id") != org_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Document does not belong to your organization",
-        )
-
-    # Verify document is in reviewable state
-    current_status = document.get("status")
-    if current_status not in ("needs_review", "pending", "submitted"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Document cannot be approved. Current status: {current_status}",
-        )
-
     # Update document status
     reviewed_at = datetime.utcnow()
+    reviewed_at_iso = reviewed_at.isoformat()
     notes = body.notes if body else None
 
     update_data = {
         "status": "approved",
         "reviewed_by": user_id,
         "reviewed_by_name": user_name,
-        "reviewed_at": reviewed_at.isoformat(),
+        "reviewed_at": reviewed_at_iso,
         "review_notes": notes,
-        "updated_at": reviewed_at.isoformat(),
+        "updated_at": reviewed_at_iso,
     }
 
-    try:
-        await db.table_update(
-            "documents",
-            filters={"id": document_id},
-            update=update_data,
-        )
-    except Exception as e:
-        logger.error(f"Failed to update document {document_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update document status",
-        )
+    # Check and update the document; returns the row as it was before
+    document = await _apply_review_update(db, document_id, org_id, update_data, "approved")
+    current_status = document.get("status")
 
-    # Emit audit event
-    try:
-        await audit_logger.log_event(
-            event_type=EventType.DOCUMENT_UPDATED,
-            action="document.review.approved",
-            user_id=user_id,
-            user_email=user_email,
-            resource_type="document",
-            resource_id=document_id,
-            details={
-                "previous_status": current_status,
-                "new_status": "approved",
-                "notes": notes,
-                "employee_id": document.get("employee_id"),
-            },
-            request_id=request_id,
-            ip_address=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent"),
-        )
-    except Exception as e:
-        logger.warning(f"Failed to log audit event for approval: {e}")
+    # Audit event and notification are written after the response is sent
+    background_tasks.add_task(
+        _log_review_event,
+        event_type=EventType.DOCUMENT_UPDATED,
+        action="document.review.approved",
+        org_id=org_id,
+        user_id=user_id,
+        user_email=user_email,
+        resource_type="document",
+        resource_id=document_id,
+        details={
+            "previous_status": current_status,
+            "new_status": "approved",
+            "notes": notes,
+            "employee_id": document.get("employee_id"),
+        },
+        request_id=request_id,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+    )
 
-    # Send notification to employee (async, fire-and-forget)
-    try:
-        await _send_review_notification(
-            db=db,
-            employee_id=document.get("employee_id"),
-            document_id=document_id,
-            document_name=document.get("name") or document.get("filename"),
-            action="approved",
-            reviewer_name=user_name,
-            notes=notes,
-        )
-    except Exception as e:
-        logger.warning(f"Failed to send approval notification: {e}")
+    background_tasks.add_task(
+        _send_review_notification,
+        db=db,
+        employee_id=document.get("employee_id"),
+        document_id=document_id,
+        document_name=document.get("name") or document.get("filename"),
+        action="approved",
+        reviewer_name=user_name,
+        notes=notes,
+        created_at=reviewed_at_iso,
+    )
 
     logger.info(f"Document {document_id} approved by {user_id}")
 
@@ -384,6 +389,7 @@ async def reject_document(
     db: DBDep,
     reviewer: HRReviewerDep,
     request_id: RequestIdDep,
+    background_tasks: BackgroundTasks,
 ) -> ReviewResponse:
     """Reject a document pending review.
 
@@ -398,6 +404,7 @@ async def reject_document(
         db: Database client
         reviewer: Authenticated HR reviewer
         request_id: Request tracking ID
+        background_tasks: Tasks run after the response (audit, notification)
 
     Returns:
         ReviewResponse with the rejection details
@@ -418,18 +425,111 @@ async def reject_document(
 
     logger.info(f"User {user_id} attempting to reject document {document_id}")
 
-    # Fetch the document
+    # Update document status
+    reviewed_at = datetime.utcnow()
+    reviewed_at_iso = reviewed_at.isoformat()
+
+    update_data = {
+        "status": "rejected",
+        "reviewed_by": user_id,
+        "reviewed_by_name": user_name,
+        "reviewed_at": reviewed_at_iso,
+        "rejection_reason": body.reason,
+        "review_notes": body.notes,
+        "updated_at": reviewed_at_iso,
+    }
+
+    # Check and update the document; returns the row as it was before
+    document = await _apply_review_update(db, document_id, org_id, update_data, "rejected")
+    current_status = document.get("status")
+
+    # Audit event and notification are written after the response is sent
+    background_tasks.add_task(
+        _log_review_event,
+        event_type=EventType.DOCUMENT_UPDATED,
+        action="document.review.rejected",
+        org_id=org_id,
+        user_id=user_id,
+        user_email=user_email,
+        resource_type="document",
+        resource_id=document_id,
+        details={
+            "previous_status": current_status,
+            "new_status": "rejected",
+            "rejection_reason": body.reason,
+            "notes": body.notes,
+            "employee_id": document.get("employee_id"),
+        },
+        request_id=request_id,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+    )
+
+    background_tasks.add_task(
+        _send_review_notification,
+        db=db,
+        employee_id=document.get("employee_id"),
+        document_id=document_id,
+        document_name=document.get("name") or document.get("filename"),
+        action="rejected",
+        reviewer_name=user_name,
+        notes=body.notes,
+        rejection_reason=body.reason,
+        created_at=reviewed_at_iso,
+    )
+
+    logger.info(f"Document {document_id} rejected by {user_id}: {body.reason}")
+
+    return ReviewResponse(
+        document_id=document_id,
+        status="rejected",
+        reviewed_by=user_id,
+        reviewed_by_name=user_name,
+        reviewed_at=reviewed_at,
+        notes=body.notes,
+        rejection_reason=body.reason,
+    )
+
+
+async def _apply_review_update(
+    db: ZeroDBClient,
+    document_id: str,
+    org_id: str,
+    update_data: dict,
+    action: str,
+) -> dict:
+    """Check that a document can be reviewed, then apply the decision.
+
+    The decision must be an allowed status transition (see can_transition).
+    The update repeats the organization and reviewable-status checks in its
+    filters, so a concurrent review that lands between the read and the
+    write matches no row and is reported as a conflict instead of
+    overwriting the decision already made.
+
+    Args:
+        db: Database client
+        document_id: ID of the document under review
+        org_id: Reviewer's organization ID
+        update_data: Column values to write
+        action: The review action ("approved" or "rejected"), for error messages
+
+    Returns:
+        The document row as it was before the update
+
+    Raises:
+        HTTPException: If the document is missing (404), belongs to another
+            organization (403), cannot move to the decided status (409), or
+            was reviewed concurrently (409)
+    """
     try:
         documents = await db.table_query(
             "documents",
             filters={"id": document_id},
             limit=1,
+            fields=REVIEW_ACTION_FIELDS,
         )
     except NotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Document {document_id} not found",
-        )
+        documents = []
 
     if not documents:
         raise HTTPException(
@@ -439,38 +539,30 @@ async def reject_document(
 
     document = documents[0]
 
-    # Verify document belongs to the reviewer's organization
     if document.get("org_id") != org_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Document does not belong to your organization",
         )
 
-    # Verify document is in reviewable state
     current_status = document.get("status")
-    if current_status not in ("needs_review", "pending", "submitted"):
+    source = (
+        DocumentStatus.PENDING_REVIEW if current_status in REVIEWABLE_STATUSES else current_status
+    )
+    if not can_transition(source, action):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Document cannot be rejected. Current status: {current_status}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Document cannot be {action}. Current status: {current_status}",
         )
 
-    # Update document status
-    reviewed_at = datetime.utcnow()
-
-    update_data = {
-        "status": "rejected",
-        "reviewed_by": user_id,
-        "reviewed_by_name": user_name,
-        "reviewed_at": reviewed_at.isoformat(),
-        "rejection_reason": body.reason,
-        "review_notes": body.notes,
-        "updated_at": reviewed_at.isoformat(),
-    }
-
     try:
-        await db.table_update(
+        result = await db.table_update(
             "documents",
-            filters={"id": document_id},
+            filters={
+                "id": document_id,
+                "org_id": org_id,
+                "status": {"$in": list(REVIEWABLE_STATUSES)},
+            },
             update=update_data,
         )
     except Exception as e:
@@ -480,55 +572,148 @@ async def reject_document(
             detail="Failed to update document status",
         )
 
-    # Emit audit event
-    try:
-        await audit_logger.log_event(
-            event_type=EventType.DOCUMENT_UPDATED,
-            action="document.review.rejected",
-            user_id=user_id,
-            user_email=user_email,
-            resource_type="document",
-            resource_id=document_id,
-            details={
-                "previous_status": current_status,
-                "new_status": "rejected",
-                "rejection_reason": body.reason,
-                "notes": body.notes,
-                "employee_id": document.get("employee_id"),
-            },
-            request_id=request_id,
-            ip_address=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent"),
+    updated = result.get("updated", result.get("count"))
+    if updated == 0:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Document {document_id} was reviewed by someone else",
         )
+
+    return document
+
+
+async def _log_review_event(**kwargs) -> None:
+    """Record a review audit event, logging rather than raising on failure.
+
+    Runs as a background task after the response has been sent, so there
+    is no request left to fail.
+
+    Args:
+        **kwargs: Arguments forwarded to audit_logger.log_event
+    """
+    try:
+        await audit_logger.log_event(**kwargs)
     except Exception as e:
-        logger.warning(f"Failed to log audit event for rejection: {e}")
+        logger.warning(f"Failed to log audit event {kwargs.get('action')}: {e}")
+
+
+def _encode_queue_cursor(document: Dict[str, Any]) -> str:
+    """Encode a review queue row's (submitted_at, id) position as a cursor.
+
+    submitted_at is kept exactly as stored, so the next request compares
+    against the same value rather than a reformatted timestamp.
 
-    # Send notification to employee with rejection reason
+    Args:
+        document: Last row of the page
+
+    Returns:
+        URL-safe opaque cursor string
+    """
+    position = [document.get("submitted_at"), document["id"]]
+    return base64.urlsafe_b64encode(orjson.dumps(position)).decode()
+
+
+def _decode_queue_cursor(cursor: str) -> Tuple[Optional[str], str]:
+    """Decode a cursor produced by _encode_queue_cursor.
+
+    Args:
+        cursor: Cursor from a previous response
+
+    Returns:
+        Tuple of (submitted_at as stored or None, document ID)
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
     try:
-        await _send_review_notification(
-            db=db,
-            employee_id=document.get("employee_id"),
-            document_id=document_id,
-            document_name=document.get("name") or document.get("filename"),
-            action="rejected",
-            reviewer_name=user_name,
-            notes=body.notes,
-            rejection_reason=body.reason,
+        submitted_at, document_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        submitted_at, document_id = None, None
+    if not isinstance(document_id, str) or not isinstance(submitted_at, (str, type(None))):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid review queue cursor",
         )
-    except Exception as e:
-        logger.warning(f"Failed to send rejection notification: {e}")
+    return submitted_at, document_id
 
-    logger.info(f"Document {document_id} rejected by {user_id}: {body.reason}")
 
-    return ReviewResponse(
-        document_id=document_id,
-        status="rejected",
-        reviewed_by=user_id,
-        reviewed_by_name=user_name,
-        reviewed_at=reviewed_at,
-        notes=body.notes,
-        rejection_reason=body.reason,
-    )
+async def _fetch_queue_after(
+    db: ZeroDBClient,
+    filters: dict,
+    position: Tuple[Optional[str], str],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """Fetch review queue rows that come after a cursor position.
+
+    The queue is ordered by (submitted_at DESC, id DESC) with documents
+    lacking submitted_at last. Without an OR filter, "after the cursor"
+    splits into segments that are each a plain filter: the rest of the
+    cursor's own timestamp, older timestamps, then the documents with no
+    timestamp. The segments are fetched concurrently and concatenated.
+
+    Args:
+        db: Database client
+        filters: Base queue filters
+        position: Decoded cursor (submitted_at, id)
+        limit: Maximum number of rows to return
+
+    Returns:
+        Rows in queue order
+    """
+    submitted_at, document_id = position
+    segments = []
+    if submitted_at is not None:
+        segments.append(({**filters, "submitted_at": submitted_at, "id": {"$lt": document_id}}, "id DESC"))
+        segments.append(({**filters, "submitted_at": {"$lt": submitted_at}}, REVIEW_QUEUE_ORDER))
+        segments.append(({**filters, "submitted_at": None}, "id DESC"))
+    else:
+        segments.append(({**filters, "submitted_at": None, "id": {"$lt": document_id}}, "id DESC"))
+
+    results = await asyncio.gather(*(
+        db.table_query(
+            "documents",
+            filters=segment_filters,
+            limit=limit,
+            order_by=order_by,
+            fields=REVIEW_QUEUE_FIELDS,
+        )
+        for segment_filters, order_by in segments
+    ))
+    return [row for rows in results for row in rows][:limit]
+
+
+async def _fetch_employee_names(
+    db: ZeroDBClient,
+    employee_ids: Set[str],
+) -> Dict[str, str]:
+    """Resolve display names for a set of employees with a single query.
+
+    Args:
+        db: Database client
+        employee_ids: IDs of the employees to look up
+
+    Returns:
+        Mapping of employee ID to display name (missing IDs are omitted)
+    """
+    if not employee_ids:
+        return {}
+
+    try:
+        employees = await db.table_query(
+            "employees",
+            filters={"id": {"$in": list(employee_ids)}},
+            limit=len(employee_ids),
+            fields=EMPLOYEE_NAME_FIELDS,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to fetch employees {sorted(employee_ids)}: {e}")
+        return {}
+
+    names = {}
+    for emp in employees:
+        name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
+        names[emp["id"]] = name or emp.get("name", "Unknown")
+    return names
 
 
 async def _send_review_notification(
@@ -540,6 +725,7 @@ async def _send_review_notification(
     reviewer_name: str,
     notes: Optional[str] = None,
     rejection_reason: Optional[str] = None,
+    created_at: Optional[str] = None,
 ) -> None:
     """Send a notification to an employee about a document review action.
 
@@ -555,6 +741,8 @@ async def _send_review_notification(
         reviewer_name: Name of the reviewer
         notes: Optional review notes
         rejection_reason: Reason for rejection (if rejected)
+        created_at: ISO timestamp for the notification (defaults to now);
+            review actions pass their reviewed_at
     """
     if not employee_id:
         logger.warning(f"Cannot send notification: no employee_id for document {document_id}")
@@ -585,12 +773,16 @@ async def _send_review_notification(
         "action": action,
         "reviewer_name": reviewer_name,
         "read": False,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": created_at or datetime.utcnow().isoformat(),
     }
 
     try:
-        await db.table_insert("notifications", [notification_data])
-        logger.info(f"Notification sent to employee {employee_id} for document {document_id}")
+        if notification_buffer.running:
+            # Batched with other notifications; write errors are logged by the buffer
+            await notification_buffer.enqueue(notification_data)
+        else:
+            await db.table_insert("notifications", [notification_data])
+        logger.info(f"Notification queued for employee {employee_id} for document {document_id}")
     except Exception as e:
         # Log but don't fail the request if notification fails
         logger.error(f"Failed to create notification for employee {employee_id}: {e}")
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.config import settings
+from app.config import get_settings
 from app.api.routes.audit import router as audit_router
 from app.api.routes.auth import router as auth_router
 from app.api.routes.review import router as review_router
@@ -19,7 +19,7 @@ async def v1_root():
     """V1 API root endpoint."""
     return {
         "message": "DocFlow HR API v1",
-        "version": settings.APP_VERSION,
+        "version": get_settings().APP_VERSION,
         "docs": "/docs",
     }
 
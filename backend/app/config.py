@@ -61,6 +61,34 @@ class Settings(BaseSettings):
         default=7, description="Refresh token expiration in days"
     )
 
+    # Audit event writes
+    AUDIT_BATCH_MAX_SIZE: int = Field(
+        default=500, description="Audit events written per batch insert"
+    )
+    AUDIT_BATCH_FLUSH_INTERVAL_MS: int = Field(
+        default=100, description="Maximum time an audit event waits before its batch is written"
+    )
+    AUDIT_QUEUE_MAX_SIZE: int = Field(
+        default=10_000, description="Maximum audit events waiting to be written"
+    )
+    AUDIT_BATCH_MAX_RETRIES: int = Field(
+        default=3, description="Retries of a failed batch insert before rows are written one by one"
+    )
+
+    # Notification writes
+    NOTIFICATION_BATCH_MAX_SIZE: int = Field(
+        default=200, description="Notifications written per batch insert"
+    )
+    NOTIFICATION_BATCH_FLUSH_INTERVAL_MS: int = Field(
+        default=100, description="Maximum time a notification waits before its batch is written"
+    )
+    NOTIFICATION_QUEUE_MAX_SIZE: int = Field(
+        default=10_000, description="Maximum notifications waiting to be written"
+    )
+    NOTIFICATION_QUEUE_OVERFLOW_POLICY: str = Field(
+        default="block", description="When the notification queue is full: 'block' or 'drop_oldest'"
+    )
+
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
 
@@ -70,6 +98,3 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
-
-
-settings = get_settings()
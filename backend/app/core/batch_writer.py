@@ -0,0 +1,180 @@
+"""Batched background table writes for DocFlow HR.
+
+Write-heavy side effects (audit events, notifications) are queued and
+inserted by a single background worker in multi-row batches, instead of
+one insert per request.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.db.zerodb_client import ZeroDBClient
+
+logger = logging.getLogger(__name__)
+
+# What enqueue does when the write queue is full
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+
+# Delay before the first retry of a failed batch insert; doubles each retry
+RETRY_BASE_DELAY_SECONDS = 0.1
+
+
+class BatchWriter:
+    """Queue rows for a table and insert them in batches.
+
+    A batch is flushed when it reaches max_batch_size rows or
+    flush_interval_ms after its first row was taken from the queue,
+    whichever comes first. A failed insert is retried with exponential
+    backoff; if it keeps failing, the rows are inserted one at a time so a
+    single bad row cannot take the rest of the batch with it. Enqueueing
+    before start() or after stop() raises RuntimeError.
+
+    Attributes:
+        table_name: Table the rows are inserted into.
+        allow_drop: Whether the "drop_oldest" overflow policy may be used.
+            Writers for records that must not be lost (audit events) set
+            this to False.
+    """
+
+    def __init__(self, table_name: str, allow_drop: bool = True) -> None:
+        """Initialize the writer.
+
+        Args:
+            table_name: Table the rows are inserted into.
+            allow_drop: Whether the "drop_oldest" overflow policy may be used.
+        """
+        self.table_name = table_name
+        self.allow_drop = allow_drop
+        self.max_batch_size = 500
+        self.flush_interval_ms = 100
+        self.max_retries = 3
+        self.overflow_policy = OVERFLOW_BLOCK
+        self._db: Optional[ZeroDBClient] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is accepting rows."""
+        return self._queue is not None
+
+    def start(
+        self,
+        db: ZeroDBClient,
+        max_batch_size: int = 500,
+        flush_interval_ms: int = 100,
+        max_queue_size: int = 10_000,
+        overflow_policy: str = OVERFLOW_BLOCK,
+        max_retries: int = 3,
+    ) -> None:
+        """Start the background worker.
+
+        Call from the application lifespan on startup.
+
+        Args:
+            db: ZeroDB client used for the batch inserts
+            max_batch_size: Flush once this many rows are queued
+            flush_interval_ms: Flush at most this long after a batch's first row
+            max_queue_size: Maximum number of rows waiting to be written
+            overflow_policy: "block" to wait for room when the queue is full,
+                "drop_oldest" to discard the oldest queued row instead
+            max_retries: Retries of a failed batch insert before falling back
+                to row-by-row inserts
+
+        Raises:
+            ValueError: If the overflow policy is unknown, or is "drop_oldest"
+                on a writer that does not allow dropping rows.
+        """
+        if overflow_policy not in (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        if overflow_policy == OVERFLOW_DROP_OLDEST and not self.allow_drop:
+            raise ValueError(f"{self.table_name} rows must not be dropped; use '{OVERFLOW_BLOCK}'")
+
+        self._db = db
+        self.max_batch_size = max_batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.overflow_policy = overflow_policy
+        self.max_retries = max_retries
+        self._queue = asyncio.Queue(maxsize=max_queue_size)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write out every queued row, then stop the worker.
+
+        Call from the application lifespan on shutdown.
+        """
+        if self._worker is None:
+            return
+
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._queue = None
+
+    async def enqueue(self, row: Dict[str, Any]) -> None:
+        """Queue a row for insertion, applying the overflow policy.
+
+        Args:
+            row: Row to insert
+
+        Raises:
+            RuntimeError: If the writer has not been started or was stopped.
+        """
+        if self._queue is None:
+            raise RuntimeError(f"{self.table_name} writer is not running")
+        if self.overflow_policy == OVERFLOW_DROP_OLDEST and self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            logger.warning("%s write queue full, dropped the oldest row", self.table_name)
+        await self._queue.put(row)
+
+    async def _run(self) -> None:
+        """Collect queued rows into batches and write them until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of rows, retrying before falling back to single rows.
+
+        Never raises: rows that cannot be written even on their own are
+        logged in full so they can be replayed.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._db.table_insert(self.table_name, batch)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Failed to write %s rows to %s (attempt %s): %s",
+                    len(batch), self.table_name, attempt + 1, e,
+                )
+            if attempt < self.max_retries:
+                await asyncio.sleep(RETRY_BASE_DELAY_SECONDS * 2 ** attempt)
+
+        for row in batch:
+            try:
+                await self._db.table_insert(self.table_name, [row])
+            except Exception as e:
+                logger.error("Failed to write row to %s: %s; row: %r", self.table_name, e, row)
@@ -1,5 +1,7 @@
 """Audit event logging for DocFlow HR."""
 
+import logging
+import re
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -7,6 +9,16 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
+from app.core.batch_writer import BatchWriter
+from app.models.audit_event import AUDIT_ACTION_PATTERN
+from app.models.enums import AUDIT_ENTITY_TYPE_BY_VALUE
+
+logger = logging.getLogger(__name__)
+
+AUDIT_EVENTS_TABLE = "audit_events"
+
+_AUDIT_ACTION_RE = re.compile(AUDIT_ACTION_PATTERN)
+
 
 class EventType(str, Enum):
     """Types of audit events."""
@@ -47,6 +59,7 @@ class AuditEvent(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     event_type: EventType
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    org_id: Optional[str] = None
     user_id: Optional[str] = None
     user_email: Optional[str] = None
     resource_type: Optional[str] = None
@@ -61,17 +74,20 @@ class AuditEvent(BaseModel):
 class AuditLogger:
     """Audit event logger.
 
-    This is a placeholder implementation that logs to console.
-    In production, this would write to a persistent store.
+    Events are kept in memory and, once the writer has been started, written
+    to the audit_events table in batches, so bursts of activity turn into a
+    few bulk inserts instead of one write per event.
     """
 
     def __init__(self):
         self._events: list[AuditEvent] = []
+        self.writer = BatchWriter(AUDIT_EVENTS_TABLE, allow_drop=False)
 
     async def log_event(
         self,
         event_type: EventType,
         action: str,
+        org_id: Optional[str] = None,
         user_id: Optional[str] = None,
         user_email: Optional[str] = None,
         resource_type: Optional[str] = None,
@@ -86,6 +102,7 @@ class AuditLogger:
         Args:
             event_type: Type of the event
             action: Human-readable action description
+            org_id: Organization the event belongs to (required to persist it)
             user_id: ID of the user who performed the action
             user_email: Email of the user who performed the action
             resource_type: Type of resource affected
@@ -101,6 +118,7 @@ class AuditLogger:
         event = AuditEvent(
             event_type=event_type,
             action=action,
+            org_id=org_id,
             user_id=user_id,
             user_email=user_email,
             resource_type=resource_type,
@@ -117,6 +135,15 @@ class AuditLogger:
         # Log to console in development
         print(f"AUDIT: {event.event_type} - {event.action} by {event.user_email}")
 
+        # audit_events rows are org-scoped and about one of the audited
+        # entity types; other events stay in memory
+        if self.writer.running and event.org_id:
+            row = _to_row(event)
+            if row is not None:
+                await self.writer.enqueue(row)
+            else:
+                logger.debug("Not persisting %s event on %s", event.event_type.value, event.resource_type)
+
         return event
 
     async def get_events(
@@ -153,5 +180,43 @@ class AuditLogger:
         return sorted(events, key=lambda e: e.timestamp, reverse=True)[:limit]
 
 
+def _to_row(event: AuditEvent) -> Optional[Dict[str, Any]]:
+    """Map an audit event onto an audit_events table row.
+
+    The row's entity_type must be one of the audited entity types and its
+    action a dotted action name. An action that is free text is kept in the
+    metadata as the description, and the event type stands in for it.
+
+    Returns:
+        The row, or None if the event is not about an audited entity.
+    """
+    if event.resource_type not in AUDIT_ENTITY_TYPE_BY_VALUE or not event.resource_id:
+        return None
+
+    metadata = dict(event.details or {})
+    metadata["event_type"] = event.event_type.value
+    for key in ("ip_address", "user_agent", "request_id"):
+        value = getattr(event, key)
+        if value is not None:
+            metadata[key] = value
+
+    action = event.action
+    if not _AUDIT_ACTION_RE.match(action):
+        metadata["description"] = action
+        action = event.event_type.value
+
+    return {
+        "id": event.id,
+        "org_id": event.org_id,
+        "entity_type": event.resource_type,
+        "entity_id": event.resource_id,
+        "action": action,
+        "actor_id": event.user_id or "system",
+        "actor_email": event.user_email,
+        "metadata": metadata,
+        "created_at": event.timestamp.isoformat(),
+    }
+
+
 # Global audit logger instance
 audit_logger = AuditLogger()
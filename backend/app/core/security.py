@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
-from app.config import settings
+from app.config import get_settings
 from app.core.exceptions import AuthenticationError
 
 
@@ -37,6 +37,7 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
+    settings = get_settings()
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -64,6 +65,7 @@ def create_refresh_token(
     Returns:
         Encoded JWT refresh token string
     """
+    settings = get_settings()
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -90,6 +92,7 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         AuthenticationError: If token is invalid or expired
     """
+    settings = get_settings()
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
@@ -0,0 +1,11 @@
+"""In-process cache for current-user lookups in DocFlow HR.
+
+User records change on the order of minutes, so authenticated hot paths
+can reuse a recent lookup instead of querying the database on every
+request.
+"""
+
+from app.core.ttl_cache import TTLCache
+
+# Global cache for current-user lookups, keyed by user ID
+user_cache = TTLCache()
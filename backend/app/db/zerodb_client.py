@@ -10,7 +10,7 @@ from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
-from app.config import settings, Settings
+from app.config import get_settings
 from app.core.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -23,6 +23,14 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Page size used when the server cannot sort or count and every matching
+# row has to be read
+FALLBACK_PAGE_SIZE = 1000
+
+# Most rows read to sort or count locally; larger match sets raise instead
+# of being pulled into memory
+FALLBACK_MAX_ROWS = 10_000
+
 
 class ZeroDBClient:
     """ZeroDB client for all database operations.
@@ -59,6 +67,7 @@ class ZeroDBClient:
             project_id: ZeroDB project ID. Defaults to settings.ZERODB_PROJECT_ID.
             timeout: HTTP request timeout in seconds. Defaults to settings.ZERODB_TIMEOUT.
         """
+        settings = get_settings()
         self.base_url = (base_url or settings.ZERODB_BASE_URL).rstrip("/")
         self.api_key = api_key or settings.ZERODB_API_KEY
         self.project_id = project_id or settings.ZERODB_PROJECT_ID
@@ -141,7 +150,7 @@ class ZeroDBClient:
         url = f"/projects/{self.project_id}/database{endpoint}"
 
         try:
-            logger.debug(f"ZeroDB request: {method} {url}")
+            logger.debug("ZeroDB request: %s %s", method, url)
             response = await client.request(
                 method=method,
                 url=url,
@@ -151,21 +160,21 @@ class ZeroDBClient:
             return self._handle_response(response)
 
         except httpx.TimeoutException as e:
-            logger.error(f"ZeroDB request timeout: {e}")
+            logger.error("ZeroDB request timeout: %s", e)
             raise ExternalServiceError(
                 message=f"Request to ZeroDB timed out after {self.timeout}s",
                 service_name="ZeroDB",
             )
 
         except httpx.ConnectError as e:
-            logger.error(f"ZeroDB connection error: {e}")
+            logger.error("ZeroDB connection error: %s", e)
             raise ExternalServiceError(
                 message=f"Failed to connect to ZeroDB API: {e}",
                 service_name="ZeroDB",
             )
 
         except httpx.HTTPError as e:
-            logger.error(f"ZeroDB HTTP error: {e}")
+            logger.error("ZeroDB HTTP error: %s", e)
             raise ExternalServiceError(
                 message=f"HTTP error occurred: {e}",
                 service_name="ZeroDB",
@@ -193,13 +202,13 @@ class ZeroDBClient:
 
         # Success responses
         if 200 <= status_code < 300:
-            logger.debug(f"ZeroDB response: {status_code}")
+            logger.debug("ZeroDB response: %s", status_code)
             return data
 
         # Extract error details
         error_message = data.get("error", data.get("message", "Unknown error"))
 
-        logger.warning(f"ZeroDB error response: {status_code} - {error_message}")
+        logger.warning("ZeroDB error response: %s - %s", status_code, error_message)
 
         # Map status codes to exceptions
         if status_code == 401:
@@ -279,7 +288,7 @@ class ZeroDBClient:
             result = await client.table_create("employees", schema)
             ```
         """
-        logger.info(f"Creating table: {table_name}")
+        logger.info("Creating table: %s", table_name)
         return await self._request(
             "POST",
             "/tables",
@@ -311,7 +320,7 @@ class ZeroDBClient:
             result = await client.table_insert("employees", rows)
             ```
         """
-        logger.info(f"Inserting {len(rows)} rows into table: {table_name}")
+        logger.info("Inserting %s rows into table: %s", len(rows), table_name)
         return await self._request(
             "POST",
             f"/tables/{table_name}/rows",
@@ -324,6 +333,8 @@ class ZeroDBClient:
         filters: Optional[dict[str, Any]] = None,
         limit: int = 100,
         offset: int = 0,
+        order_by: Optional[str] = None,
+        fields: Optional[list[str]] = None,
     ) -> list[dict[str, Any]]:
         """Query rows from a table with optional filters.
 
@@ -332,12 +343,20 @@ class ZeroDBClient:
             filters: Optional filter conditions (e.g., {"department": "Engineering"}).
             limit: Maximum number of rows to return (default: 100).
             offset: Number of rows to skip (default: 0).
+            order_by: Optional sort expression, one or more comma-separated
+                "column [ASC|DESC]" terms (e.g., "created_at DESC, id DESC").
+                Applied server-side, or locally if the server rejects or
+                ignores it and at most FALLBACK_MAX_ROWS rows match.
+            fields: Optional column projection; only these columns are
+                returned (default: all columns).
 
         Returns:
             List of matching row dictionaries.
 
         Raises:
             NotFoundError: If table doesn't exist.
+            DatabaseError: If the server cannot sort and too many rows match
+                to sort locally.
 
         Example:
             ```python
@@ -345,15 +364,65 @@ class ZeroDBClient:
                 "employees",
                 filters={"department": "Engineering", "status": "active"},
                 limit=50,
-                offset=0
+                offset=0,
+                order_by="created_at DESC",
+                fields=["id", "first_name", "last_name"],
             )
             ```
         """
-        logger.info(f"Querying table: {table_name} with filters: {filters}")
+        logger.info("Querying table: %s with filters: %s", table_name, filters)
+        if order_by or fields:
+            try:
+                rows = await self._query_rows(
+                    table_name, filters, limit, offset, order_by=order_by, fields=fields
+                )
+            except (ValidationError, DatabaseError) as e:
+                logger.warning(
+                    "ZeroDB rejected order_by/fields on %s, sorting locally: %s",
+                    table_name, e,
+                )
+            else:
+                if _is_ordered(rows, order_by):
+                    return _project(rows, fields)
+                logger.warning(
+                    "ZeroDB ignored order_by on %s, sorting locally", table_name
+                )
+
+        if not order_by:
+            rows = await self._query_rows(table_name, filters, limit, offset)
+            return _project(rows, fields)
+
+        # The server did not sort this query, so the whole match set has to
+        # be read before the requested page can be cut out of it. Later calls
+        # try the server again.
+        rows = await self._query_all_rows(table_name, filters)
+        return _project(_sort_rows(rows, order_by)[offset:offset + limit], fields)
+
+    async def _query_rows(
+        self,
+        table_name: str,
+        filters: Optional[dict[str, Any]],
+        limit: int,
+        offset: int,
+        order_by: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Issue a single table query request.
+
+        Args:
+            See table_query.
+
+        Returns:
+            List of row dictionaries as returned by the API.
+        """
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         body: dict[str, Any] = {}
         if filters:
             body["filters"] = filters
+        if order_by:
+            body["order_by"] = order_by
+        if fields:
+            body["fields"] = fields
 
         response = await self._request(
             "POST",
@@ -363,6 +432,93 @@ class ZeroDBClient:
         )
         return response.get("rows", response.get("data", []))
 
+    async def _query_all_rows(
+        self,
+        table_name: str,
+        filters: Optional[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Read every row matching the filters, page by page.
+
+        Used as the fallback when the server cannot sort or count.
+
+        Args:
+            table_name: Name of the table to query.
+            filters: Optional filter conditions.
+
+        Returns:
+            All matching row dictionaries in server order.
+
+        Raises:
+            DatabaseError: If more than FALLBACK_MAX_ROWS rows match.
+        """
+        rows: list[dict[str, Any]] = []
+        while True:
+            page = await self._query_rows(
+                table_name, filters, FALLBACK_PAGE_SIZE, len(rows)
+            )
+            rows.extend(page)
+            if len(rows) > FALLBACK_MAX_ROWS:
+                raise DatabaseError(
+                    message=(
+                        f"ZeroDB could not sort or count {table_name} server-side "
+                        f"and more than {FALLBACK_MAX_ROWS} rows match"
+                    )
+                )
+            if len(page) < FALLBACK_PAGE_SIZE:
+                return rows
+
+    async def table_count(
+        self,
+        table_name: str,
+        filters: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Count rows in a table matching optional filters.
+
+        The count is computed server-side, so no rows are transferred. Servers
+        without the count endpoint get a paged row scan instead, capped at
+        FALLBACK_MAX_ROWS rows.
+
+        Args:
+            table_name: Name of the table to count.
+            filters: Optional filter conditions (same syntax as table_query).
+
+        Returns:
+            Number of matching rows.
+
+        Raises:
+            NotFoundError: If table doesn't exist.
+            DatabaseError: If the count endpoint is unavailable and too many
+                rows match to count locally.
+
+        Example:
+            ```python
+            total = await client.table_count(
+                "documents",
+                filters={"org_id": "org-789", "status": "needs_review"},
+            )
+            ```
+        """
+        logger.info("Counting rows in table: %s with filters: %s", table_name, filters)
+        body: dict[str, Any] = {}
+        if filters:
+            body["filters"] = filters
+
+        try:
+            response = await self._request(
+                "POST",
+                f"/tables/{table_name}/count",
+                json=body,
+            )
+        except (NotFoundError, DatabaseError) as e:
+            # A missing table still raises NotFoundError from the query
+            # below; only a missing count endpoint falls through to it
+            logger.warning("ZeroDB count unavailable on %s: %s", table_name, e)
+        else:
+            return int(response.get("count", response.get("total", 0)))
+
+        rows = await self._query_all_rows(table_name, filters)
+        return len(rows)
+
     async def table_update(
         self,
         table_name: str,
@@ -392,7 +548,7 @@ class ZeroDBClient:
             )
             ```
         """
-        logger.info(f"Updating table: {table_name} with filters: {filters}")
+        logger.info("Updating table: %s with filters: %s", table_name, filters)
         return await self._request(
             "PATCH",
             f"/tables/{table_name}/rows",
@@ -422,7 +578,7 @@ class ZeroDBClient:
             )
             ```
         """
-        logger.info(f"Deleting from table: {table_name} with filters: {filters}")
+        logger.info("Deleting from table: %s with filters: %s", table_name, filters)
         return await self._request(
             "DELETE",
             f"/tables/{table_name}/rows",
@@ -761,6 +917,103 @@ class ZeroDBClient:
         return response.get("memories", response.get("results", []))
 
 
+# =============================================================================
+# Local Query Fallbacks
+# =============================================================================
+
+def _parse_order_by(order_by: str) -> list[tuple[str, bool]]:
+    """Split a sort expression into (column, descending) terms.
+
+    Args:
+        order_by: Expression such as "created_at DESC, id DESC".
+
+    Returns:
+        List of (column, descending) tuples in priority order.
+    """
+    terms = []
+    for term in order_by.split(","):
+        parts = term.split()
+        if parts:
+            terms.append((parts[0], len(parts) > 1 and parts[1].upper() == "DESC"))
+    return terms
+
+
+def _sort_key(column: str, descending: bool) -> Any:
+    """Build a sort key for one column that keeps null values last.
+
+    Args:
+        column: Column to sort on.
+        descending: Whether the sort is reversed.
+
+    Returns:
+        Key function for list.sort.
+    """
+    def key(row: dict[str, Any]) -> tuple[bool, Any]:
+        value = row.get(column)
+        return (value is not None if descending else value is None, value)
+
+    return key
+
+
+def _sort_rows(rows: list[dict[str, Any]], order_by: str) -> list[dict[str, Any]]:
+    """Sort rows locally by a sort expression, nulls last.
+
+    Args:
+        rows: Rows to sort in place.
+        order_by: Sort expression (see table_query).
+
+    Returns:
+        The sorted rows.
+    """
+    # Stable sorts applied from the least to the most significant term
+    for column, descending in reversed(_parse_order_by(order_by)):
+        rows.sort(key=_sort_key(column, descending), reverse=descending)
+    return rows
+
+
+def _is_ordered(rows: list[dict[str, Any]], order_by: Optional[str]) -> bool:
+    """Check that rows returned by the server honour a sort expression.
+
+    Only the leading term is checked, and only when its column came back
+    in the rows; anything that cannot be checked is taken as ordered.
+
+    Args:
+        rows: Rows as returned by the server.
+        order_by: Sort expression that was requested.
+
+    Returns:
+        False if the rows are visibly out of order.
+    """
+    if not order_by or len(rows) < 2:
+        return True
+    column, descending = _parse_order_by(order_by)[0]
+    values = [row.get(column) for row in rows]
+    if any(value is None for value in values):
+        return True
+    try:
+        pairs = zip(values, values[1:])
+        if descending:
+            return all(a >= b for a, b in pairs)
+        return all(a <= b for a, b in pairs)
+    except TypeError:
+        return True
+
+
+def _project(rows: list[dict[str, Any]], fields: Optional[list[str]]) -> list[dict[str, Any]]:
+    """Trim rows to the requested columns.
+
+    Args:
+        rows: Rows to project.
+        fields: Columns to keep, or None to keep all.
+
+    Returns:
+        Projected rows (the input rows when no projection was requested).
+    """
+    if not fields:
+        return rows
+    return [{f: row[f] for f in fields if f in row} for row in rows]
+
+
 # =============================================================================
 # Singleton and Dependency Injection
 # =============================================================================
@@ -7,9 +7,11 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.config import settings
+from app.config import get_settings
+from app.core.events import audit_logger
 from app.core.exceptions import DocFlowException
-from app.db.zerodb_client import close_zerodb_client
+from app.db.zerodb_client import close_zerodb_client, get_zerodb_client
+from app.services.notifications import notification_buffer
 from app.middleware.logging import RequestLoggingMiddleware
 from app.schemas.common import ErrorResponse, HealthResponse
 from app.api.v1.router import router as v1_router
@@ -25,16 +27,34 @@ async def lifespan(app: FastAPI):
     print(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     print(f"Environment: {settings.ENVIRONMENT}")
     print(f"Debug mode: {settings.DEBUG}")
+    audit_logger.writer.start(
+        get_zerodb_client(),
+        max_batch_size=settings.AUDIT_BATCH_MAX_SIZE,
+        flush_interval_ms=settings.AUDIT_BATCH_FLUSH_INTERVAL_MS,
+        max_queue_size=settings.AUDIT_QUEUE_MAX_SIZE,
+        max_retries=settings.AUDIT_BATCH_MAX_RETRIES,
+    )
+    notification_buffer.start(
+        get_zerodb_client(),
+        max_batch_size=settings.NOTIFICATION_BATCH_MAX_SIZE,
+        flush_interval_ms=settings.NOTIFICATION_BATCH_FLUSH_INTERVAL_MS,
+        max_queue_size=settings.NOTIFICATION_QUEUE_MAX_SIZE,
+        overflow_policy=settings.NOTIFICATION_QUEUE_OVERFLOW_POLICY,
+    )
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    await audit_logger.writer.stop()
+    await notification_buffer.stop()
     await close_zerodb_client()
     print("Shutdown complete")
 
 
-# Create FastAPI application
+# Create FastAPI application (the entry point needs settings at import time;
+# library modules call get_settings() when they need a value)
+settings = get_settings()
 app = FastAPI(
     title=settings.APP_NAME,
     description="HR Document Management System API",
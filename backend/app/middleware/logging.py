@@ -7,7 +7,7 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.config import settings
+from app.config import get_settings
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -39,7 +39,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         user_agent = request.headers.get("user-agent", "unknown")
 
         # Log request start
-        if settings.DEBUG:
+        if get_settings().DEBUG:
             print(
                 f"[{request_id}] START {method} {url} "
                 f"from {client_host}"
@@ -70,7 +70,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         status_code = response.status_code
         log_level = "INFO" if status_code < 400 else "WARN" if status_code < 500 else "ERROR"
 
-        if settings.DEBUG or status_code >= 400:
+        if get_settings().DEBUG or status_code >= 400:
             print(
                 f"[{request_id}] {log_level} {method} {url} "
                 f"status={status_code} duration={duration:.3f}s "
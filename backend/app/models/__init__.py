@@ -13,7 +13,17 @@ from app.models.enums import (
     LegalHoldScopeType,
     RoleType,
     USState,
+    USStateCode,
+    US_STATE_CODES,
     DEFAULT_ORG_ROLES,
+    USER_STATUS_BY_VALUE,
+    DOCUMENT_STATUS_BY_VALUE,
+    SUBMISSION_STATUS_BY_VALUE,
+    AUDIT_ACTION_BY_VALUE,
+    AUDIT_ENTITY_TYPE_BY_VALUE,
+    ROLE_TYPE_BY_VALUE,
+    STATUS_TRANSITIONS,
+    can_transition,
 )
 from app.models.base import (
     ZeroDBBaseModel,
@@ -22,7 +32,12 @@ from app.models.base import (
     SoftDeleteMixin,
     AuditMetadataMixin,
     ZeroDBTableSchema,
+    JSONDict,
+    EmailAddress,
+    EMAIL_PATTERN,
 )
+from app.models.audit_event import AuditEventRecord
+from app.models.audit_export_job import AuditExportJob
 from app.models.organization import Organization, OrganizationSettings
 from app.models.user import Permission, Role, User
 
@@ -40,7 +55,17 @@ __all__ = [
     "LegalHoldScopeType",
     "RoleType",
     "USState",
+    "USStateCode",
+    "US_STATE_CODES",
     "DEFAULT_ORG_ROLES",
+    "USER_STATUS_BY_VALUE",
+    "DOCUMENT_STATUS_BY_VALUE",
+    "SUBMISSION_STATUS_BY_VALUE",
+    "AUDIT_ACTION_BY_VALUE",
+    "AUDIT_ENTITY_TYPE_BY_VALUE",
+    "ROLE_TYPE_BY_VALUE",
+    "STATUS_TRANSITIONS",
+    "can_transition",
     # Base classes
     "ZeroDBBaseModel",
     "TimestampMixin",
@@ -48,7 +73,12 @@ __all__ = [
     "SoftDeleteMixin",
     "AuditMetadataMixin",
     "ZeroDBTableSchema",
+    "JSONDict",
+    "EmailAddress",
+    "EMAIL_PATTERN",
     # Models
+    "AuditEventRecord",
+    "AuditExportJob",
     "Organization",
     "OrganizationSettings",
     "Permission",
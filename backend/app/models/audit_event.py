@@ -0,0 +1,129 @@
+"""Audit event model for the append-only audit trail.
+
+Audit events are immutable: they are inserted once and never updated or
+deleted. Every read is scoped to an organization and ordered by creation
+time, so the indexes below all lead with org_id and end with created_at.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import Field
+
+from app.models.base import ZeroDBBaseModel, OrgScopedMixin, ZeroDBTableSchema, utcnow
+
+# Actions are dotted lowercase names (e.g. "document.review.approved")
+AUDIT_ACTION_PATTERN = r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)+$"
+
+
+class AuditEventRecord(ZeroDBBaseModel, OrgScopedMixin):
+    """Immutable audit event record.
+
+    COMPLIANCE NOTE: Audit events must never be modified or deleted.
+    They form the evidentiary record for every data mutation.
+    """
+
+    id: UUID = Field(
+        description="Unique audit event identifier",
+    )
+
+    entity_type: str = Field(
+        description="Type of entity affected (e.g., 'document', 'employee')",
+    )
+
+    entity_id: str = Field(
+        description="Identifier of the affected entity",
+    )
+
+    action: str = Field(
+        description="Action performed (e.g., 'document.review.approved')",
+    )
+
+    actor_id: str = Field(
+        description="ID of the user or system performing the action",
+    )
+
+    actor_email: Optional[str] = Field(
+        default=None,
+        description="Email of the actor at the time of the event",
+    )
+
+    metadata: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Additional event context as JSON",
+    )
+
+    created_at: datetime = Field(
+        default_factory=utcnow,
+        description="Timestamp when the event was recorded (UTC)",
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def table_schema() -> ZeroDBTableSchema:
+        """Get ZeroDB table schema for audit events.
+
+        Returns:
+            Table schema definition for ZeroDB (built once and shared;
+            do not mutate)
+        """
+        return ZeroDBTableSchema(
+            columns=[
+                ZeroDBTableSchema.column_def(
+                    "id", "uuid", primary_key=True, default="gen_random_uuid()"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "org_id", "uuid", nullable=False, references="organizations(id)"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "entity_type", "text", nullable=False
+                ),
+                ZeroDBTableSchema.column_def(
+                    "entity_id", "text", nullable=False
+                ),
+                ZeroDBTableSchema.column_def(
+                    "action", "text", nullable=False
+                ),
+                ZeroDBTableSchema.column_def(
+                    "actor_id", "text", nullable=False
+                ),
+                ZeroDBTableSchema.column_def(
+                    "actor_email", "text", nullable=True
+                ),
+                ZeroDBTableSchema.column_def(
+                    "metadata", "jsonb", nullable=True
+                ),
+                ZeroDBTableSchema.column_def(
+                    "created_at", "timestamp", nullable=False, default="now()"
+                ),
+            ],
+            indexes=[
+                # Every audit query filters by org and pages by recency
+                ZeroDBTableSchema.index_def(
+                    "idx_audit_events_org_created", ["org_id", "created_at DESC"]
+                ),
+                # Entity trail lookups (get_entity_audit_trail)
+                ZeroDBTableSchema.index_def(
+                    "idx_audit_events_org_entity",
+                    ["org_id", "entity_type", "entity_id", "created_at DESC"],
+                ),
+                # "What did this user do" lookups
+                ZeroDBTableSchema.index_def(
+                    "idx_audit_events_org_actor",
+                    ["org_id", "actor_id", "created_at DESC"],
+                ),
+                # Action-filtered queries (AuditEventFilter.action)
+                ZeroDBTableSchema.index_def(
+                    "idx_audit_events_org_action",
+                    ["org_id", "action", "created_at DESC"],
+                ),
+                # Legal hold activity is reviewed far more often than it is written
+                ZeroDBTableSchema.index_def(
+                    "idx_audit_events_org_legal_hold",
+                    ["org_id", "created_at DESC"],
+                    where="action IN ('legal_hold.created', 'legal_hold.released')",
+                ),
+            ],
+        )
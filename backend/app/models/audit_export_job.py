@@ -0,0 +1,118 @@
+"""Audit export job model for background audit log exports.
+
+Large exports are produced by a background job rather than inside the
+request. Each job row tracks the requested filters, its progress and the
+stored file it produced.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import Field
+
+from app.models.base import ZeroDBBaseModel, OrgScopedMixin, ZeroDBTableSchema, utcnow
+
+
+class AuditExportJob(ZeroDBBaseModel, OrgScopedMixin):
+    """Background audit export job."""
+
+    id: UUID = Field(
+        description="Unique export job identifier",
+    )
+
+    requested_by: str = Field(
+        description="ID of the user who requested the export",
+    )
+
+    format: str = Field(
+        description="Export file format (json or csv)",
+    )
+
+    filters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Audit query filters the export was requested with",
+    )
+
+    status: str = Field(
+        default="pending",
+        description="Job status (pending, running, completed, failed)",
+    )
+
+    file_id: Optional[str] = Field(
+        default=None,
+        description="Stored export file ID once the job has completed",
+    )
+
+    total_events: Optional[int] = Field(
+        default=None,
+        description="Number of events written to the export",
+    )
+
+    error: Optional[str] = Field(
+        default=None,
+        description="Failure reason if the job failed",
+    )
+
+    created_at: datetime = Field(
+        default_factory=utcnow,
+        description="Timestamp when the job was requested (UTC)",
+    )
+
+    completed_at: Optional[datetime] = Field(
+        default=None,
+        description="Timestamp when the job finished (UTC)",
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def table_schema() -> ZeroDBTableSchema:
+        """Get ZeroDB table schema for audit export jobs.
+
+        Returns:
+            Table schema definition for ZeroDB (built once and shared;
+            do not mutate)
+        """
+        return ZeroDBTableSchema(
+            columns=[
+                ZeroDBTableSchema.column_def(
+                    "id", "uuid", primary_key=True, default="gen_random_uuid()"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "org_id", "uuid", nullable=False, references="organizations(id)"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "requested_by", "text", nullable=False
+                ),
+                ZeroDBTableSchema.column_def(
+                    "format", "text", nullable=False
+                ),
+                ZeroDBTableSchema.column_def(
+                    "filters", "jsonb", nullable=False, default="'{}'::jsonb"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "status", "text", nullable=False, default="'pending'"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "file_id", "text", nullable=True
+                ),
+                ZeroDBTableSchema.column_def(
+                    "total_events", "integer", nullable=True
+                ),
+                ZeroDBTableSchema.column_def(
+                    "error", "text", nullable=True
+                ),
+                ZeroDBTableSchema.column_def(
+                    "created_at", "timestamp", nullable=False, default="now()"
+                ),
+                ZeroDBTableSchema.column_def(
+                    "completed_at", "timestamp", nullable=True
+                ),
+            ],
+            indexes=[
+                ZeroDBTableSchema.index_def(
+                    "idx_audit_export_jobs_org_created", ["org_id", "created_at DESC"]
+                ),
+            ],
+        )
@@ -4,11 +4,75 @@ This module provides base Pydantic models with common fields used across
 all entity types. These models define the structure for ZeroDB table schemas.
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Annotated, Any, Dict, Mapping, Optional, Self
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainValidator,
+    StringConstraints,
+    WithJsonSchema,
+    model_validator,
+)
+
+
+def utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime.
+
+    Same value as the deprecated datetime.utcnow(); timestamps are stored
+    as naive UTC throughout.
+
+    Returns:
+        Current UTC time without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _as_json_dict(value: Any) -> Dict[str, Any]:
+    """Accept a dict as-is, without walking its keys and values."""
+    if isinstance(value, dict):
+        return value
+    try:
+        return dict(value)
+    except (TypeError, ValueError):
+        raise ValueError("Input should be a valid dictionary")
+
+
+# Free-form jsonb object. A plain Dict[str, Any] makes pydantic-core check
+# every key of the blob on each validation; jsonb objects always have string
+# keys, so the dict is passed through unchanged.
+JSONDict = Annotated[
+    Dict[str, Any],
+    PlainValidator(_as_json_dict),
+    WithJsonSchema({"type": "object"}),
+]
+
+# Syntax-only email check (local@domain.tld), run by pydantic-core's regex
+# engine; unlike EmailStr it needs no email-validator call per value. Any
+# non-space characters are accepted, so internationalized addresses pass.
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
+def _lowercase_email_domain(value: str) -> str:
+    """Lowercase the domain of an email address, keeping the local part.
+
+    Domains are case-insensitive, but the local part may legally be
+    case-sensitive, so only the domain is canonicalized.
+    """
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Email address stored trimmed, with a lowercase domain
+EmailAddress = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, pattern=EMAIL_PATTERN),
+    AfterValidator(_lowercase_email_domain),
+]
 
 
 class ZeroDBBaseModel(BaseModel):
@@ -18,14 +82,25 @@ class ZeroDBBaseModel(BaseModel):
     All models inherit timestamp tracking and Pydantic v2 configuration.
     """
 
-    class Config:
-        """Pydantic model configuration."""
-        from_attributes = True
-        populate_by_name = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
+    # datetime and UUID use pydantic-core's native ISO/str serializers
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    @classmethod
+    def from_db(cls, row: Mapping[str, Any]) -> Self:
+        """Build a model from a trusted database row without validation.
+
+        Uses model_construct: values are stored as given and missing fields
+        take their defaults. Only use it on read paths whose rows already
+        hold the field types (e.g. after decoding timestamps); anything
+        user-supplied must go through normal validation.
+
+        Args:
+            row: Column values keyed by field name
+
+        Returns:
+            Model instance
+        """
+        return cls.model_construct(**row)
 
 
 class TimestampMixin(BaseModel):
@@ -36,14 +111,33 @@ class TimestampMixin(BaseModel):
     """
 
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp when record was created (UTC)",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Timestamp when record was last updated (UTC)",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def stamp_timestamps(cls, data: Any) -> Any:
+        """Fill missing timestamps from a single clock read.
+
+        A new record gets identical created_at and updated_at values, and
+        the clock is read once instead of once per field.
+        """
+        if isinstance(data, dict) and (
+            data.get("created_at") is None or data.get("updated_at") is None
+        ):
+            now = utcnow()
+            data = {**data}
+            if data.get("created_at") is None:
+                data["created_at"] = now
+            if data.get("updated_at") is None:
+                data["updated_at"] = now
+        return data
+
 
 class OrgScopedMixin(BaseModel):
     """Mixin for multi-tenant organization scoping.
@@ -71,14 +165,10 @@ class SoftDeleteMixin(BaseModel):
     Physical deletion (hard delete) should only occur per retention policy.
     """
 
-    deleted_at: Optional[datetime] = Field(
-        default=None,
-        description="Timestamp when record was soft-deleted (NULL if active)",
-    )
-    deleted_by: Optional[UUID] = Field(
-        default=None,
-        description="User ID who performed soft delete",
-    )
+    # Timestamp when record was soft-deleted (NULL if active)
+    deleted_at: Optional[datetime] = None
+    # User ID who performed soft delete
+    deleted_by: Optional[UUID] = None
 
 
 class AuditMetadataMixin(BaseModel):
@@ -147,11 +237,10 @@ class ZeroDBTableSchema(BaseModel):
         col = {
             "name": name,
             "type": col_type,
-            "nullable": nullable,
+            "nullable": nullable and not primary_key,  # PKs cannot be null
         }
         if primary_key:
             col["primary_key"] = True
-            col["nullable"] = False  # PKs cannot be null
         if unique:
             col["unique"] = True
         if default is not None:
@@ -167,6 +256,8 @@ class ZeroDBTableSchema(BaseModel):
         *,
         unique: bool = False,
         where: Optional[str] = None,
+        using: Optional[str] = None,
+        ops: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create an index definition.
 
@@ -175,6 +266,8 @@ class ZeroDBTableSchema(BaseModel):
             columns: List of column names to index
             unique: Whether this is a unique index
             where: Optional WHERE clause for partial index
+            using: Optional index method (e.g., "gin"); btree if omitted
+            ops: Optional operator class for the columns (e.g., "jsonb_path_ops")
 
         Returns:
             Index definition dictionary
@@ -187,4 +280,8 @@ class ZeroDBTableSchema(BaseModel):
             idx["unique"] = True
         if where:
             idx["where"] = where
+        if using:
+            idx["using"] = using
+        if ops:
+            idx["ops"] = ops
         return idx
@@ -5,10 +5,11 @@ consistency and type safety. Enums are used for status fields, categories,
 and other controlled vocabularies.
 """
 
-from enum import Enum
+from enum import Enum, StrEnum
+from typing import Literal, get_args
 
 
-class UserStatus(str, Enum):
+class UserStatus(StrEnum):
     """User account status.
 
     Controls user access to the system:
@@ -126,7 +127,7 @@ class SubmissionStatus(str, Enum):
     DUPLICATE = "duplicate"
 
 
-class AuditAction(str, Enum):
+class AuditAction(StrEnum):
     """Audit event action types.
 
     Standardized action vocabulary for audit trail.
@@ -144,7 +145,7 @@ class AuditAction(str, Enum):
     PURGED = "purged"
 
 
-class AuditEntityType(str, Enum):
+class AuditEntityType(StrEnum):
     """Entity types that can be audited.
 
     Corresponds to main tables in the system.
@@ -194,7 +195,7 @@ class LegalHoldScopeType(str, Enum):
     CUSTOM = "custom"
 
 
-class RoleType(str, Enum):
+class RoleType(StrEnum):
     """Standard RBAC role types.
 
     Default roles seeded for each organization:
@@ -291,3 +292,93 @@ class USState(str, Enum):
     WI = "WI"
     WY = "WY"
     DC = "DC"  # District of Columbia
+
+
+# Value -> member maps for decoding database values. Indexing these skips
+# the EnumMeta.__call__ dispatch of e.g. UserStatus(value); an unknown value
+# raises KeyError instead of ValueError. They are the enums' own maps, so
+# treat them as read-only.
+USER_STATUS_BY_VALUE = UserStatus._value2member_map_
+DOCUMENT_STATUS_BY_VALUE = DocumentStatus._value2member_map_
+SUBMISSION_STATUS_BY_VALUE = SubmissionStatus._value2member_map_
+AUDIT_ACTION_BY_VALUE = AuditAction._value2member_map_
+AUDIT_ENTITY_TYPE_BY_VALUE = AuditEntityType._value2member_map_
+ROLE_TYPE_BY_VALUE = RoleType._value2member_map_
+
+
+# US state codes as a Literal for model fields. pydantic-core validates a
+# Literal of strings with a plain lookup, which is cheaper than coercing into
+# USState; the enum is kept for existing callers.
+USStateCode = Literal[
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+    "DC",
+]
+
+# For membership checks outside Pydantic: `code in US_STATE_CODES`
+US_STATE_CODES = frozenset(get_args(USStateCode))
+
+
+# Allowed workflow status transitions, encoded as bitmasks. Each status of
+# the three workflow enums gets its own bit (their values do not overlap),
+# and each source status maps to the OR of the bits it may move to, so a
+# check is a dict lookup plus one integer AND. Keys are str enums, so raw
+# database values look up the same entries.
+_STATUS_BITS: dict[str, int] = {
+    status: 1 << i
+    for i, status in enumerate(
+        [*DocumentStatus, *SubmissionStatus, *LegalHoldStatus]
+    )
+}
+
+_ALLOWED_TRANSITIONS: dict[str, tuple[str, ...]] = {
+    DocumentStatus.PENDING_REVIEW: (
+        DocumentStatus.APPROVED,
+        DocumentStatus.REJECTED,
+        DocumentStatus.EXPIRED,
+    ),
+    DocumentStatus.APPROVED: (DocumentStatus.EXPIRED,),
+    SubmissionStatus.RECEIVED: (
+        SubmissionStatus.PROCESSING,
+        SubmissionStatus.FAILED,
+        SubmissionStatus.DUPLICATE,
+    ),
+    SubmissionStatus.PROCESSING: (
+        SubmissionStatus.MATCHED,
+        SubmissionStatus.FAILED,
+        SubmissionStatus.DUPLICATE,
+    ),
+    SubmissionStatus.MATCHED: (
+        SubmissionStatus.DOCUMENT_CREATED,
+        SubmissionStatus.FAILED,
+    ),
+    # Failed submissions may be retried
+    SubmissionStatus.FAILED: (SubmissionStatus.PROCESSING,),
+    LegalHoldStatus.PENDING: (LegalHoldStatus.ACTIVE, LegalHoldStatus.RELEASED),
+    LegalHoldStatus.ACTIVE: (LegalHoldStatus.RELEASED,),
+}
+
+STATUS_TRANSITIONS: dict[str, int] = {
+    source: sum(_STATUS_BITS[target] for target in targets)
+    for source, targets in _ALLOWED_TRANSITIONS.items()
+}
+
+
+def can_transition(source: str, target: str) -> bool:
+    """Check whether a document, submission or legal hold may change status.
+
+    Statuses not listed as a source (e.g. REJECTED, DOCUMENT_CREATED,
+    RELEASED) are terminal. Statuses of different enums never transition
+    into each other.
+
+    Args:
+        source: Current status (enum member or raw value)
+        target: Requested status (enum member or raw value)
+
+    Returns:
+        True if the transition is allowed
+    """
+    return bool(STATUS_TRANSITIONS.get(source, 0) & _STATUS_BITS.get(target, 0))
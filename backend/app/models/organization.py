@@ -4,13 +4,48 @@ Organizations represent tenant companies using DocFlow HR.
 All other entities are scoped to an organization for data isolation.
 """
 
+import re
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import Field, StringConstraints
 
-from app.models.base import ZeroDBBaseModel, TimestampMixin, ZeroDBTableSchema
+from app.models.base import (
+    EMAIL_PATTERN,
+    JSONDict,
+    ZeroDBBaseModel,
+    TimestampMixin,
+    ZeroDBTableSchema,
+)
+
+# Lowercase alphanumeric words joined by single hyphens: no leading,
+# trailing or consecutive hyphens. Checked by pydantic-core in one pass.
+SLUG_PATTERN = r"^[a-z0-9]+(?:-[a-z0-9]+)*$"
+
+# Runs of characters that are not allowed in a slug
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(value: str) -> str:
+    """Canonicalize text into slug form.
+
+    Each run of spaces/special chars (hyphens included) becomes one hyphen,
+    so no consecutive hyphens are left; then the ends are trimmed. The
+    result matches SLUG_PATTERN unless it is empty.
+
+    Args:
+        value: Organization name or user-supplied slug.
+
+    Returns:
+        A lowercase, URL-safe slug.
+    """
+    return _SLUG_SEPARATORS.sub("-", value.lower()).strip("-")
+
+
+# Notification addresses are stored as entered
+ContactEmail = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN)]
 
 
 class OrganizationSettings(ZeroDBBaseModel):
@@ -51,10 +86,8 @@ class OrganizationSettings(ZeroDBBaseModel):
         default=True,
         description="Send notification to HR when new document submitted",
     )
-    notification_email: Optional[str] = Field(
-        default=None,
-        description="Email address for HR notifications",
-    )
+    # Email address for HR notifications
+    notification_email: Optional[ContactEmail] = None
 
     # Employee self-service
     employee_portal_enabled: bool = Field(
@@ -71,7 +104,7 @@ class OrganizationSettings(ZeroDBBaseModel):
     )
 
     # Custom fields for organization-specific needs
-    custom_fields: Dict[str, Any] = Field(
+    custom_fields: JSONDict = Field(
         default_factory=dict,
         description="Custom organization configuration as JSON",
     )
@@ -101,7 +134,7 @@ class Organization(ZeroDBBaseModel, TimestampMixin):
         min_length=2,
         max_length=100,
         description="URL-safe organization identifier (e.g., 'acme-corp')",
-        pattern=r"^[a-z0-9-]+$",
+        pattern=SLUG_PATTERN,
     )
 
     settings: OrganizationSettings = Field(
@@ -120,28 +153,17 @@ class Organization(ZeroDBBaseModel, TimestampMixin):
         description="Whether organization account is active",
     )
 
-    # Contact information
-    primary_contact_email: Optional[str] = Field(
-        default=None,
-        description="Primary contact email for organization",
-    )
-
-    @field_validator("slug")
-    @classmethod
-    def validate_slug(cls, v: str) -> str:
-        """Validate slug is lowercase and URL-safe."""
-        if not v.islower():
-            raise ValueError("Slug must be lowercase")
-        if "--" in v or v.startswith("-") or v.endswith("-"):
-            raise ValueError("Slug cannot start/end with hyphen or contain consecutive hyphens")
-        return v
+    # Contact information: primary contact email for organization
+    primary_contact_email: Optional[ContactEmail] = None
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def table_schema() -> ZeroDBTableSchema:
         """Get ZeroDB table schema for organizations.
 
         Returns:
-            Table schema definition for ZeroDB
+            Table schema definition for ZeroDB (built once and shared;
+            do not mutate)
         """
         return ZeroDBTableSchema(
             columns=[
@@ -5,12 +5,13 @@ Default roles are seeded automatically when an organization is created.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Optional
 from uuid import UUID
 
 from pydantic import Field
 
-from app.models.base import ZeroDBBaseModel, TimestampMixin, ZeroDBTableSchema
+from app.models.base import JSONDict, ZeroDBBaseModel, TimestampMixin, ZeroDBTableSchema
 from app.models.enums import RoleType
 
 
@@ -48,7 +49,7 @@ class Role(ZeroDBBaseModel, TimestampMixin):
         description="Role description explaining permissions",
     )
 
-    permissions: Dict[str, Any] = Field(
+    permissions: JSONDict = Field(
         default_factory=dict,
         description="Role permissions as JSON (resource -> actions)",
     )
@@ -64,11 +65,13 @@ class Role(ZeroDBBaseModel, TimestampMixin):
     )
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def table_schema() -> ZeroDBTableSchema:
         """Get ZeroDB table schema for roles.
 
         Returns:
-            Table schema definition for ZeroDB
+            Table schema definition for ZeroDB (built once and shared;
+            do not mutate)
         """
         return ZeroDBTableSchema(
             columns=[
@@ -110,6 +113,10 @@ class Role(ZeroDBBaseModel, TimestampMixin):
                 ZeroDBTableSchema.index_def(
                     "idx_roles_org_type", ["org_id", "role_type"], unique=True
                 ),
+                # jsonb_path_ops: smaller than the default opclass, serves @> containment
+                ZeroDBTableSchema.index_def(
+                    "idx_roles_permissions_gin", ["permissions"], using="gin", ops="jsonb_path_ops"
+                ),
             ],
         )
 
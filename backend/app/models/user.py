@@ -6,12 +6,14 @@ defines their permissions.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import EmailStr, Field, field_validator
 
 from app.models.base import (
+    JSONDict,
     ZeroDBBaseModel,
     TimestampMixin,
     OrgScopedMixin,
@@ -19,7 +21,6 @@ from app.models.base import (
 )
 from app.models.enums import UserStatus, RoleType
 
-
 class Permission(ZeroDBBaseModel):
     """Permission definition for granular access control.
 
@@ -90,19 +91,18 @@ class Role(ZeroDBBaseModel, OrgScopedMixin, TimestampMixin):
     def validate_permissions(cls, v: List[str]) -> List[str]:
         """Validate permission format."""
         for perm in v:
-            if ":" not in perm:
-                raise ValueError(f"Invalid permission format: {perm}. Must be 'resource:action'")
-            parts = perm.split(":")
-            if len(parts) != 2:
+            if perm.count(":") != 1:
                 raise ValueError(f"Invalid permission format: {perm}. Must be 'resource:action'")
         return v
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def table_schema() -> ZeroDBTableSchema:
         """Get ZeroDB table schema for roles.
 
         Returns:
-            Table schema definition for ZeroDB
+            Table schema definition for ZeroDB (built once and shared;
+            do not mutate)
         """
         return ZeroDBTableSchema(
             columns=[
@@ -147,6 +147,10 @@ class Role(ZeroDBBaseModel, OrgScopedMixin, TimestampMixin):
                 ZeroDBTableSchema.index_def(
                     "idx_roles_active", ["org_id", "is_active"]
                 ),
+                # jsonb_path_ops: smaller than the default opclass, serves @> containment
+                ZeroDBTableSchema.index_def(
+                    "idx_roles_permissions_gin", ["permissions"], using="gin", ops="jsonb_path_ops"
+                ),
             ],
         )
 
@@ -243,7 +247,7 @@ class User(ZeroDBBaseModel, OrgScopedMixin, TimestampMixin):
     )
 
     # Preferences
-    preferences: Dict[str, Any] = Field(
+    preferences: JSONDict = Field(
         default_factory=dict,
         description="User preferences and UI settings as JSON",
     )
@@ -256,17 +260,23 @@ class User(ZeroDBBaseModel, OrgScopedMixin, TimestampMixin):
             raise ValueError("Password hash must be bcrypt format")
         return v
 
-    @property
+    @cached_property
     def full_name(self) -> str:
-        """Get user's full name."""
+        """Get user's full name.
+
+        Built on first access; later changes to first_name or last_name
+        are not reflected.
+        """
         return f"{self.first_name} {self.last_name}"
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def table_schema() -> ZeroDBTableSchema:
         """Get ZeroDB table schema for users.
 
         Returns:
-            Table schema definition for ZeroDB
+            Table schema definition for ZeroDB (built once and shared;
+            do not mutate)
         """
         return ZeroDBTableSchema(
             columns=[
@@ -345,5 +355,26 @@ class User(ZeroDBBaseModel, OrgScopedMixin, TimestampMixin):
                 ZeroDBTableSchema.index_def(
                     "idx_users_status", ["org_id", "status"]
                 ),
+                # Auth lookups on sparse columns: index only the rows that are set
+                ZeroDBTableSchema.index_def(
+                    "idx_users_locked", ["locked_until"],
+                    where="locked_until IS NOT NULL"
+                ),
+                ZeroDBTableSchema.index_def(
+                    "idx_users_pw_reset", ["password_reset_token"],
+                    where="password_reset_token IS NOT NULL"
+                ),
+                ZeroDBTableSchema.index_def(
+                    "idx_users_email_verif", ["email_verification_token"],
+                    where="email_verification_token IS NOT NULL"
+                ),
+                ZeroDBTableSchema.index_def(
+                    "idx_users_failed_login", ["org_id", "failed_login_attempts"],
+                    where="failed_login_attempts > 0"
+                ),
+                # jsonb_path_ops: smaller than the default opclass, serves @> containment
+                ZeroDBTableSchema.index_def(
+                    "idx_users_preferences_gin", ["preferences"], using="gin", ops="jsonb_path_ops"
+                ),
             ],
         )
@@ -45,10 +45,14 @@ from app.schemas.review import (
 from app.schemas.audit import (
     AuditAction,
     AuditEntityType,
+    AuditEntityTypeName,
+    AuditExportJobStatus,
     AuditEventCreate,
+    AUDIT_EVENT_CREATE_LIST_ADAPTER,
     AuditEvent,
     AuditEventListResponse,
     AuditEventFilter,
+    AuditExportJobResponse,
     DocumentAuditTrailResponse,
 )
 from app.schemas.retention import (
@@ -66,6 +70,9 @@ from app.schemas.legal_hold import (
     LegalHoldRelease,
     LegalHoldReleaseResponse,
     DocumentLegalHoldStatus,
+    LegalHoldScopeTypeName,
+    LegalHoldStatusName,
+    parse_date_range,
 )
 from app.schemas.roles import (
     RoleBase,
@@ -115,10 +122,14 @@ __all__ = [
     # Audit
     "AuditAction",
     "AuditEntityType",
+    "AuditEntityTypeName",
+    "AuditExportJobStatus",
     "AuditEventCreate",
+    "AUDIT_EVENT_CREATE_LIST_ADAPTER",
     "AuditEvent",
     "AuditEventListResponse",
     "AuditEventFilter",
+    "AuditExportJobResponse",
     "DocumentAuditTrailResponse",
     # Retention
     "RetentionPolicyBase",
@@ -134,6 +145,9 @@ __all__ = [
     "LegalHoldRelease",
     "LegalHoldReleaseResponse",
     "DocumentLegalHoldStatus",
+    "LegalHoldScopeTypeName",
+    "LegalHoldStatusName",
+    "parse_date_range",
     # Roles
     "RoleBase",
     "RoleCreate",
@@ -2,13 +2,21 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Re-exported for schema users; the enum lives with the models
+from app.models.enums import AuditEntityType
 
 
 class AuditAction(str, Enum):
-    """Supported audit event action types."""
+    """Supported audit event action types.
+
+    These are the dotted action names the audit service writes; every value
+    matches AUDIT_ACTION_PATTERN. Not to be confused with
+    models.enums.AuditAction, which holds bare verbs ("created", ...).
+    """
 
     # Document events
     DOCUMENT_RECEIVED = "document.received"
@@ -25,18 +33,25 @@ class AuditAction(str, Enum):
     LEGAL_HOLD_RELEASED = "legal_hold.released"
 
 
-class AuditEntityType(str, Enum):
-    """Supported audit entity types."""
+# Every auditable entity type, derived from AuditEntityType so the two
+# cannot drift. A Literal keeps validated values as plain strings, and
+# pydantic-core checks it with a single set lookup.
+AuditEntityTypeName = Literal[tuple(entity_type.value for entity_type in AuditEntityType)]
+
+
+class AuditExportJobStatus(str, Enum):
+    """Lifecycle states of a background audit export job."""
 
-    DOCUMENT = "document"
-    EMPLOYEE = "employee"
-    LEGAL_HOLD = "legal_hold"
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
 
 
 class AuditEventCreate(BaseModel):
     """Schema for creating an audit event."""
 
-    entity_type: str = Field(
+    entity_type: AuditEntityTypeName = Field(
         ...,
         description="Type of entity being audited (e.g., document, employee, legal_hold)",
         examples=["document", "employee", "legal_hold"],
@@ -63,6 +78,10 @@ class AuditEventCreate(BaseModel):
     )
 
 
+# Validates a batch of events in one pydantic-core call
+AUDIT_EVENT_CREATE_LIST_ADAPTER = TypeAdapter(List[AuditEventCreate])
+
+
 class AuditEvent(BaseModel):
     """Schema for an audit event response."""
 
@@ -103,10 +122,7 @@ class AuditEvent(BaseModel):
         description="Timestamp when the event was created",
     )
 
-    class Config:
-        """Pydantic model configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditEventListResponse(BaseModel):
@@ -179,3 +195,40 @@ class DocumentAuditTrailResponse(BaseModel):
         ge=0,
         description="Total number of events for this document",
     )
+
+
+class AuditExportJobResponse(BaseModel):
+    """Status of a background audit export job."""
+
+    job_id: str = Field(
+        ...,
+        description="ID of the export job",
+    )
+    status: AuditExportJobStatus = Field(
+        ...,
+        description="Current job status",
+    )
+    format: str = Field(
+        ...,
+        description="Export file format (json or csv)",
+    )
+    total_events: Optional[int] = Field(
+        default=None,
+        description="Number of events exported (once completed)",
+    )
+    download_url: Optional[str] = Field(
+        default=None,
+        description="Pre-signed download URL of the zstd-compressed file (once completed)",
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Failure reason (if the job failed)",
+    )
+    created_at: datetime = Field(
+        ...,
+        description="Timestamp when the export was requested",
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None,
+        description="Timestamp when the export finished",
+    )
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 from app.schemas.users import UserRole, UserStatus
 
@@ -30,6 +30,8 @@ class MagicLinkResponse(BaseModel):
         description="Token expiration in minutes"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class TokenVerifyRequest(BaseModel):
     """Schema for verifying a magic link token."""
@@ -49,12 +51,7 @@ class TokenResponse(BaseModel):
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Access token expiration in seconds")
 
-
-class AuthResponse(BaseModel):
-    """Schema for authentication response with user info."""
-
-    user: "UserAuthInfo" = Field(..., description="Authenticated user info")
-    tokens: TokenResponse = Field(..., description="JWT tokens")
+    model_config = ConfigDict(frozen=True)
 
 
 class UserAuthInfo(BaseModel):
@@ -68,11 +65,24 @@ class UserAuthInfo(BaseModel):
     status: UserStatus = Field(..., description="User status")
     org_id: str = Field(..., description="Organization identifier")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class AuthResponse(BaseModel):
+    """Schema for authentication response with user info."""
+
+    user: UserAuthInfo = Field(..., description="Authenticated user info")
+    tokens: TokenResponse = Field(..., description="JWT tokens")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class CurrentUserResponse(BaseModel):
-    """Schema for current user response."""
+    """Schema for current user response.
+
+    Instances are shared through the current-user cache, so the model is
+    frozen.
+    """
 
     id: str = Field(..., description="User unique identifier")
     email: str = Field(..., description="User email address")
@@ -85,14 +95,10 @@ class CurrentUserResponse(BaseModel):
     permissions: list[str] = Field(default=[], description="User permissions")
     last_login_at: Optional[datetime] = Field(default=None, description="Last login")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class RefreshTokenRequest(BaseModel):
     """Schema for refreshing access token."""
 
     refresh_token: str = Field(..., description="Refresh token")
-
-
-# Update forward reference
-AuthResponse.model_rebuild()
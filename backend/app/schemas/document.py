@@ -4,7 +4,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+
+from app.models.base import JSONDict
 
 
 class DocumentStatus(str, Enum):
@@ -45,8 +47,14 @@ class SubmissionChannel(str, Enum):
     HRIS_SYNC = "hris_sync"
 
 
-class DocumentMetadata(BaseModel):
-    """Metadata associated with a document."""
+class DocumentMetadataFields(BaseModel):
+    """Metadata fields shared by document create and update requests.
+
+    The fields sit at the top level of the request body, like on Document,
+    rather than in a nested model that is validated separately. Bodies in
+    the older shape, with the fields under a nested "metadata" object, are
+    still accepted and flattened before validation.
+    """
 
     issue_date: Optional[datetime] = Field(
         default=None,
@@ -76,13 +84,49 @@ class DocumentMetadata(BaseModel):
         max_length=3,
         description="Country code (ISO 3166-1 alpha-3)",
     )
-    custom_fields: Optional[Dict[str, Any]] = Field(
+    custom_fields: Optional[JSONDict] = Field(
         default=None,
         description="Custom metadata fields as key-value pairs",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def lift_nested_metadata(cls, data: Any) -> Any:
+        """Move fields from a legacy nested "metadata" object to the top level.
+
+        Top-level values win over nested ones. Unknown nested keys are
+        rejected rather than silently dropped.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("metadata"), dict):
+            return data
+
+        data = dict(data)
+        nested = data.pop("metadata")
+        unknown = set(nested).difference(DOCUMENT_METADATA_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown metadata fields: {', '.join(sorted(unknown))}")
+        for name, value in nested.items():
+            data.setdefault(name, value)
+        return data
+
+    def to_metadata_dict(self) -> Dict[str, Any]:
+        """Pack the metadata fields that were provided into a dict for storage.
+
+        Returns:
+            Provided (non-None) metadata fields keyed by name.
+        """
+        return {
+            name: value
+            for name in DOCUMENT_METADATA_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+# Metadata field names, in storage order
+DOCUMENT_METADATA_FIELDS = tuple(DocumentMetadataFields.model_fields)
 
-class DocumentCreate(BaseModel):
+
+class DocumentCreate(DocumentMetadataFields):
     """Schema for creating a new document."""
 
     employee_id: str = Field(
@@ -120,10 +164,6 @@ class DocumentCreate(BaseModel):
         default=SubmissionChannel.UPLOAD,
         description="How the document was submitted",
     )
-    metadata: Optional[DocumentMetadata] = Field(
-        default=None,
-        description="Document metadata",
-    )
     notes: Optional[str] = Field(
         default=None,
         max_length=1000,
@@ -131,7 +171,7 @@ class DocumentCreate(BaseModel):
     )
 
 
-class DocumentUpdate(BaseModel):
+class DocumentUpdate(DocumentMetadataFields):
     """Schema for updating a document."""
 
     name: Optional[str] = Field(
@@ -148,10 +188,6 @@ class DocumentUpdate(BaseModel):
         default=None,
         description="Document status",
     )
-    metadata: Optional[DocumentMetadata] = Field(
-        default=None,
-        description="Document metadata",
-    )
     notes: Optional[str] = Field(
         default=None,
         max_length=1000,
@@ -179,7 +215,7 @@ class Document(BaseModel):
     expiration_date: Optional[datetime] = Field(default=None)
     issuer: Optional[str] = Field(default=None)
     document_number: Optional[str] = Field(default=None)
-    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Full metadata object")
+    metadata: Optional[JSONDict] = Field(default=None, description="Full metadata object")
 
     # Review fields
     reviewed_by: Optional[str] = Field(default=None)
@@ -196,8 +232,11 @@ class Document(BaseModel):
     # Versioning
     version: int = Field(default=1, description="Document version number")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates a page of documents in one pydantic-core call
+DOCUMENT_LIST_ADAPTER = TypeAdapter(List[Document])
 
 
 class DocumentListResponse(BaseModel):
@@ -4,7 +4,9 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.base import EmailAddress, JSONDict
 
 
 class EmploymentStatus(str, Enum):
@@ -47,7 +49,7 @@ class EmployeeCreate(BaseModel):
         max_length=100,
         description="Employee last name"
     )
-    email: EmailStr = Field(
+    email: EmailAddress = Field(
         ...,
         description="Employee email address"
     )
@@ -87,7 +89,7 @@ class EmployeeCreate(BaseModel):
         max_length=255,
         description="Work location"
     )
-    metadata: Optional[dict] = Field(
+    metadata: Optional[JSONDict] = Field(
         default_factory=dict,
         description="Additional employee metadata"
     )
@@ -108,7 +110,7 @@ class EmployeeUpdate(BaseModel):
         max_length=100,
         description="Employee last name"
     )
-    email: Optional[EmailStr] = Field(
+    email: Optional[EmailAddress] = Field(
         default=None,
         description="Employee email address"
     )
@@ -148,7 +150,7 @@ class EmployeeUpdate(BaseModel):
         max_length=255,
         description="Work location"
     )
-    metadata: Optional[dict] = Field(
+    metadata: Optional[JSONDict] = Field(
         default=None,
         description="Additional employee metadata"
     )
@@ -174,11 +176,11 @@ class EmployeeResponse(BaseModel):
     termination_date: Optional[date] = Field(default=None, description="Termination date")
     location: Optional[str] = Field(default=None, description="Work location")
     user_id: Optional[str] = Field(default=None, description="Linked user account ID")
-    metadata: dict = Field(default_factory=dict, description="Additional metadata")
+    metadata: JSONDict = Field(default_factory=dict, description="Additional metadata")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EmployeeListResponse(BaseModel):
@@ -194,7 +196,7 @@ class EmployeeListResponse(BaseModel):
     employment_status: EmploymentStatus = Field(..., description="Employment status")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EmployeeSearchQuery(BaseModel):
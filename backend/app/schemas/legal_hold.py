@@ -9,15 +9,42 @@ be deleted even if their retention period has expired.
 """
 
 from datetime import datetime
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+# Legal hold scope types and statuses. pydantic-core validates a Literal of
+# strings with a single set lookup.
+LegalHoldScopeTypeName = Literal["employee", "department", "document_category", "date_range"]
+LegalHoldStatusName = Literal["active", "released"]
+
+
+@lru_cache(maxsize=1024)
+def parse_date_range(scope_value: str) -> Tuple[datetime, datetime]:
+    """Parse a date_range scope value ("2023-01-01:2023-12-31").
+
+    Active holds are matched against every document checked for deletion,
+    so each distinct range is parsed once and reused.
+
+    Args:
+        scope_value: Start and end ISO dates separated by a colon
+
+    Returns:
+        Tuple of (start, end) datetimes
+
+    Raises:
+        ValueError: If the value is not two ISO dates separated by a colon
+    """
+    start_str, end_str = scope_value.split(":")
+    return datetime.fromisoformat(start_str), datetime.fromisoformat(end_str)
 
 
 class LegalHoldScope(BaseModel):
     """Legal hold scope definition."""
 
-    scope_type: Literal["employee", "department", "document_category", "date_range"] = Field(
+    scope_type: LegalHoldScopeTypeName = Field(
         ...,
         description="Type of scope: employee (specific person), department (entire dept), "
         "document_category (all docs of a type), or date_range (docs created in period)",
@@ -43,7 +70,7 @@ class LegalHoldCreate(BaseModel):
         min_length=3,
         max_length=200,
     )
-    scope_type: Literal["employee", "department", "document_category", "date_range"] = Field(
+    scope_type: LegalHoldScopeTypeName = Field(
         ...,
         description="Scope type determining which documents are affected",
     )
@@ -58,6 +85,13 @@ class LegalHoldCreate(BaseModel):
         max_length=1000,
     )
 
+    @model_validator(mode="after")
+    def check_date_range(self) -> "LegalHoldCreate":
+        """Reject date_range scopes that could never match a document."""
+        if self.scope_type == "date_range":
+            parse_date_range(self.scope_value)
+        return self
+
 
 class LegalHoldUpdate(BaseModel):
     """Schema for updating legal hold metadata.
@@ -89,10 +123,10 @@ class LegalHold(BaseModel):
     id: str = Field(..., description="Unique legal hold identifier")
     org_id: str = Field(..., description="Organization identifier")
     name: str = Field(..., description="Descriptive name of the legal hold")
-    scope_type: str = Field(..., description="Type of scope applied")
+    scope_type: LegalHoldScopeTypeName = Field(..., description="Type of scope applied")
     scope_value: str = Field(..., description="Specific scope value")
     reason: Optional[str] = Field(None, description="Legal/compliance reason")
-    status: Literal["active", "released"] = Field(
+    status: LegalHoldStatusName = Field(
         ...,
         description="Hold status: active (blocking deletions) or released (historical record)",
     )
@@ -105,7 +139,7 @@ class LegalHold(BaseModel):
         description="Number of documents currently affected by this hold",
     )
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LegalHoldRelease(BaseModel):
@@ -127,7 +161,7 @@ class LegalHoldReleaseResponse(BaseModel):
 
     legal_hold_id: str = Field(..., description="Released legal hold identifier")
     name: str = Field(..., description="Name of the released hold")
-    status: str = Field(..., description="New status (should be 'released')")
+    status: LegalHoldStatusName = Field(..., description="New status (should be 'released')")
     released_by: str = Field(..., description="User who released the hold")
     released_at: datetime = Field(..., description="Release timestamp")
     affected_documents: int = Field(
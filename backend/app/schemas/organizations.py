@@ -4,7 +4,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.models.base import EmailAddress
+from app.models.organization import slugify
 
 
 class OrganizationStatus(str, Enum):
@@ -16,6 +19,11 @@ class OrganizationStatus(str, Enum):
     PENDING = "pending"
 
 
+# Value-to-member map for decoding stored statuses without EnumMeta.__call__
+# (see models.enums.USER_STATUS_BY_VALUE); treat as read-only.
+ORGANIZATION_STATUS_BY_VALUE = OrganizationStatus._value2member_map_
+
+
 class OrganizationCreate(BaseModel):
     """Schema for creating a new organization."""
 
@@ -29,15 +37,18 @@ class OrganizationCreate(BaseModel):
         default=None,
         min_length=2,
         max_length=100,
-        pattern=r"^[a-z0-9]+(?:-[a-z0-9]+)*$",
-        description="URL-friendly slug (auto-generated if not provided)"
+        description=(
+            "URL-friendly slug (auto-generated if not provided). A supplied slug is "
+            "canonicalized (lowercased, non-alphanumeric runs replaced by '-'), so the "
+            "stored slug may differ from the submitted one; use the slug in the response."
+        )
     )
     domain: Optional[str] = Field(
         default=None,
         max_length=255,
         description="Organization's primary email domain"
     )
-    admin_email: EmailStr = Field(
+    admin_email: EmailAddress = Field(
         ...,
         description="Primary admin email address"
     )
@@ -46,6 +57,14 @@ class OrganizationCreate(BaseModel):
         description="Organization-specific settings"
     )
 
+    @field_validator("slug", mode="before")
+    @classmethod
+    def canonicalize_slug(cls, v: Optional[str]) -> Optional[str]:
+        """Turn input like "My Org" into "my-org" instead of rejecting it."""
+        if isinstance(v, str):
+            return slugify(v)
+        return v
+
 
 class OrganizationUpdate(BaseModel):
     """Schema for updating an organization."""
@@ -72,7 +91,12 @@ class OrganizationUpdate(BaseModel):
 
 
 class OrganizationResponse(BaseModel):
-    """Schema for organization response."""
+    """Schema for organization response.
+
+    Instances are kept in the organization cache, so the model is frozen.
+    Freezing only blocks field assignment; the service hands out copies
+    with their own settings dict, since that dict stays mutable.
+    """
 
     id: str = Field(..., description="Organization unique identifier")
     name: str = Field(..., description="Organization name")
@@ -84,7 +108,7 @@ class OrganizationResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class OrganizationListResponse(BaseModel):
@@ -96,4 +120,4 @@ class OrganizationListResponse(BaseModel):
     status: OrganizationStatus = Field(..., description="Organization status")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
@@ -9,7 +9,7 @@ of outdated records.
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RetentionPolicyBase(BaseModel):
@@ -47,7 +47,7 @@ class RetentionPolicy(RetentionPolicyBase):
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
     created_by: str = Field(..., description="User who created the policy")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RetentionCalculationRequest(BaseModel):
@@ -23,11 +23,19 @@ class ReviewQueueResponse(BaseModel):
     """Paginated response for review queue."""
 
     items: List[ReviewQueueItem] = Field(description="List of documents pending review")
-    total: int = Field(ge=0, description="Total number of documents pending review")
+    total: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Total number of documents pending review (omitted when counting is disabled)",
+    )
     page: int = Field(ge=1, description="Current page number")
     page_size: int = Field(ge=1, le=100, description="Number of items per page")
     has_next: bool = Field(description="Whether there is a next page")
     has_previous: bool = Field(description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page (pass as cursor)",
+    )
 
 
 class ApproveRequest(BaseModel):
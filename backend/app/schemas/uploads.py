@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UploadStatus(str, Enum):
@@ -72,7 +72,7 @@ class UploadResponse(BaseModel):
     status: UploadStatus = Field(default=UploadStatus.PENDING, description="Upload status")
     max_file_size: int = Field(..., description="Maximum allowed file size")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UploadCompleteRequest(BaseModel):
@@ -97,7 +97,7 @@ class UploadCompleteResponse(BaseModel):
     file_url: Optional[str] = Field(default=None, description="Accessible file URL")
     processed_at: Optional[datetime] = Field(default=None, description="Processing timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FileMetadata(BaseModel):
@@ -115,4 +115,4 @@ class FileMetadata(BaseModel):
     metadata: dict = Field(default_factory=dict, description="Additional metadata")
     created_at: datetime = Field(..., description="Upload timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class UserRole(str, Enum):
@@ -72,7 +72,7 @@ class UserInviteResponse(BaseModel):
     expires_at: datetime = Field(..., description="Invitation expiration")
     magic_link_sent: bool = Field(default=True, description="Whether magic link was sent")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserActivateRequest(BaseModel):
@@ -103,7 +103,7 @@ class UserActivateResponse(BaseModel):
     refresh_token: str = Field(..., description="JWT refresh token")
     activated_at: datetime = Field(..., description="Activation timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserResponse(BaseModel):
@@ -121,7 +121,7 @@ class UserResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserListResponse(BaseModel):
@@ -135,4 +135,4 @@ class UserListResponse(BaseModel):
     status: UserStatus = Field(..., description="User status")
     created_at: datetime = Field(..., description="Creation timestamp")
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
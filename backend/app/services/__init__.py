@@ -2,6 +2,7 @@
 
 from app.services.audit import (
     AuditService,
+    get_audit_service,
     emit_audit_event,
     emit_document_received,
     emit_document_version_created,
@@ -12,8 +13,13 @@ from app.services.audit import (
     emit_legal_hold_created,
     emit_legal_hold_released,
 )
+from app.services.audit_export import (
+    AuditExportService,
+    get_audit_export_service,
+)
 from app.services.auth import (
     AuthService,
+    get_auth_service,
     request_magic_link,
     verify_magic_link,
     refresh_access_token,
@@ -25,8 +31,13 @@ from app.services.document import (
     get_document,
     get_expiring_documents,
 )
+from app.services.notifications import (
+    NotificationBuffer,
+    notification_buffer,
+)
 from app.services.organization import (
     OrganizationService,
+    get_organization_service,
     create_organization,
 )
 from app.services.retention import RetentionService
@@ -42,6 +53,7 @@ from app.services.user import (
 __all__ = [
     # Audit Service
     "AuditService",
+    "get_audit_service",
     "emit_audit_event",
     "emit_document_received",
     "emit_document_version_created",
@@ -51,8 +63,12 @@ __all__ = [
     "emit_employee_updated",
     "emit_legal_hold_created",
     "emit_legal_hold_released",
+    # Audit Export Service
+    "AuditExportService",
+    "get_audit_export_service",
     # Auth Service
     "AuthService",
+    "get_auth_service",
     "request_magic_link",
     "verify_magic_link",
     "refresh_access_token",
@@ -62,8 +78,12 @@ __all__ = [
     "create_document",
     "get_document",
     "get_expiring_documents",
+    # Notifications
+    "NotificationBuffer",
+    "notification_buffer",
     # Organization Service
     "OrganizationService",
+    "get_organization_service",
     "create_organization",
     # Retention Service
     "RetentionService",
@@ -28,13 +28,16 @@ Example usage:
     )
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from app.db.zerodb_client import ZeroDBClient
 from app.schemas.audit import (
+    AUDIT_EVENT_CREATE_LIST_ADAPTER,
     AuditEvent,
     AuditEventCreate,
     AuditEventFilter,
@@ -44,6 +47,14 @@ logger = logging.getLogger(__name__)
 
 # Constants
 AUDIT_EVENTS_TABLE = "audit_events"
+USERS_TABLE = "users"
+SYSTEM_ACTOR_ID = "system"  # Automated actions; never a users row
+AUDIT_EVENT_FIELDS = (
+    "id", "org_id", "entity_type", "entity_id", "action",
+    "actor_id", "actor_email", "metadata", "created_at",
+)
+AUDIT_FILTER_COLUMNS = ("org_id", "entity_type", "entity_id", "action", "actor_id")
+STREAM_BATCH_SIZE = 1000  # Rows fetched per round-trip when streaming
 
 
 class AuditService:
@@ -120,8 +131,8 @@ class AuditService:
         }
 
         logger.info(
-            f"Emitting audit event: {action} for {entity_type}/{entity_id} "
-            f"by actor {actor_id} in org {org_id}"
+            "Emitting audit event: %s for %s/%s by actor %s in org %s",
+            action, entity_type, entity_id, actor_id, org_id,
         )
 
         # Insert into database (append-only)
@@ -139,9 +150,70 @@ class AuditService:
             created_at=created_at,
         )
 
-    async def query_events(
+    async def emit_events(
         self,
         org_id: str,
+        events: List[Dict[str, Any]],
+        actor_email: Optional[str] = None,
+    ) -> List[AuditEvent]:
+        """Emit several audit events with a single insert.
+
+        The batch is validated against AuditEventCreate in one call, so a
+        malformed event rejects the whole batch before anything is written.
+
+        Args:
+            org_id: Organization ID the events belong to.
+            events: Event dicts with the AuditEventCreate fields.
+            actor_email: Optional email of the actor, applied to every event.
+
+        Returns:
+            The created AuditEvents, in input order.
+
+        Example:
+            ```python
+            events = await audit_service.emit_events(
+                org_id="org-789",
+                events=[
+                    {"entity_type": "role", "entity_id": "role-1",
+                     "action": "role.created", "actor_id": "user-456"},
+                    {"entity_type": "role", "entity_id": "role-2",
+                     "action": "role.created", "actor_id": "user-456"},
+                ],
+            )
+            ```
+        """
+        creates = AUDIT_EVENT_CREATE_LIST_ADAPTER.validate_python(events)
+        created_at = datetime.utcnow()
+        created_at_iso = created_at.isoformat()
+
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "org_id": org_id,
+                "entity_type": create.entity_type,
+                "entity_id": create.entity_id,
+                "action": create.action,
+                "actor_id": create.actor_id,
+                "actor_email": actor_email,
+                "metadata": create.metadata,
+                "created_at": created_at_iso,
+            }
+            for create in creates
+        ]
+
+        logger.info("Emitting %s audit events in org %s", len(rows), org_id)
+
+        # Insert into database (append-only)
+        await self.db.table_insert(AUDIT_EVENTS_TABLE, rows)
+
+        return [
+            AuditEvent.model_construct(**{**row, "created_at": created_at})
+            for row in rows
+        ]
+
+    async def query_events(
+        self,
+        org_id: Optional[str],
         entity_type: Optional[str] = None,
         entity_id: Optional[str] = None,
         action: Optional[str] = None,
@@ -150,11 +222,16 @@ class AuditService:
         end_date: Optional[datetime] = None,
         page: int = 1,
         page_size: int = 20,
+        order_by: str = "created_at DESC",
+        is_admin: bool = False,
     ) -> Tuple[List[AuditEvent], int]:
         """Query audit events with optional filters.
 
+        Filtering, ordering and pagination are all applied by the database,
+        so only the requested page is transferred.
+
         Args:
-            org_id: Organization ID to filter by (required).
+            org_id: Organization ID to filter by (required unless is_admin).
             entity_type: Optional filter by entity type.
             entity_id: Optional filter by entity ID.
             action: Optional filter by action type.
@@ -163,6 +240,9 @@ class AuditService:
             end_date: Optional filter for events before this date.
             page: Page number (1-indexed).
             page_size: Number of items per page.
+            order_by: Sort expression (default: newest first).
+            is_admin: Skip organization scoping for platform-wide queries.
+                Callers must only set this for super admins.
 
         Returns:
             Tuple of (list of AuditEvents, total count).
@@ -179,53 +259,271 @@ class AuditService:
             )
             ```
         """
-        # Build filter conditions
-        filters: Dict[str, Any] = {"org_id": org_id}
-
-        if entity_type:
-            filters["entity_type"] = entity_type
-        if entity_id:
-            filters["entity_id"] = entity_id
-        if action:
-            filters["action"] = action
-        if actor_id:
-            filters["actor_id"] = actor_id
+        rows, total = await self.query_event_rows(
+            org_id=org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            actor_id=actor_id,
+            start_date=start_date,
+            end_date=end_date,
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            is_admin=is_admin,
+        )
 
-        # Date range filters (using ZeroDB comparison operators)
-        if start_date:
-            filters["created_at"] = filters.get("created_at", {})
-            filters["created_at"]["$gte"] = start_date.isoformat()
-        if end_date:
-            filters["created_at"] = filters.get("created_at", {})
-            filters["created_at"]["$lte"] = end_date.isoformat()
+        return [self._row_to_event(row) for row in rows], total
+
+    async def query_event_rows(
+        self,
+        org_id: Optional[str],
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        action: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page: int = 1,
+        page_size: int = 20,
+        order_by: str = "created_at DESC",
+        is_admin: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Query audit events as plain row dictionaries.
 
-        logger.info(f"Querying audit events with filters: {filters}")
+        Same as query_events, but skips building AuditEvent models. Rows
+        are projected to the AuditEvent fields and can be serialized
+        directly, which keeps hot read endpoints out of Pydantic.
+
+        Args:
+            See query_events.
+
+        Returns:
+            Tuple of (list of event row dicts, total count).
+        """
+        filters = self._build_filters(
+            org_id=None if is_admin else org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            actor_id=actor_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        logger.info("Querying audit events with filters: %s", filters)
 
         # Calculate offset
         offset = (page - 1) * page_size
 
-        # Query the database
-        rows = await self.db.table_query(
-            AUDIT_EVENTS_TABLE,
-            filters=filters,
-            limit=page_size,
-            offset=offset,
+        # Start the count alongside the page so a full page costs one
+        # round-trip of latency rather than two
+        count_task = asyncio.ensure_future(
+            self.db.table_count(AUDIT_EVENTS_TABLE, filters=filters)
         )
+        # Retrieve the outcome of a dropped count so its errors are not reported
+        count_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            rows = await self.db.table_query(
+                AUDIT_EVENTS_TABLE,
+                filters=filters,
+                limit=page_size,
+                offset=offset,
+                order_by=order_by,
+            )
+        except BaseException:
+            count_task.cancel()
+            raise
 
-        # Get total count (query with same filters but no pagination)
-        # Note: In production, this would use a COUNT query for efficiency
-        all_rows = await self.db.table_query(
-            AUDIT_EVENTS_TABLE,
-            filters=filters,
-            limit=10000,  # Large limit for counting
-            offset=0,
+        # A short page already tells us the total, so the count is dropped
+        if len(rows) < page_size and (rows or page == 1):
+            count_task.cancel()
+            total = offset + len(rows)
+        else:
+            total = await count_task
+
+        rows = [self._project_row(row) for row in rows]
+        await self._resolve_actor_emails(rows)
+
+        return rows, total
+
+    async def stream_events(
+        self,
+        org_id: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        action: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        descending: bool = True,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[AuditEvent]:
+        """Stream audit events matching the filters one at a time.
+
+        Rows are fetched from the database in batches of ``batch_size`` and
+        yielded as they arrive, so memory use stays constant regardless of
+        how many events match. Batches are positioned by a keyset cursor on
+        (created_at, id) rather than an offset, so events written while the
+        stream runs cannot shift rows into or out of later batches.
+
+        Args:
+            org_id: Organization ID to filter by (required).
+            entity_type: Optional filter by entity type.
+            entity_id: Optional filter by entity ID.
+            action: Optional filter by action type.
+            actor_id: Optional filter by actor ID.
+            start_date: Optional filter for events after this date.
+            end_date: Optional filter for events before this date.
+            limit: Optional maximum number of events to yield.
+            descending: Stream newest first (default) or oldest first.
+            batch_size: Number of rows fetched per database round-trip.
+
+        Yields:
+            AuditEvent objects in the requested order.
+
+        Example:
+            ```python
+            async for event in audit_service.stream_events(org_id="org-789"):
+                print(event.action)
+            ```
+        """
+        async for row in self.stream_event_rows(
+            org_id=org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            actor_id=actor_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            descending=descending,
+            batch_size=batch_size,
+        ):
+            yield self._row_to_event(row)
+
+    async def stream_event_rows(
+        self,
+        org_id: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        action: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        descending: bool = True,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream audit events as plain row dictionaries.
+
+        Same as stream_events, but yields rows projected to the AuditEvent
+        fields without building models. ``created_at`` stays in the ISO
+        form the database returned it in, so exports can write it as is.
+
+        Args:
+            See stream_events.
+
+        Yields:
+            Event row dicts in the requested order.
+        """
+        filters = self._build_filters(
+            org_id=org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            actor_id=actor_id,
+            start_date=start_date,
+            end_date=end_date,
         )
-        total = len(all_rows)
 
-        # Convert to AuditEvent objects
-        events = [self._row_to_event(row) for row in rows]
+        logger.info("Streaming audit events with filters: %s", filters)
+
+        direction = "DESC" if descending else "ASC"
+        order_by = f"created_at {direction}, id {direction}"
+        bound = "$lte" if descending else "$gte"
+
+        # Keyset cursor: the created_at of the last row yielded, and how many
+        # rows with exactly that created_at have been yielded already. Each
+        # batch starts at the cursor's created_at (inclusive) and skips the
+        # rows of that instant already seen, which id ordering keeps stable.
+        cursor_created_at: Optional[str] = None
+        seen_at_cursor = 0
+        yielded = 0
+        while True:
+            fetch_size = batch_size if limit is None else min(batch_size, limit - yielded)
+            if fetch_size <= 0:
+                return
+
+            batch_filters = filters
+            if cursor_created_at is not None:
+                batch_filters = {
+                    **filters,
+                    "created_at": {**filters.get("created_at", {}), bound: cursor_created_at},
+                }
+
+            rows = await self.db.table_query(
+                AUDIT_EVENTS_TABLE,
+                filters=batch_filters,
+                limit=fetch_size,
+                offset=seen_at_cursor,
+                order_by=order_by,
+            )
 
-        return events, total
+            rows = [self._project_row(row) for row in rows]
+            await self._resolve_actor_emails(rows)
+            for row in rows:
+                yield row
+
+            if len(rows) < fetch_size:
+                return
+            yielded += len(rows)
+
+            last_created_at = rows[-1]["created_at"]
+            run = 0
+            for row in reversed(rows):
+                if row["created_at"] != last_created_at:
+                    break
+                run += 1
+            if last_created_at == cursor_created_at:
+                seen_at_cursor += run
+            else:
+                cursor_created_at = last_created_at
+                seen_at_cursor = run
+
+    async def entity_trail(
+        self,
+        org_id: str,
+        entity_type: str,
+        entity_id: str,
+        page: int = 1,
+        page_size: int = 100,
+    ) -> Tuple[List[AuditEvent], int]:
+        """Get one page of an entity's audit trail, oldest first.
+
+        Rows come back ordered by the (org_id, entity_type, entity_id,
+        created_at) index, and trails that fit in one page need no separate
+        count, so a typical trail costs a single round-trip.
+
+        Args:
+            org_id: Organization ID.
+            entity_type: Type of entity.
+            entity_id: ID of the entity.
+            page: Page number (1-indexed).
+            page_size: Number of items per page.
+
+        Returns:
+            Tuple of (list of AuditEvents in chronological order, total count).
+        """
+        return await self.query_events(
+            org_id=org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            page=page,
+            page_size=page_size,
+            order_by="created_at ASC",
+        )
 
     async def get_document_audit_trail(
         self,
@@ -259,27 +557,119 @@ class AuditService:
             "entity_id": document_id,
         }
 
-        logger.info(f"Getting audit trail for document: {document_id}")
+        logger.info("Getting audit trail for document: %s", document_id)
 
-        # Query all events for this document
+        # Query all events for this document, oldest first
         rows = await self.db.table_query(
             AUDIT_EVENTS_TABLE,
             filters=filters,
             limit=10000,  # Get all events
             offset=0,
+            order_by="created_at ASC",
         )
 
+        await self._resolve_actor_emails(rows)
+
         # Convert to AuditEvent objects
-        events = [self._row_to_event(row) for row in rows]
+        return [self._row_to_event(row) for row in rows]
 
-        # Sort by created_at in chronological order
-        events.sort(key=lambda e: e.created_at)
+    async def _resolve_actor_emails(self, rows: List[Dict[str, Any]]) -> None:
+        """Fill in missing actor emails with a single batched user lookup.
 
-        return events
+        Events normally carry the actor email captured at write time; this
+        only covers rows recorded without one. All distinct actor IDs are
+        resolved in one query rather than one query per event. System
+        events have no email to find and are skipped.
+
+        Args:
+            rows: Event rows to update in place.
+        """
+        actor_ids = list({
+            r["actor_id"] for r in rows
+            if not r.get("actor_email") and r["actor_id"] != SYSTEM_ACTOR_ID
+        })
+        if not actor_ids:
+            return
+
+        try:
+            users = await self.db.table_query(
+                USERS_TABLE,
+                filters={"id": {"$in": actor_ids}},
+                limit=len(actor_ids),
+            )
+        except Exception as e:
+            logger.warning("Failed to resolve actor emails: %s", e)
+            return
+
+        emails = {u["id"]: u.get("email") for u in users}
+        for row in rows:
+            if not row.get("actor_email"):
+                row["actor_email"] = emails.get(row["actor_id"])
+
+    def _build_filters(
+        self,
+        org_id: Optional[str],
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        action: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Build ZeroDB filter conditions for an audit event query.
+
+        Only filters that were actually supplied are included, so unused
+        criteria never reach the database predicate.
+
+        Args:
+            org_id: Organization ID to filter by (None for unscoped admin queries).
+            entity_type: Optional filter by entity type.
+            entity_id: Optional filter by entity ID.
+            action: Optional filter by action type.
+            actor_id: Optional filter by actor ID.
+            start_date: Optional filter for events after this date.
+            end_date: Optional filter for events before this date.
+
+        Returns:
+            Filter dictionary for table_query/table_count.
+        """
+        # Equality filters in fixed AUDIT_FILTER_COLUMNS order, so a given
+        # combination of filters always produces the same query shape
+        values = (org_id, entity_type, entity_id, action, actor_id)
+        filters: Dict[str, Any] = {
+            column: value
+            for column, value in zip(AUDIT_FILTER_COLUMNS, values)
+            if value
+        }
+
+        # Date range filters (using ZeroDB comparison operators)
+        if start_date or end_date:
+            created_at: Dict[str, str] = {}
+            if start_date:
+                created_at["$gte"] = start_date.isoformat()
+            if end_date:
+                created_at["$lte"] = end_date.isoformat()
+            filters["created_at"] = created_at
+
+        return filters
+
+    def _project_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Restrict a database row to the AuditEvent fields.
+
+        Args:
+            row: Dictionary from database query.
+
+        Returns:
+            New dictionary with exactly the AuditEvent fields.
+        """
+        return {field: row.get(field) for field in AUDIT_EVENT_FIELDS}
 
     def _row_to_event(self, row: Dict[str, Any]) -> AuditEvent:
         """Convert a database row to an AuditEvent object.
 
+        Rows come from our own append-only table, so the event is built
+        with model_construct instead of being validated field by field.
+
         Args:
             row: Dictionary from database query.
 
@@ -290,7 +680,7 @@ class AuditService:
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
 
-        return AuditEvent(
+        return AuditEvent.model_construct(
             id=row["id"],
             org_id=row["org_id"],
             entity_type=row["entity_type"],
@@ -303,6 +693,22 @@ class AuditService:
         )
 
 
+@lru_cache(maxsize=4)
+def get_audit_service(db: ZeroDBClient) -> AuditService:
+    """Get the shared AuditService for a database client.
+
+    The service holds no state beyond the client, so one instance per
+    client is reused instead of constructing a new one on every request.
+
+    Args:
+        db: ZeroDB client instance.
+
+    Returns:
+        The cached AuditService.
+    """
+    return AuditService(db)
+
+
 # =============================================================================
 # Convenience Functions for Easy Event Emission
 # =============================================================================
@@ -353,7 +759,7 @@ async def emit_audit_event(
         )
         ```
     """
-    service = AuditService(db)
+    service = get_audit_service(db)
     return await service.emit_event(
         entity_type=entity_type,
         entity_id=entity_id,
@@ -0,0 +1,375 @@
+"""Audit Export Service for DocFlow HR.
+
+This module renders audit events as CSV/JSON export files and runs large
+exports as background jobs. A job streams matching events from the
+database, spools the zstd-compressed file to a temporary file, uploads
+it to ZeroDB file storage and records a file ID that is later exchanged
+for a pre-signed download URL.
+
+Example usage:
+    from app.services.audit_export import get_audit_export_service
+
+    service = get_audit_export_service(db_client)
+    job = await service.create_job(
+        org_id="org-789",
+        requested_by="user-456",
+        format="csv",
+        filters={"entity_type": "document"},
+    )
+    background_tasks.add_task(service.run_job, job["id"], "org-789")
+"""
+
+import asyncio
+import logging
+import re
+import tempfile
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from typing import IO, Any, AsyncIterator, Dict, List
+
+import httpx
+import orjson
+import zstandard
+
+from app.core.exceptions import NotFoundError
+from app.db.zerodb_client import ZeroDBClient
+from app.schemas.audit import (
+    AuditExportJobResponse,
+    AuditExportJobStatus,
+)
+from app.services.audit import get_audit_service
+
+logger = logging.getLogger(__name__)
+
+# Constants
+AUDIT_EXPORT_JOBS_TABLE = "audit_export_jobs"
+EXPORT_FOLDER = "audit_exports"
+EXPORT_DOWNLOAD_URL_TTL_SECONDS = 3600
+EXPORT_CHUNK_BYTES = 1024 * 1024  # Size of each chunk written to the spool and sent to storage
+EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024  # Spooled exports larger than this move to disk
+EXPORT_ZSTD_LEVEL = 3
+EXPORT_CONTENT_TYPE = "application/zstd"
+
+CSV_EXPORT_HEADER = (
+    "id,entity_type,entity_id,action,actor_id,actor_email,created_at,metadata\r\n"
+)
+
+# Characters that force a CSV field to be quoted (RFC 4180)
+_CSV_SPECIAL_CHARS = re.compile(r'[",\r\n]')
+
+# Filter keys accepted by AuditService.stream_events, in storage order
+_EXPORT_FILTER_KEYS = ("entity_type", "entity_id", "action", "actor_id", "start_date", "end_date")
+_EXPORT_DATE_KEYS = ("start_date", "end_date")
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field only when it contains special characters.
+
+    Matches csv.writer's default QUOTE_MINIMAL behaviour without the
+    per-row dialect overhead.
+    """
+    if _CSV_SPECIAL_CHARS.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def format_csv_row(row: Dict[str, Any]) -> str:
+    """Format an audit event row as a single CSV line.
+
+    Args:
+        row: Event row as returned by AuditService.stream_event_rows.
+            ``created_at`` is written in the stored ISO form, without a
+            parse/format round-trip.
+
+    Returns:
+        CSV line terminated with CRLF.
+    """
+    metadata = row["metadata"]
+    return ",".join((
+        _csv_field(str(row["id"])),
+        _csv_field(row["entity_type"]),
+        _csv_field(row["entity_id"]),
+        _csv_field(row["action"]),
+        _csv_field(row["actor_id"]),
+        _csv_field(row["actor_email"] or ""),
+        _csv_field(str(row["created_at"])),
+        _csv_field(orjson.dumps(metadata).decode()) if metadata else "",
+    )) + "\r\n"
+
+
+def serialize_json_export(
+    org_id: str,
+    rows: List[Dict[str, Any]],
+    exported_at: datetime,
+) -> bytes:
+    """Serialize audit event rows as a JSON export document.
+
+    Rows already carry exactly the AuditEvent fields with ISO timestamps,
+    so they are written as they are. This is CPU-bound for large exports;
+    call it from a worker thread when running inside a request.
+
+    Args:
+        org_id: Organization the events belong to.
+        rows: Event rows to include.
+        exported_at: Export timestamp recorded in the document.
+
+    Returns:
+        Indented JSON document as bytes.
+    """
+    return orjson.dumps({
+        "exported_at": exported_at,
+        "org_id": org_id,
+        "total_events": len(rows),
+        "events": rows,
+    }, option=orjson.OPT_INDENT_2)
+
+
+class AuditExportService:
+    """Service for background audit export jobs.
+
+    Attributes:
+        db: ZeroDB client instance for database operations.
+    """
+
+    def __init__(self, db: ZeroDBClient) -> None:
+        """Initialize the audit export service.
+
+        Args:
+            db: ZeroDB client instance.
+        """
+        self.db = db
+
+    async def create_job(
+        self,
+        org_id: str,
+        requested_by: str,
+        format: str,
+        filters: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Record a new pending export job.
+
+        Args:
+            org_id: Organization whose events are exported.
+            requested_by: ID of the requesting user.
+            format: Export format (json or csv).
+            filters: Audit query filters (keys accepted by stream_events).
+
+        Returns:
+            The stored job row.
+        """
+        stored_filters = {}
+        for key in _EXPORT_FILTER_KEYS:
+            value = filters.get(key)
+            if value is None:
+                continue
+            stored_filters[key] = value.isoformat() if key in _EXPORT_DATE_KEYS else value
+
+        job = {
+            "id": str(uuid.uuid4()),
+            "org_id": org_id,
+            "requested_by": requested_by,
+            "format": format,
+            "filters": stored_filters,
+            "status": AuditExportJobStatus.PENDING.value,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+
+        logger.info("Creating audit export job %s for org %s as %s", job["id"], org_id, format)
+        await self.db.table_insert(AUDIT_EXPORT_JOBS_TABLE, [job])
+        return job
+
+    async def run_job(self, job_id: str, org_id: str) -> None:
+        """Produce the export file for a job and record the result.
+
+        Intended to run as a background task. Failures are recorded on the
+        job row rather than raised.
+
+        Args:
+            job_id: ID of the job to run.
+            org_id: Organization the job belongs to.
+        """
+        try:
+            job = await self._get_job_row(job_id, org_id)
+            await self._update_job(job_id, org_id, {"status": AuditExportJobStatus.RUNNING.value})
+
+            with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES) as spool:
+                total = await self._render(job, spool)
+                file_id = await self._upload(job, spool)
+
+            await self._update_job(job_id, org_id, {
+                "status": AuditExportJobStatus.COMPLETED.value,
+                "file_id": file_id,
+                "total_events": total,
+                "completed_at": datetime.utcnow().isoformat(),
+            })
+        except Exception as e:
+            logger.error("Audit export job %s failed: %s", job_id, e)
+            try:
+                await self._update_job(job_id, org_id, {
+                    "status": AuditExportJobStatus.FAILED.value,
+                    "error": str(e),
+                    "completed_at": datetime.utcnow().isoformat(),
+                })
+            except Exception as update_error:
+                logger.error("Could not mark audit export job %s failed: %s", job_id, update_error)
+            return
+
+        logger.info("Audit export job %s completed with %s events", job_id, total)
+
+    async def get_job(self, job_id: str, org_id: str) -> AuditExportJobResponse:
+        """Get a job's status, with a download URL once it has completed.
+
+        Args:
+            job_id: ID of the job.
+            org_id: Organization the caller belongs to.
+
+        Returns:
+            AuditExportJobResponse for the job.
+
+        Raises:
+            NotFoundError: If the job does not exist in the organization.
+        """
+        job = await self._get_job_row(job_id, org_id)
+
+        download_url = None
+        if job["status"] == AuditExportJobStatus.COMPLETED.value and job.get("file_id"):
+            result = await self.db.file_download_url(
+                job["file_id"],
+                expiration_seconds=EXPORT_DOWNLOAD_URL_TTL_SECONDS,
+            )
+            download_url = result.get("download_url")
+
+        return AuditExportJobResponse(
+            job_id=job["id"],
+            status=job["status"],
+            format=job["format"],
+            total_events=job.get("total_events"),
+            download_url=download_url,
+            error=job.get("error"),
+            created_at=job["created_at"],
+            completed_at=job.get("completed_at"),
+        )
+
+    async def _get_job_row(self, job_id: str, org_id: str) -> Dict[str, Any]:
+        """Fetch a job row scoped to the organization."""
+        rows = await self.db.table_query(
+            AUDIT_EXPORT_JOBS_TABLE,
+            filters={"id": job_id, "org_id": org_id},
+            limit=1,
+        )
+        if not rows:
+            raise NotFoundError(message=f"Audit export job not found: {job_id}")
+        return rows[0]
+
+    async def _update_job(self, job_id: str, org_id: str, update: Dict[str, Any]) -> None:
+        """Update a job row scoped to the organization."""
+        await self.db.table_update(
+            AUDIT_EXPORT_JOBS_TABLE,
+            {"id": job_id, "org_id": org_id},
+            update,
+        )
+
+    async def _render(self, job: Dict[str, Any], spool: IO[bytes]) -> int:
+        """Stream the job's events into a zstd-compressed export file.
+
+        Rows are encoded into ~1 MiB chunks as they arrive and each chunk is
+        compressed straight into the spool, so memory use stays bounded by
+        the chunk size however many events match. Spool writes run in a
+        worker thread since the spool may have rolled over to disk.
+
+        Args:
+            job: The job row.
+            spool: Binary file the compressed export is written to.
+
+        Returns:
+            Number of events written.
+        """
+        filters: Dict[str, Any] = dict(job.get("filters") or {})
+        for key in _EXPORT_DATE_KEYS:
+            if filters.get(key):
+                filters[key] = datetime.fromisoformat(filters[key])
+
+        rows = get_audit_service(self.db).stream_event_rows(org_id=job["org_id"], **filters)
+        compressor = zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL).compressobj()
+
+        async def write(data: bytes) -> None:
+            compressed = compressor.compress(data)
+            if compressed:
+                await asyncio.to_thread(spool.write, compressed)
+
+        total = 0
+        if job["format"] == "csv":
+            buffer = bytearray(CSV_EXPORT_HEADER.encode())
+            async for row in rows:
+                buffer += format_csv_row(row).encode()
+                total += 1
+                if len(buffer) >= EXPORT_CHUNK_BYTES:
+                    await write(bytes(buffer))
+                    buffer.clear()
+        else:
+            # Same document as serialize_json_export, written incrementally;
+            # total_events comes last because it is only known at the end
+            buffer = bytearray(b'{\n  "exported_at": ')
+            buffer += orjson.dumps(datetime.utcnow())
+            buffer += b',\n  "org_id": ' + orjson.dumps(job["org_id"])
+            buffer += b',\n  "events": ['
+            async for row in rows:
+                buffer += b",\n    " if total else b"\n    "
+                buffer += orjson.dumps(row)
+                total += 1
+                if len(buffer) >= EXPORT_CHUNK_BYTES:
+                    await write(bytes(buffer))
+                    buffer.clear()
+            buffer += b"\n  ]," if total else b"],"
+            buffer += b'\n  "total_events": ' + str(total).encode() + b"\n}"
+
+        await write(bytes(buffer))
+        await asyncio.to_thread(spool.write, compressor.flush())
+        return total
+
+    async def _upload(self, job: Dict[str, Any], spool: IO[bytes]) -> str:
+        """Upload the spooled export to file storage.
+
+        The spool is read back in chunks and streamed with an explicit
+        Content-Length (pre-signed PUT URLs do not accept chunked transfer
+        encoding).
+
+        Args:
+            job: The job row.
+            spool: Binary file holding the compressed export.
+
+        Returns:
+            The stored file ID.
+        """
+        size = spool.tell()
+        spool.seek(0)
+
+        upload = await self.db.file_upload_url(
+            file_name=f"{job['id']}.{job['format']}.zst",
+            content_type=EXPORT_CONTENT_TYPE,
+            folder=EXPORT_FOLDER,
+        )
+
+        async def body() -> AsyncIterator[bytes]:
+            while chunk := await asyncio.to_thread(spool.read, EXPORT_CHUNK_BYTES):
+                yield chunk
+
+        async with httpx.AsyncClient() as http:
+            response = await http.put(
+                upload["upload_url"],
+                content=body(),
+                headers={
+                    "Content-Type": EXPORT_CONTENT_TYPE,
+                    "Content-Length": str(size),
+                },
+            )
+            response.raise_for_status()
+
+        return upload["file_id"]
+
+
+@lru_cache(maxsize=4)
+def get_audit_export_service(db: ZeroDBClient) -> AuditExportService:
+    """Get the cached AuditExportService for a database client."""
+    return AuditExportService(db)
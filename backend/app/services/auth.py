@@ -9,9 +9,10 @@ This module provides authentication functionality including:
 import logging
 import secrets
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
 
-from app.config import settings
+from app.config import get_settings
 from app.core.exceptions import AuthenticationError, NotFoundError, ValidationError
 from app.core.security import (
     create_access_token,
@@ -19,6 +20,7 @@ from app.core.security import (
     decode_token,
     verify_token_type,
 )
+from app.core.user_cache import user_cache
 from app.db.zerodb_client import ZeroDBClient
 from app.schemas.auth import (
     AuthResponse,
@@ -35,6 +37,38 @@ logger = logging.getLogger(__name__)
 # Magic link token expiration (15 minutes)
 MAGIC_LINK_EXPIRY_MINUTES = 15
 
+# Flat permission list for each user role, built once at import
+ROLE_PERMISSIONS: dict[str, tuple[str, ...]] = {
+    "super_admin": (
+        "users:read", "users:write", "users:delete",
+        "orgs:read", "orgs:write", "orgs:delete",
+        "documents:read", "documents:write", "documents:delete",
+        "settings:read", "settings:write",
+        "audit:read",
+    ),
+    "org_admin": (
+        "users:read", "users:write",
+        "documents:read", "documents:write", "documents:delete",
+        "settings:read", "settings:write",
+        "audit:read",
+    ),
+    "hr_manager": (
+        "users:read",
+        "documents:read", "documents:write",
+        "settings:read",
+        "audit:read",
+    ),
+    "hr_user": (
+        "documents:read", "documents:write",
+    ),
+    "employee": (
+        "documents:read:own", "documents:write:own",
+    ),
+    "viewer": (
+        "documents:read",
+    ),
+}
+
 
 class AuthService:
     """Service for handling authentication operations."""
@@ -92,7 +126,7 @@ class AuthService:
             )
 
             # Send magic link email (placeholder - log for now)
-            magic_link_url = f"{settings.FRONTEND_URL}/auth/verify?token={token}"
+            magic_link_url = f"{get_settings().FRONTEND_URL}/auth/verify?token={token}"
             logger.info(f"Magic link for {email}: {magic_link_url}")
 
         # Always return same response (security - don't reveal if email exists)
@@ -173,6 +207,9 @@ class AuthService:
             update={"$set": {"last_login_at": datetime.utcnow().isoformat()}},
         )
 
+        # Status and last login changed; drop any cached profile
+        user_cache.invalidate(user["id"])
+
         # Generate JWT tokens
         token_data = {
             "sub": user["id"],
@@ -208,7 +245,7 @@ class AuthService:
                 access_token=access_token,
                 refresh_token=refresh_token,
                 token_type="bearer",
-                expires_in=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                expires_in=get_settings().JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
             ),
         )
 
@@ -259,7 +296,7 @@ class AuthService:
                 access_token=new_access_token,
                 refresh_token=refresh_token,  # Return same refresh token
                 token_type="bearer",
-                expires_in=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                expires_in=get_settings().JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
             )
 
         except Exception as e:
@@ -272,6 +309,9 @@ class AuthService:
     ) -> CurrentUserResponse:
         """Get current authenticated user info.
 
+        Results are served from a short-lived in-process cache so that
+        repeated calls for the same user skip the database.
+
         Args:
             user_id: ID of authenticated user
 
@@ -281,6 +321,15 @@ class AuthService:
         Raises:
             NotFoundError: If user not found
         """
+        return await user_cache.get_or_load(
+            user_id, lambda: self._load_current_user(user_id)
+        )
+
+    async def _load_current_user(
+        self,
+        user_id: str,
+    ) -> CurrentUserResponse:
+        """Load current user info from the database."""
         users = await self.db.query_rows(
             table_id="users",
             filter={"id": user_id},
@@ -321,37 +370,7 @@ class AuthService:
 
     def _get_role_permissions(self, role: str) -> list[str]:
         """Get permissions for a role."""
-        role_permissions = {
-            "super_admin": [
-                "users:read", "users:write", "users:delete",
-                "orgs:read", "orgs:write", "orgs:delete",
-                "documents:read", "documents:write", "documents:delete",
-                "settings:read", "settings:write",
-                "audit:read",
-            ],
-            "org_admin": [
-                "users:read", "users:write",
-                "documents:read", "documents:write", "documents:delete",
-                "settings:read", "settings:write",
-                "audit:read",
-            ],
-            "hr_manager": [
-                "users:read",
-                "documents:read", "documents:write",
-                "settings:read",
-                "audit:read",
-            ],
-            "hr_user": [
-                "documents:read", "documents:write",
-            ],
-            "employee": [
-                "documents:read:own", "documents:write:own",
-            ],
-            "viewer": [
-                "documents:read",
-            ],
-        }
-        return role_permissions.get(role, [])
+        return list(ROLE_PERMISSIONS.get(role, ()))
 
     async def _log_audit_event(
         self,
@@ -378,13 +397,19 @@ class AuthService:
             logger.warning(f"Failed to log audit event: {e}")
 
 
+@lru_cache(maxsize=4)
+def get_auth_service(db: ZeroDBClient) -> AuthService:
+    """Get the cached AuthService for a database client (see get_audit_service)."""
+    return AuthService(db)
+
+
 # Convenience functions for direct import
 async def request_magic_link(
     db: ZeroDBClient,
     data: MagicLinkRequest,
 ) -> MagicLinkResponse:
     """Request a magic link for authentication."""
-    service = AuthService(db)
+    service = get_auth_service(db)
     return await service.request_magic_link(data)
 
 
@@ -393,7 +418,7 @@ async def verify_magic_link(
     data: TokenVerifyRequest,
 ) -> AuthResponse:
     """Verify a magic link token."""
-    service = AuthService(db)
+    service = get_auth_service(db)
     return await service.verify_magic_link(data)
 
 
@@ -402,7 +427,7 @@ async def refresh_access_token(
     refresh_token: str,
 ) -> TokenResponse:
     """Refresh an access token."""
-    service = AuthService(db)
+    service = get_auth_service(db)
     return await service.refresh_access_token(refresh_token)
 
 
@@ -411,5 +436,5 @@ async def get_current_user(
     user_id: str,
 ) -> CurrentUserResponse:
     """Get current user info."""
-    service = AuthService(db)
+    service = get_auth_service(db)
     return await service.get_current_user(user_id)
@@ -9,14 +9,14 @@ This module provides document management functionality including:
 
 import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.db.zerodb_client import ZeroDBClient
 from app.schemas.document import (
+    DOCUMENT_LIST_ADAPTER,
     Document,
     DocumentCreate,
-    DocumentMetadata,
     DocumentStatus,
     DocumentUpdate,
     ExpiringDocumentResponse,
@@ -27,6 +27,64 @@ logger = logging.getLogger(__name__)
 
 DOCUMENTS_TABLE = "documents"
 
+# Columns read for the expiring-documents report
+EXPIRING_DOCUMENT_FIELDS = [
+    "id", "name", "employee_id", "employee_name", "category", "expiration_date",
+]
+
+
+def _parse_datetime(val: Any) -> Optional[datetime]:
+    """Parse a stored timestamp, returning None if it is missing or invalid."""
+    if val is None:
+        return None
+    if isinstance(val, datetime):
+        return val
+    if isinstance(val, str):
+        try:
+            return datetime.fromisoformat(val.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
+
+
+def _metadata_columns(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Map provided metadata fields onto their document columns."""
+    return {
+        name: value.isoformat() if isinstance(value, datetime) else value
+        for name, value in metadata.items()
+    }
+
+
+def _document_fields(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a database row onto Document fields, filling defaults."""
+    return {
+        "id": row["id"],
+        "org_id": row["org_id"],
+        "employee_id": row.get("employee_id", ""),
+        "name": row.get("name", ""),
+        "category": row.get("category", "other"),
+        "status": row.get("status", "pending"),
+        "file_name": row.get("file_name", ""),
+        "file_type": row.get("file_type", ""),
+        "file_size": row.get("file_size", 0),
+        "storage_path": row.get("storage_path", ""),
+        "submission_channel": row.get("submission_channel", "upload"),
+        "issue_date": _parse_datetime(row.get("issue_date")),
+        "expiration_date": _parse_datetime(row.get("expiration_date")),
+        "issuer": row.get("issuer"),
+        "document_number": row.get("document_number"),
+        "metadata": row.get("metadata"),
+        "reviewed_by": row.get("reviewed_by"),
+        "reviewed_by_name": row.get("reviewed_by_name"),
+        "reviewed_at": _parse_datetime(row.get("reviewed_at")),
+        "review_notes": row.get("review_notes"),
+        "rejection_reason": row.get("rejection_reason"),
+        "created_at": _parse_datetime(row.get("created_at")) or datetime.utcnow(),
+        "updated_at": _parse_datetime(row.get("updated_at")),
+        "submitted_at": _parse_datetime(row.get("submitted_at")),
+        "version": row.get("version", 1),
+    }
+
 
 class DocumentService:
     """Service for managing documents and their metadata."""
@@ -80,25 +138,12 @@ class DocumentService:
         }
 
         # Add metadata fields if provided
-        if data.metadata:
-            metadata = data.metadata
-            if metadata.issue_date:
-                doc_data["issue_date"] = metadata.issue_date.isoformat()
-            if metadata.expiration_date:
-                doc_data["expiration_date"] = metadata.expiration_date.isoformat()
-            if metadata.issuer:
-                doc_data["issuer"] = metadata.issuer
-            if metadata.document_number:
-                doc_data["document_number"] = metadata.document_number
-            if metadata.state:
-                doc_data["state"] = metadata.state
-            if metadata.country:
-                doc_data["country"] = metadata.country
-            if metadata.custom_fields:
-                doc_data["custom_fields"] = metadata.custom_fields
+        metadata = data.to_metadata_dict()
+        if metadata:
+            doc_data.update(_metadata_columns(metadata))
 
             # Store full metadata object for querying
-            doc_data["metadata"] = metadata.model_dump(exclude_none=True)
+            doc_data["metadata"] = metadata
 
         logger.info(f"Creating document {document_id} for employee {data.employee_id}")
 
@@ -197,7 +242,7 @@ class DocumentService:
         )
         total = len(all_rows)
 
-        documents = [self._row_to_document(row) for row in rows]
+        documents = self._rows_to_documents(rows)
 
         return documents, total
 
@@ -239,25 +284,12 @@ class DocumentService:
             update_data["notes"] = data.notes
 
         # Handle metadata update
-        if data.metadata is not None:
-            metadata = data.metadata
-            if metadata.issue_date is not None:
-                update_data["issue_date"] = metadata.issue_date.isoformat()
-            if metadata.expiration_date is not None:
-                update_data["expiration_date"] = metadata.expiration_date.isoformat()
-            if metadata.issuer is not None:
-                update_data["issuer"] = metadata.issuer
-            if metadata.document_number is not None:
-                update_data["document_number"] = metadata.document_number
-            if metadata.state is not None:
-                update_data["state"] = metadata.state
-            if metadata.country is not None:
-                update_data["country"] = metadata.country
-            if metadata.custom_fields is not None:
-                update_data["custom_fields"] = metadata.custom_fields
+        metadata = data.to_metadata_dict()
+        if metadata:
+            update_data.update(_metadata_columns(metadata))
 
             # Update full metadata object
-            update_data["metadata"] = metadata.model_dump(exclude_none=True)
+            update_data["metadata"] = metadata
 
         logger.info(f"Updating document {document_id}")
 
@@ -298,47 +330,53 @@ class DocumentService:
         now = datetime.utcnow()
         cutoff_date = now + timedelta(days=days_ahead)
 
-        # Query documents with expiration dates
-        # Note: ZeroDB may need specific query syntax for date ranges
+        # Stored values mix date-only, naive and offset ("Z"/"+00:00")
+        # ISO strings, which do not compare correctly against a full
+        # timestamp as text. Bare dates do: every format for a given day
+        # sorts at or after "YYYY-MM-DD" and before the next day. The
+        # server therefore narrows to whole days, soonest first, and the
+        # exact window is applied below on parsed values.
         rows = await self.db.table_query(
             DOCUMENTS_TABLE,
-            filters={"org_id": org_id},
+            filters={
+                "org_id": org_id,
+                "expiration_date": {
+                    "$gte": now.date().isoformat(),
+                    "$lt": (cutoff_date.date() + timedelta(days=1)).isoformat(),
+                },
+            },
             limit=1000,
+            order_by="expiration_date ASC",
+            fields=EXPIRING_DOCUMENT_FIELDS,
         )
 
         expiring = []
         for row in rows:
-            exp_date_str = row.get("expiration_date")
-            if not exp_date_str:
+            exp_date = _parse_datetime(row.get("expiration_date"))
+            if exp_date is None:
+                logger.warning(f"Invalid expiration date for document {row.get('id')}")
                 continue
 
-            try:
-                if isinstance(exp_date_str, str):
-                    exp_date = datetime.fromisoformat(exp_date_str.replace("Z", "+00:00"))
-                else:
-                    exp_date = exp_date_str
-
-                # Check if expires within the window and not already expired
-                if now <= exp_date.replace(tzinfo=None) <= cutoff_date:
-                    days_until = (exp_date.replace(tzinfo=None) - now).days
-
-                    expiring.append(
-                        ExpiringDocumentResponse(
-                            document_id=row["id"],
-                            document_name=row.get("name", ""),
-                            employee_id=row.get("employee_id", ""),
-                            employee_name=row.get("employee_name"),
-                            category=row.get("category", "other"),
-                            expiration_date=exp_date,
-                            days_until_expiration=days_until,
-                        )
-                    )
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Invalid expiration date for document {row.get('id')}: {e}")
-
-        # Sort by expiration date (soonest first)
-        expiring.sort(key=lambda x: x.days_until_expiration)
+            if exp_date.tzinfo is not None:
+                exp_date = exp_date.astimezone(timezone.utc)
+            exp_date = exp_date.replace(tzinfo=None)
+            if not now <= exp_date <= cutoff_date:
+                continue
 
+            expiring.append(
+                ExpiringDocumentResponse(
+                    document_id=row["id"],
+                    document_name=row.get("name") or "",
+                    employee_id=row.get("employee_id") or "",
+                    employee_name=row.get("employee_name"),
+                    category=row.get("category") or "other",
+                    expiration_date=exp_date,
+                    days_until_expiration=(exp_date - now).days,
+                )
+            )
+
+        # Text order can differ from time order across formats
+        expiring.sort(key=lambda doc: doc.expiration_date)
         return expiring
 
     async def get_expired_documents(
@@ -361,7 +399,7 @@ class DocumentService:
             limit=10000,
         )
 
-        expired = []
+        expired_rows = []
         for row in rows:
             exp_date_str = row.get("expiration_date")
             if not exp_date_str:
@@ -374,11 +412,11 @@ class DocumentService:
                     exp_date = exp_date_str
 
                 if exp_date.replace(tzinfo=None) < now:
-                    expired.append(self._row_to_document(row))
+                    expired_rows.append(row)
             except (ValueError, TypeError):
                 continue
 
-        return expired
+        return self._rows_to_documents(expired_rows)
 
     def _row_to_document(self, row: Dict[str, Any]) -> Document:
         """Convert a database row to a Document object.
@@ -389,46 +427,18 @@ class DocumentService:
         Returns:
             Document object.
         """
-        # Parse datetime fields
-        def parse_datetime(val: Any) -> Optional[datetime]:
-            if val is None:
-                return None
-            if isinstance(val, datetime):
-                return val
-            if isinstance(val, str):
-                try:
-                    return datetime.fromisoformat(val.replace("Z", "+00:00"))
-                except ValueError:
-                    return None
-            return None
+        return Document(**_document_fields(row))
 
-        return Document(
-            id=row["id"],
-            org_id=row["org_id"],
-            employee_id=row.get("employee_id", ""),
-            name=row.get("name", ""),
-            category=row.get("category", "other"),
-            status=row.get("status", "pending"),
-            file_name=row.get("file_name", ""),
-            file_type=row.get("file_type", ""),
-            file_size=row.get("file_size", 0),
-            storage_path=row.get("storage_path", ""),
-            submission_channel=row.get("submission_channel", "upload"),
-            issue_date=parse_datetime(row.get("issue_date")),
-            expiration_date=parse_datetime(row.get("expiration_date")),
-            issuer=row.get("issuer"),
-            document_number=row.get("document_number"),
-            metadata=row.get("metadata"),
-            reviewed_by=row.get("reviewed_by"),
-            reviewed_by_name=row.get("reviewed_by_name"),
-            reviewed_at=parse_datetime(row.get("reviewed_at")),
-            review_notes=row.get("review_notes"),
-            rejection_reason=row.get("rejection_reason"),
-            created_at=parse_datetime(row.get("created_at")) or datetime.utcnow(),
-            updated_at=parse_datetime(row.get("updated_at")),
-            submitted_at=parse_datetime(row.get("submitted_at")),
-            version=row.get("version", 1),
-        )
+    def _rows_to_documents(self, rows: List[Dict[str, Any]]) -> List[Document]:
+        """Convert database rows to Document objects in one validation call.
+
+        Args:
+            rows: Dictionaries from database query.
+
+        Returns:
+            Document objects, in row order.
+        """
+        return DOCUMENT_LIST_ADAPTER.validate_python([_document_fields(row) for row in rows])
 
 
 # Convenience functions
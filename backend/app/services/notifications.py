@@ -0,0 +1,32 @@
+"""Notification delivery for DocFlow HR.
+
+Notification rows are written through a batching buffer, so a burst of
+review actions (e.g. HR working through the queue) becomes a few
+multi-row inserts rather than one insert per action.
+
+Example usage:
+    from app.services.notifications import notification_buffer
+
+    await notification_buffer.enqueue({
+        "employee_id": "emp-123",
+        "type": "document_review",
+        "title": "Document Approved",
+        "message": "Your document has been approved.",
+    })
+"""
+
+from app.core.batch_writer import BatchWriter
+
+NOTIFICATIONS_TABLE = "notifications"
+
+
+class NotificationBuffer(BatchWriter):
+    """Batching writer for the notifications table."""
+
+    def __init__(self) -> None:
+        """Initialize the buffer for the notifications table."""
+        super().__init__(NOTIFICATIONS_TABLE)
+
+
+# Global notification buffer, started and drained by the application lifespan
+notification_buffer = NotificationBuffer()
@@ -5,14 +5,18 @@ including creating, updating, and querying organizations with proper
 multi-tenant isolation and audit logging.
 """
 
+import copy
 import logging
-import re
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+from app.core.ttl_cache import TTLCache
 from app.db.zerodb_client import ZeroDBClient
+from app.models.organization import slugify
 from app.schemas.organizations import (
+    ORGANIZATION_STATUS_BY_VALUE,
     OrganizationCreate,
     OrganizationResponse,
     OrganizationStatus,
@@ -25,6 +29,11 @@ logger = logging.getLogger(__name__)
 
 # Constants
 ORGANIZATIONS_TABLE = "organizations"
+ORGANIZATION_CACHE_TTL_SECONDS = 300.0
+
+# Organizations keyed by ("id", org_id) and ("slug", slug); both keys of an
+# organization share the same response object
+_organization_cache = TTLCache(maxsize=10_000, ttl=ORGANIZATION_CACHE_TTL_SECONDS)
 
 
 class OrganizationService:
@@ -54,12 +63,7 @@ class OrganizationService:
         Returns:
             A lowercase, URL-safe slug.
         """
-        # Convert to lowercase and replace spaces/special chars with hyphens
-        slug = name.lower().strip()
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
-        # Remove leading/trailing hyphens and consecutive hyphens
-        slug = re.sub(r'-+', '-', slug).strip('-')
-        return slug
+        return slugify(name)
 
     async def _is_slug_unique(self, slug: str) -> bool:
         """Check if a slug is unique.
@@ -153,6 +157,7 @@ class OrganizationService:
 
         # Insert into database
         await self.db.table_insert(ORGANIZATIONS_TABLE, [org_data])
+        self._invalidate_cache(org_id, slug)
 
         # Emit audit event
         await emit_audit_event(
@@ -195,32 +200,54 @@ class OrganizationService:
     async def get_organization_by_id(self, org_id: str) -> OrganizationResponse:
         """Get an organization by ID.
 
+        Lookups are served from a short-lived in-process cache.
+
         Args:
             org_id: The organization ID.
 
         Returns:
-            The OrganizationResponse.
+            The OrganizationResponse (a copy the caller may modify).
 
         Raises:
             NotFoundError: If organization not found.
         """
-        rows = await self.db.table_query(
-            ORGANIZATIONS_TABLE,
-            filters={"id": org_id},
-            limit=1,
+        org = await _organization_cache.get_or_load(
+            ("id", org_id),
+            lambda: self._load_organization({"id": org_id}, org_id),
         )
-
-        if not rows:
-            raise NotFoundError(message=f"Organization not found: {org_id}")
-
-        return self._row_to_response(rows[0])
+        return _detach(org)
 
     async def get_organization_by_slug(self, slug: str) -> OrganizationResponse:
         """Get an organization by slug.
 
+        Lookups are served from a short-lived in-process cache.
+
         Args:
             slug: The organization slug.
 
+        Returns:
+            The OrganizationResponse (a copy the caller may modify).
+
+        Raises:
+            NotFoundError: If organization not found.
+        """
+        org = await _organization_cache.get_or_load(
+            ("slug", slug),
+            lambda: self._load_organization({"slug": slug}, slug),
+        )
+        return _detach(org)
+
+    async def _load_organization(
+        self,
+        filters: Dict[str, Any],
+        identifier: str,
+    ) -> OrganizationResponse:
+        """Load an organization from the database and cache it under both keys.
+
+        Args:
+            filters: Lookup filter (by id or slug).
+            identifier: Value used in the not-found message.
+
         Returns:
             The OrganizationResponse.
 
@@ -229,14 +256,27 @@ class OrganizationService:
         """
         rows = await self.db.table_query(
             ORGANIZATIONS_TABLE,
-            filters={"slug": slug},
+            filters=filters,
             limit=1,
         )
 
         if not rows:
-            raise NotFoundError(message=f"Organization not found: {slug}")
+            raise NotFoundError(message=f"Organization not found: {identifier}")
 
-        return self._row_to_response(rows[0])
+        org = self._row_to_response(rows[0])
+        _organization_cache.set(("id", str(org.id)), org)
+        _organization_cache.set(("slug", org.slug), org)
+        return org
+
+    def _invalidate_cache(self, org_id: str, slug: str) -> None:
+        """Drop cached entries for an organization after it changes.
+
+        Args:
+            org_id: The organization ID.
+            slug: The organization slug.
+        """
+        _organization_cache.invalidate(("id", org_id))
+        _organization_cache.invalidate(("slug", slug))
 
     def _row_to_response(self, row: Dict[str, Any]) -> OrganizationResponse:
         """Convert a database row to OrganizationResponse.
@@ -255,19 +295,36 @@ class OrganizationService:
         if isinstance(updated_at, str):
             updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
 
-        return OrganizationResponse(
+        # Skips validation like RoleService._row_to_response; status is
+        # still mapped to its enum member
+        return OrganizationResponse.model_construct(
             id=row["id"],
             name=row["name"],
             slug=row["slug"],
             domain=row.get("domain"),
             admin_email=row["admin_email"],
-            status=OrganizationStatus(row.get("status", "active")),
-            settings=row.get("settings", {}),
+            status=ORGANIZATION_STATUS_BY_VALUE[row.get("status", "active")],
+            settings=row.get("settings") or {},
             created_at=created_at,
             updated_at=updated_at,
         )
 
 
+def _detach(org: OrganizationResponse) -> OrganizationResponse:
+    """Copy a cached organization so callers cannot change the cached one.
+
+    The model is frozen, but its settings dict is not; the copy gets its
+    own settings so the cached instance stays as loaded.
+    """
+    return org.model_copy(update={"settings": copy.deepcopy(org.settings)})
+
+
+@lru_cache(maxsize=4)
+def get_organization_service(db: ZeroDBClient) -> OrganizationService:
+    """Get the cached OrganizationService for a database client (see get_audit_service)."""
+    return OrganizationService(db)
+
+
 async def create_organization(
     db: ZeroDBClient,
     data: OrganizationCreate,
@@ -285,5 +342,5 @@ async def create_organization(
     Returns:
         The created OrganizationResponse.
     """
-    service = OrganizationService(db)
+    service = get_organization_service(db)
     return await service.create_organization(data, actor_id, actor_email)
@@ -19,6 +19,7 @@ from typing import Optional
 from app.core.events import EventType
 from app.core.exceptions import NotFoundError, ValidationError, ConflictError
 from app.db.zerodb_client import ZeroDBClient
+from app.schemas.legal_hold import parse_date_range
 from app.schemas.retention import (
     RetentionCalculation,
     RetentionPolicy,
@@ -319,9 +320,7 @@ class RetentionService:
             # Hold applies to documents created in date range
             # scope_value format: "2023-01-01:2023-12-31"
             try:
-                start_str, end_str = scope_value.split(":")
-                start_date = datetime.fromisoformat(start_str)
-                end_date = datetime.fromisoformat(end_str)
+                start_date, end_date = parse_date_range(scope_value)
 
                 doc_created_at = document.get("created_at")
                 if isinstance(doc_created_at, str):
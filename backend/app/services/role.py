@@ -10,10 +10,10 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from app.db.zerodb_client import ZeroDBClient
-from app.models.enums import RoleType, DEFAULT_ORG_ROLES
+from app.models.enums import RoleType, DEFAULT_ORG_ROLES, ROLE_TYPE_BY_VALUE
 from app.models.role import ROLE_DESCRIPTIONS, ROLE_DISPLAY_NAMES
 from app.schemas.roles import RoleResponse, SeedRolesResponse
-from app.services.audit import emit_audit_event
+from app.services.audit import get_audit_service
 from app.core.exceptions import NotFoundError
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,62 @@ logger = logging.getLogger(__name__)
 # Constants
 ROLES_TABLE = "roles"
 
+# Default permission sets for each role
+DEFAULT_ROLE_PERMISSIONS: Dict[RoleType, Dict[str, Any]] = {
+    RoleType.HR_ADMIN: {
+        "employees": ["create", "read", "update", "delete"],
+        "documents": ["create", "read", "update", "delete", "approve", "reject"],
+        "roles": ["read", "assign"],
+        "settings": ["read", "update"],
+        "audit": ["read"],
+        "reports": ["read", "export"],
+    },
+    RoleType.HR_MANAGER: {
+        "employees": ["create", "read", "update"],
+        "documents": ["create", "read", "update", "approve", "reject"],
+        "roles": ["read"],
+        "audit": ["read"],
+        "reports": ["read"],
+    },
+    RoleType.LEGAL: {
+        "employees": ["read"],
+        "documents": ["read"],
+        "legal_holds": ["create", "read", "update", "delete"],
+        "audit": ["read", "export"],
+        "reports": ["read", "export"],
+    },
+    RoleType.IT_ADMIN: {
+        "integrations": ["create", "read", "update", "delete"],
+        "settings": ["read", "update"],
+        "audit": ["read"],
+    },
+    RoleType.AUDITOR: {
+        "employees": ["read"],
+        "documents": ["read"],
+        "audit": ["read", "export"],
+        "reports": ["read", "export"],
+    },
+    RoleType.EMPLOYEE: {
+        "documents": ["create", "read"],  # Own documents only
+        "profile": ["read", "update"],
+    },
+}
+
+# Static part of every default role row, built once; seeding only adds
+# the per-organization id, org_id and timestamps. Permission dicts are
+# shared with seeded rows and responses, so treat them as read-only.
+DEFAULT_ROLE_TEMPLATES: List[Dict[str, Any]] = [
+    {
+        "name": ROLE_DISPLAY_NAMES.get(role_type, role_type.value),
+        "role_type": role_type.value,
+        "description": ROLE_DESCRIPTIONS.get(role_type, ""),
+        "permissions": DEFAULT_ROLE_PERMISSIONS.get(role_type, {}),
+        "is_default": True,
+        "is_active": True,
+    }
+    for role_type in DEFAULT_ORG_ROLES
+]
+
 
 class RoleService:
     """Service for managing roles.
@@ -61,58 +117,59 @@ class RoleService:
         """
         logger.info(f"Seeding default roles for organization: {org_id}")
 
-        created_roles: List[RoleResponse] = []
         created_at = datetime.utcnow()
+        created_at_iso = created_at.isoformat()
 
-        for role_type in DEFAULT_ORG_ROLES:
-            role_id = str(uuid.uuid4())
-
-            role_data = {
-                "id": role_id,
+        role_rows = [
+            {
+                **template,
+                "id": str(uuid.uuid4()),
                 "org_id": org_id,
-                "name": ROLE_DISPLAY_NAMES.get(role_type, role_type.value),
-                "role_type": role_type.value,
-                "description": ROLE_DESCRIPTIONS.get(role_type, ""),
-                "permissions": self._get_default_permissions(role_type),
-                "is_default": True,
-                "is_active": True,
-                "created_at": created_at.isoformat(),
-                "updated_at": created_at.isoformat(),
+                "created_at": created_at_iso,
+                "updated_at": created_at_iso,
             }
+            for template in DEFAULT_ROLE_TEMPLATES
+        ]
 
-            # Insert role into database
-            await self.db.table_insert(ROLES_TABLE, [role_data])
+        # Insert all roles in one request
+        await self.db.table_insert(ROLES_TABLE, role_rows)
 
-            # Emit audit event for role creation
-            await emit_audit_event(
-                db=self.db,
-                entity_type="role",
-                entity_id=role_id,
-                action="role.created",
-                actor_id=actor_id,
-                org_id=org_id,
-                actor_email=actor_email,
-                metadata={
-                    "role_type": role_type.value,
-                    "name": role_data["name"],
-                    "is_default": True,
-                },
-            )
+        # Emit audit events for role creation in one insert
+        await get_audit_service(self.db).emit_events(
+            org_id=org_id,
+            events=[
+                {
+                    "entity_type": "role",
+                    "entity_id": row["id"],
+                    "action": "role.created",
+                    "actor_id": actor_id,
+                    "metadata": {
+                        "role_type": row["role_type"],
+                        "name": row["name"],
+                        "is_default": True,
+                    },
+                }
+                for row in role_rows
+            ],
+            actor_email=actor_email,
+        )
 
-            created_roles.append(
-                RoleResponse(
-                    id=role_id,
-                    org_id=org_id,
-                    name=role_data["name"],
-                    role_type=role_type,
-                    description=role_data["description"],
-                    permissions=role_data["permissions"],
-                    is_default=True,
-                    is_active=True,
-                    created_at=created_at,
-                    updated_at=created_at,
-                )
+        # Rows were built from trusted constants; skip re-validation
+        created_roles = [
+            RoleResponse.model_construct(
+                id=row["id"],
+                org_id=org_id,
+                name=row["name"],
+                role_type=ROLE_TYPE_BY_VALUE[row["role_type"]],
+                description=row["description"],
+                permissions=row["permissions"],
+                is_default=True,
+                is_active=True,
+                created_at=created_at,
+                updated_at=created_at,
             )
+            for row in role_rows
+        ]
 
         logger.info(f"Created {len(created_roles)} default roles for org {org_id}")
 
@@ -172,51 +229,13 @@ class RoleService:
         Returns:
             Dictionary of permissions.
         """
-        # Define permission sets for each role
-        permissions = {
-            RoleType.HR_ADMIN: {
-                "employees": ["create", "read", "update", "delete"],
-                "documents": ["create", "read", "update", "delete", "approve", "reject"],
-                "roles": ["read", "assign"],
-                "settings": ["read", "update"],
-                "audit": ["read"],
-                "reports": ["read", "export"],
-            },
-            RoleType.HR_MANAGER: {
-                "employees": ["create", "read", "update"],
-                "documents": ["create", "read", "update", "approve", "reject"],
-                "roles": ["read"],
-                "audit": ["read"],
-                "reports": ["read"],
-            },
-            RoleType.LEGAL: {
-                "employees": ["read"],
-                "documents": ["read"],
-                "legal_holds": ["create", "read", "update", "delete"],
-                "audit": ["read", "export"],
-                "reports": ["read", "export"],
-            },
-            RoleType.IT_ADMIN: {
-                "integrations": ["create", "read", "update", "delete"],
-                "settings": ["read", "update"],
-                "audit": ["read"],
-            },
-            RoleType.AUDITOR: {
-                "employees": ["read"],
-                "documents": ["read"],
-                "audit": ["read", "export"],
-                "reports": ["read", "export"],
-            },
-            RoleType.EMPLOYEE: {
-                "documents": ["create", "read"],  # Own documents only
-                "profile": ["read", "update"],
-            },
-        }
-
-        return permissions.get(role_type, {})
+        return DEFAULT_ROLE_PERMISSIONS.get(role_type, {})
 
     def _row_to_response(self, row: Dict[str, Any]) -> RoleResponse:
-        """Convert a database row to RoleResponse.
+        """Convert a database row to RoleResponse without re-validating it.
+
+        Timestamps are parsed and role_type is mapped to its enum member
+        here; every other column is taken as stored.
 
         Args:
             row: Dictionary from database query.
@@ -232,13 +251,13 @@ class RoleService:
         if isinstance(updated_at, str):
             updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
 
-        return RoleResponse(
+        return RoleResponse.model_construct(
             id=row["id"],
             org_id=row["org_id"],
             name=row["name"],
-            role_type=RoleType(row["role_type"]),
+            role_type=ROLE_TYPE_BY_VALUE[row["role_type"]],
             description=row.get("description"),
-            permissions=row.get("permissions", {}),
+            permissions=row.get("permissions") or {},
             is_default=row.get("is_default", False),
             is_active=row.get("is_active", True),
             created_at=created_at,
@@ -0,0 +1,76 @@
+"""In-memory stand-ins for external services used by the tests."""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from app.db.zerodb_client import _project, _sort_rows
+
+_OPERATORS = {
+    "$lt": lambda value, bound: value is not None and value < bound,
+    "$lte": lambda value, bound: value is not None and value <= bound,
+    "$gt": lambda value, bound: value is not None and value > bound,
+    "$gte": lambda value, bound: value is not None and value >= bound,
+    "$in": lambda value, bound: value in bound,
+}
+
+
+def _matches(row: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """Check a row against ZeroDB-style filters."""
+    for column, condition in (filters or {}).items():
+        value = row.get(column)
+        if isinstance(condition, dict):
+            if not all(_OPERATORS[op](value, bound) for op, bound in condition.items()):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeZeroDB:
+    """Minimal in-memory ZeroDB with the table API the services use.
+
+    Filters support equality and the $lt/$lte/$gt/$gte/$in operators;
+    order_by and fields are honoured like a server that supports them.
+    Every table_query call is recorded in ``queries``.
+    """
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> None:
+        self.tables: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for name, rows in (tables or {}).items():
+            self.tables[name] = [dict(row) for row in rows]
+        self.queries: List[Dict[str, Any]] = []
+
+    async def table_insert(self, table_name: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self.tables[table_name].extend(dict(row) for row in rows)
+        return {"inserted": len(rows)}
+
+    async def table_query(
+        self,
+        table_name: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        self.queries.append({"table": table_name, "filters": filters, "offset": offset})
+        rows = [dict(row) for row in self.tables[table_name] if _matches(row, filters)]
+        if order_by:
+            rows = _sort_rows(rows, order_by)
+        return _project(rows[offset:offset + limit], fields)
+
+    async def table_count(self, table_name: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        return sum(1 for row in self.tables[table_name] if _matches(row, filters))
+
+    async def table_update(
+        self,
+        table_name: str,
+        filters: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        updated = 0
+        for row in self.tables[table_name]:
+            if _matches(row, filters):
+                row.update(update)
+                updated += 1
+        return {"updated": updated}
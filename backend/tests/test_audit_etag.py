@@ -0,0 +1,108 @@
+"""Tests for the audit event listing: scoping and ETag / 304 handling."""
+
+from typing import Optional
+
+import orjson
+import pytest
+from starlette.requests import Request
+
+from app.api.routes.audit import _etag_matches, query_audit_events
+from app.services.audit import AUDIT_EVENTS_TABLE
+from tests.fakes import FakeZeroDB
+
+VIEWER = {"id": "user-1", "org_id": "org-1", "role": "hr_admin"}
+
+
+def _request(if_none_match: Optional[str] = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _event(index: int, org_id: str = "org-1") -> dict:
+    return {
+        "id": f"evt-{index}",
+        "org_id": org_id,
+        "entity_type": "document",
+        "entity_id": "doc-1",
+        "action": "document.viewed",
+        "actor_id": "user-1",
+        "actor_email": "user@example.com",
+        "metadata": None,
+        "created_at": f"2024-01-01T00:00:0{index}+00:00",
+    }
+
+
+async def _list_events(
+    db: FakeZeroDB,
+    if_none_match: Optional[str] = None,
+    viewer: dict = VIEWER,
+    all_orgs: bool = False,
+):
+    return await query_audit_events(
+        request=_request(if_none_match),
+        db=db,
+        viewer=viewer,
+        entity_type=None,
+        entity_id=None,
+        action=None,
+        actor_id=None,
+        start_date=None,
+        end_date=None,
+        page=1,
+        page_size=20,
+        all_orgs=all_orgs,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("role", "expected_total"),
+    [("super_admin", 2), ("Super Admin", 2), ("hr_admin", 1)],
+)
+async def test_all_orgs_is_honored_for_super_admins_only(role: str, expected_total: int) -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: [_event(1), _event(2, org_id="org-2")]})
+
+    response = await _list_events(db, viewer={**VIEWER, "role": role}, all_orgs=True)
+
+    assert orjson.loads(response.body)["total"] == expected_total
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_304() -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: [_event(1), _event(2)]})
+
+    first = await _list_events(db)
+    etag = first.headers["etag"]
+    second = await _list_events(db, if_none_match=etag)
+
+    assert first.status_code == 200
+    assert orjson.loads(first.body)["total"] == 2
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_new_event_changes_etag() -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: [_event(1)]})
+    etag = (await _list_events(db)).headers["etag"]
+
+    await db.table_insert(AUDIT_EVENTS_TABLE, [_event(2)])
+    response = await _list_events(db, if_none_match=etag)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ('"1:a:b"', True),
+        ('W/"1:a:b"', True),
+        ('"0:x:y", "1:a:b"', True),
+        ("*", True),
+        ('"1:a:c"', False),
+        (None, False),
+    ],
+)
+def test_etag_matches(header: Optional[str], expected: bool) -> None:
+    assert _etag_matches(_request(header), '"1:a:b"') is expected
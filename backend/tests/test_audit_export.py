@@ -0,0 +1,179 @@
+"""Tests for background audit export jobs."""
+
+import csv
+import io
+from typing import Any, Dict, List
+
+import httpx
+import orjson
+import pytest
+import zstandard
+
+from app.schemas.audit import AuditExportJobStatus
+from app.services import audit_export
+from app.services.audit import AUDIT_EVENTS_TABLE
+from app.services.audit_export import (
+    AUDIT_EXPORT_JOBS_TABLE,
+    CSV_EXPORT_HEADER,
+    AuditExportService,
+)
+from tests.fakes import FakeZeroDB
+
+ORG_ID = "org-1"
+
+
+class FakeStorageDB(FakeZeroDB):
+    """FakeZeroDB that also hands out upload URLs."""
+
+    def __init__(self, *args: Any, upload_error: Exception = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.upload_error = upload_error
+
+    async def file_upload_url(self, file_name: str, content_type: str, folder: str) -> Dict[str, str]:
+        if self.upload_error:
+            raise self.upload_error
+        return {"upload_url": f"https://storage.test/{folder}/{file_name}", "file_id": "file-1"}
+
+
+def _event(index: int, metadata: Any = None) -> Dict[str, Any]:
+    return {
+        "id": f"evt-{index:03d}",
+        "org_id": ORG_ID,
+        "entity_type": "document",
+        "entity_id": "doc-1",
+        "action": "document.viewed",
+        "actor_id": "user-1",
+        "actor_email": "user@example.com",
+        "metadata": metadata,
+        "created_at": f"2024-01-01T00:00:{index:02d}+00:00",
+    }
+
+
+def _job(format: str) -> Dict[str, Any]:
+    return {
+        "id": "job-1",
+        "org_id": ORG_ID,
+        "requested_by": "user-1",
+        "format": format,
+        "filters": {},
+        "status": AuditExportJobStatus.PENDING.value,
+        "created_at": "2024-01-02T00:00:00",
+    }
+
+
+def _db(events: List[Dict[str, Any]], format: str = "csv", **kwargs: Any) -> FakeStorageDB:
+    return FakeStorageDB(
+        {AUDIT_EVENTS_TABLE: events, AUDIT_EXPORT_JOBS_TABLE: [_job(format)]},
+        **kwargs,
+    )
+
+
+async def _render(db: FakeStorageDB, format: str) -> bytes:
+    spool = io.BytesIO()
+    total = await AuditExportService(db)._render(_job(format), spool)
+    assert total == len(db.tables[AUDIT_EVENTS_TABLE])
+    return zstandard.ZstdDecompressor().decompressobj().decompress(spool.getvalue())
+
+
+@pytest.mark.asyncio
+async def test_render_csv_decompresses_to_export() -> None:
+    db = _db([_event(1), _event(2, metadata={"note": 'a "quoted", value'})])
+
+    data = (await _render(db, "csv")).decode()
+
+    assert data.startswith(CSV_EXPORT_HEADER)
+    rows = list(csv.DictReader(io.StringIO(data)))
+    assert [row["id"] for row in rows] == ["evt-002", "evt-001"]
+    assert orjson.loads(rows[0]["metadata"]) == {"note": 'a "quoted", value'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [0, 3])
+async def test_render_json_decompresses_to_export(count: int) -> None:
+    db = _db([_event(i) for i in range(count)], format="json")
+
+    document = orjson.loads(await _render(db, "json"))
+
+    assert document["org_id"] == ORG_ID
+    assert document["total_events"] == count
+    assert [event["id"] for event in document["events"]] == [
+        f"evt-{i:03d}" for i in reversed(range(count))
+    ]
+
+
+@pytest.fixture
+def uploads(monkeypatch: pytest.MonkeyPatch) -> List[httpx.Request]:
+    """Capture storage uploads instead of sending them."""
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+    client_class = httpx.AsyncClient
+    monkeypatch.setattr(
+        audit_export.httpx,
+        "AsyncClient",
+        lambda: client_class(transport=transport),
+    )
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_run_job_uploads_and_completes(uploads: List[httpx.Request]) -> None:
+    db = _db([_event(1), _event(2)])
+
+    await AuditExportService(db).run_job("job-1", ORG_ID)
+
+    job = db.tables[AUDIT_EXPORT_JOBS_TABLE][0]
+    assert job["status"] == AuditExportJobStatus.COMPLETED.value
+    assert job["file_id"] == "file-1"
+    assert job["total_events"] == 2
+
+    (request,) = uploads
+    body = await request.aread()
+    assert request.url.path.endswith("/job-1.csv.zst")
+    assert int(request.headers["content-length"]) == len(body)
+    data = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    assert data.decode().startswith(CSV_EXPORT_HEADER)
+
+
+@pytest.mark.asyncio
+async def test_run_job_records_failure() -> None:
+    db = _db([_event(1)], upload_error=RuntimeError("storage unavailable"))
+
+    await AuditExportService(db).run_job("job-1", ORG_ID)
+
+    job = db.tables[AUDIT_EXPORT_JOBS_TABLE][0]
+    assert job["status"] == AuditExportJobStatus.FAILED.value
+    assert job["error"] == "storage unavailable"
+    assert job["completed_at"]
+
+
+@pytest.mark.asyncio
+async def test_run_job_records_failure_to_mark_completed(uploads: List[httpx.Request]) -> None:
+    db = _db([_event(1)])
+    table_update = db.table_update
+
+    async def failing_completion(table_name, filters, update):
+        if update["status"] == AuditExportJobStatus.COMPLETED.value:
+            raise RuntimeError("write failed")
+        return await table_update(table_name, filters, update)
+
+    db.table_update = failing_completion
+
+    await AuditExportService(db).run_job("job-1", ORG_ID)
+
+    job = db.tables[AUDIT_EXPORT_JOBS_TABLE][0]
+    assert job["status"] == AuditExportJobStatus.FAILED.value
+    assert job["error"] == "write failed"
+
+
+@pytest.mark.asyncio
+async def test_run_job_for_unknown_job_does_not_raise() -> None:
+    db = _db([_event(1)])
+
+    await AuditExportService(db).run_job("job-1", "other-org")
+
+    assert db.tables[AUDIT_EXPORT_JOBS_TABLE][0]["status"] == AuditExportJobStatus.PENDING.value
@@ -0,0 +1,77 @@
+"""Tests for keyset streaming of audit events."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.audit import AUDIT_EVENTS_TABLE, AuditService
+from tests.fakes import FakeZeroDB
+
+ORG_ID = "org-1"
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(index: int, minute: int, org_id: str = ORG_ID) -> dict:
+    return {
+        "id": f"evt-{index:04d}",
+        "org_id": org_id,
+        "entity_type": "document",
+        "entity_id": "doc-1",
+        "action": "document.viewed",
+        "actor_id": "user-1",
+        "actor_email": "user@example.com",
+        "metadata": None,
+        "created_at": (BASE_TIME + timedelta(minutes=minute)).isoformat(),
+    }
+
+
+def _events() -> list:
+    # Runs of identical timestamps that straddle batch boundaries
+    return [_event(i, i // 4) for i in range(30)] + [_event(99, 0, org_id="org-2")]
+
+
+async def _stream_ids(service: AuditService, **kwargs) -> list:
+    return [row["id"] async for row in service.stream_event_rows(ORG_ID, **kwargs)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("descending", [True, False])
+async def test_stream_yields_every_row_once_in_order(descending: bool) -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: _events()})
+
+    ids = await _stream_ids(AuditService(db), descending=descending, batch_size=3)
+
+    expected = sorted((f"evt-{i:04d}" for i in range(30)), reverse=descending)
+    assert ids == expected
+
+
+@pytest.mark.asyncio
+async def test_stream_respects_limit() -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: _events()})
+
+    ids = await _stream_ids(AuditService(db), limit=10, batch_size=3)
+
+    assert ids == [f"evt-{i:04d}" for i in range(29, 19, -1)]
+
+
+@pytest.mark.asyncio
+async def test_stream_is_stable_under_concurrent_inserts() -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: _events()})
+    service = AuditService(db)
+
+    ids = []
+    async for row in service.stream_event_rows(ORG_ID, batch_size=4):
+        ids.append(row["id"])
+        # New events land ahead of the cursor while the export runs
+        await db.table_insert(AUDIT_EVENTS_TABLE, [_event(1000 + len(ids), 60)])
+
+    assert ids == [f"evt-{i:04d}" for i in range(29, -1, -1)]
+
+
+@pytest.mark.asyncio
+async def test_stream_uses_cursor_instead_of_growing_offset() -> None:
+    db = FakeZeroDB({AUDIT_EVENTS_TABLE: _events()})
+
+    await _stream_ids(AuditService(db), batch_size=4)
+
+    assert max(query["offset"] for query in db.queries) < 4
@@ -0,0 +1,132 @@
+"""Tests for batched audit event writes."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core import batch_writer
+from app.core.batch_writer import OVERFLOW_DROP_OLDEST, BatchWriter
+from app.core.events import AuditEvent, AuditLogger, EventType, _to_row
+from app.services.audit import AUDIT_EVENTS_TABLE
+from tests.fakes import FakeZeroDB
+
+
+class FlakyDB(FakeZeroDB):
+    """FakeZeroDB whose inserts fail a number of times, or for marked rows."""
+
+    def __init__(self, failures: int = 0) -> None:
+        super().__init__()
+        self.failures = failures
+        self.insert_sizes: List[int] = []
+
+    async def table_insert(self, table_name: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self.insert_sizes.append(len(rows))
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("insert failed")
+        if any(row.get("bad") for row in rows):
+            raise RuntimeError("bad row")
+        return await super().table_insert(table_name, rows)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch_writer, "RETRY_BASE_DELAY_SECONDS", 0)
+
+
+async def _write(db: FakeZeroDB, rows: List[Dict[str, Any]], **kwargs: Any) -> None:
+    writer = BatchWriter("rows")
+    writer.start(db, flush_interval_ms=50, **kwargs)
+    for row in rows:
+        await writer.enqueue(row)
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_rows_are_inserted_in_batches() -> None:
+    db = FlakyDB()
+
+    await _write(db, [{"id": i} for i in range(5)], max_batch_size=2)
+
+    assert [row["id"] for row in db.tables["rows"]] == list(range(5))
+    assert db.insert_sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried() -> None:
+    db = FlakyDB(failures=2)
+
+    await _write(db, [{"id": 1}, {"id": 2}], max_retries=3)
+
+    assert [row["id"] for row in db.tables["rows"]] == [1, 2]
+    assert db.insert_sizes == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_bad_row_does_not_lose_the_batch(caplog: pytest.LogCaptureFixture) -> None:
+    db = FlakyDB()
+
+    await _write(db, [{"id": 1}, {"id": 2, "bad": True}, {"id": 3}], max_retries=1)
+
+    assert [row["id"] for row in db.tables["rows"]] == [1, 3]
+    assert "'bad': True" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_enqueue_requires_a_running_writer() -> None:
+    writer = BatchWriter("rows")
+
+    with pytest.raises(RuntimeError):
+        await writer.enqueue({"id": 1})
+
+
+def test_drop_oldest_is_rejected_when_rows_must_not_be_dropped() -> None:
+    writer = BatchWriter("rows", allow_drop=False)
+
+    with pytest.raises(ValueError):
+        writer.start(FakeZeroDB(), overflow_policy=OVERFLOW_DROP_OLDEST)
+
+
+@pytest.mark.asyncio
+async def test_audit_logger_persists_audited_entity_events() -> None:
+    db = FakeZeroDB()
+    logger = AuditLogger()
+    logger.writer.start(db, flush_interval_ms=10)
+
+    await logger.log_event(
+        EventType.DOCUMENT_VIEWED,
+        "Viewed the offer letter",
+        org_id="org-1",
+        user_id="user-1",
+        resource_type="document",
+        resource_id="doc-1",
+    )
+    await logger.log_event(EventType.USER_LOGIN, "user.login", org_id="org-1", user_id="user-1")
+    await logger.writer.stop()
+
+    (row,) = db.tables[AUDIT_EVENTS_TABLE]
+    assert row["entity_type"] == "document"
+    assert row["action"] == "document.viewed"
+    assert row["metadata"]["description"] == "Viewed the offer letter"
+
+
+def test_to_row_keeps_dotted_actions() -> None:
+    row = _to_row(AuditEvent(
+        event_type=EventType.DOCUMENT_SHARED,
+        action="document.shared",
+        org_id="org-1",
+        resource_type="document",
+        resource_id="doc-1",
+        request_id="req-1",
+    ))
+
+    assert row["action"] == "document.shared"
+    assert row["actor_id"] == "system"
+    assert "description" not in row["metadata"]
+    assert row["metadata"]["request_id"] == "req-1"
+
+
+def test_to_row_skips_events_without_an_audited_entity() -> None:
+    event = AuditEvent(event_type=EventType.USER_LOGIN, action="user.login", org_id="org-1")
+
+    assert _to_row(event) is None
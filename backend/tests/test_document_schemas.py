@@ -0,0 +1,57 @@
+"""Tests for the flattened document metadata fields."""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.document import DocumentCreate, DocumentUpdate
+
+CREATE_BODY = {
+    "employee_id": "emp-1",
+    "name": "Driver license",
+    "file_name": "license.pdf",
+    "file_type": "application/pdf",
+    "file_size": 1024,
+    "storage_path": "docs/license.pdf",
+}
+
+
+def test_top_level_metadata_fields() -> None:
+    document = DocumentCreate.model_validate({
+        **CREATE_BODY,
+        "issuer": "DMV",
+        "expiration_date": "2030-01-01T00:00:00",
+    })
+
+    assert document.to_metadata_dict() == {
+        "expiration_date": datetime(2030, 1, 1),
+        "issuer": "DMV",
+    }
+
+
+def test_nested_metadata_is_lifted() -> None:
+    document = DocumentCreate.model_validate({
+        **CREATE_BODY,
+        "metadata": {"issuer": "DMV", "state": "CA", "custom_fields": {"class": "C"}},
+    })
+
+    assert document.issuer == "DMV"
+    assert document.state == "CA"
+    assert document.custom_fields == {"class": "C"}
+
+
+def test_top_level_value_wins_over_nested() -> None:
+    update = DocumentUpdate.model_validate({"issuer": "State", "metadata": {"issuer": "DMV"}})
+
+    assert update.issuer == "State"
+
+
+def test_nested_fields_are_still_validated() -> None:
+    with pytest.raises(ValidationError):
+        DocumentUpdate.model_validate({"metadata": {"state": "California"}})
+
+
+def test_unknown_nested_field_is_rejected() -> None:
+    with pytest.raises(ValidationError, match="Unknown metadata fields: colour"):
+        DocumentUpdate.model_validate({"metadata": {"issuer": "DMV", "colour": "blue"}})
@@ -0,0 +1,46 @@
+"""Tests for the expiring-documents window."""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+import pytest
+
+from app.services.document import DOCUMENTS_TABLE, DocumentService
+from tests.fakes import FakeZeroDB
+
+
+def _document(doc_id: str, expiration_date: Any, org_id: str = "org-1") -> Dict[str, Any]:
+    return {
+        "id": doc_id,
+        "org_id": org_id,
+        "name": f"Document {doc_id}",
+        "employee_id": "emp-1",
+        "category": "license",
+        "expiration_date": expiration_date,
+    }
+
+
+@pytest.mark.asyncio
+async def test_window_applies_across_timestamp_formats() -> None:
+    now = datetime.utcnow().replace(microsecond=0)
+    in_days = lambda days: now + timedelta(days=days)  # noqa: E731
+    db = FakeZeroDB({DOCUMENTS_TABLE: [
+        _document("naive", in_days(3).isoformat()),
+        _document("zulu", in_days(2).isoformat() + "Z"),
+        # 12:00+02:00 is 10:00 UTC
+        _document("offset", in_days(1).replace(hour=12, minute=0, second=0).isoformat() + "+02:00"),
+        _document("date-only", in_days(5).date().isoformat()),
+        _document("expired", in_days(-1).isoformat()),
+        _document("too-late", in_days(31).isoformat()),
+        _document("other-org", in_days(3).isoformat(), org_id="org-2"),
+        _document("invalid", "soon"),
+    ]})
+
+    documents = await DocumentService(db).get_expiring_documents("org-1", days_ahead=30)
+
+    assert [doc.document_id for doc in documents] == ["offset", "zulu", "naive", "date-only"]
+    offset = documents[0]
+    assert offset.expiration_date == in_days(1).replace(hour=10, minute=0, second=0)
+    assert offset.expiration_date.tzinfo is None
+    # The service's clock reads just after ours, so whole days round down
+    assert [doc.days_until_expiration for doc in documents[1:]] == [1, 2, 4]
@@ -0,0 +1,60 @@
+"""Tests for legal hold date range scopes."""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.legal_hold import LegalHoldCreate, parse_date_range
+
+
+def test_parse_date_range() -> None:
+    assert parse_date_range("2023-01-01:2023-12-31") == (
+        datetime(2023, 1, 1),
+        datetime(2023, 12, 31),
+    )
+
+
+def test_parse_date_range_is_cached_per_value() -> None:
+    parse_date_range.cache_clear()
+
+    for _ in range(3):
+        parse_date_range("2024-01-01:2024-06-30")
+
+    info = parse_date_range.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+@pytest.mark.parametrize("scope_value", ["2023-01-01", "2023-01-01:not-a-date", "a:b:c"])
+def test_parse_date_range_rejects_malformed_values(scope_value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_date_range(scope_value)
+
+
+def test_create_accepts_valid_date_range() -> None:
+    hold = LegalHoldCreate(
+        name="Smith Litigation 2024",
+        scope_type="date_range",
+        scope_value="2023-01-01:2023-12-31",
+    )
+
+    assert hold.scope_value == "2023-01-01:2023-12-31"
+
+
+def test_create_rejects_malformed_date_range() -> None:
+    with pytest.raises(ValidationError):
+        LegalHoldCreate(
+            name="Smith Litigation 2024",
+            scope_type="date_range",
+            scope_value="last year",
+        )
+
+
+def test_create_leaves_other_scopes_alone() -> None:
+    hold = LegalHoldCreate(
+        name="Smith Litigation 2024",
+        scope_type="employee",
+        scope_value="emp-1:contractor",
+    )
+
+    assert hold.scope_value == "emp-1:contractor"
@@ -0,0 +1,105 @@
+"""Tests for building role and organization responses."""
+
+from typing import Any, Dict
+
+import pytest
+
+from app.schemas.organizations import OrganizationResponse
+from app.schemas.roles import RoleResponse
+from app.services.organization import OrganizationService
+from app.services.role import RoleService
+from tests.fakes import FakeZeroDB
+
+
+def _without(row: Dict[str, Any], *keys: str) -> Dict[str, Any]:
+    return {key: value for key, value in row.items() if key not in keys}
+
+
+def _role_row(**overrides: Any) -> Dict[str, Any]:
+    row = {
+        "id": "role-1",
+        "org_id": "org-1",
+        "name": "HR Manager",
+        "role_type": "hr_manager",
+        "description": "Reviews documents",
+        "permissions": {"documents": ["read", "review"]},
+        "is_default": True,
+        "is_active": True,
+        "created_at": "2024-01-01T09:00:00Z",
+        "updated_at": "2024-01-02T09:00:00+00:00",
+    }
+    row.update(overrides)
+    return row
+
+
+def _organization_row(**overrides: Any) -> Dict[str, Any]:
+    row = {
+        "id": "org-1",
+        "name": "Acme",
+        "slug": "acme",
+        "domain": "acme.com",
+        "admin_email": "admin@acme.com",
+        "status": "active",
+        "settings": {"timezone": "UTC"},
+        "created_at": "2024-01-01T09:00:00Z",
+        "updated_at": "2024-01-02T09:00:00",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        _role_row(),
+        _role_row(permissions=None),
+        _without(_role_row(), "description", "permissions", "is_default", "is_active"),
+    ],
+)
+def test_role_response_matches_validated_model(row: Dict[str, Any]) -> None:
+    response = RoleService(FakeZeroDB())._row_to_response(row)
+
+    expected = RoleResponse.model_validate({
+        "is_default": False,
+        "is_active": True,
+        **row,
+        "permissions": row.get("permissions") or {},
+    })
+    assert response.model_dump() == expected.model_dump()
+    assert response.model_dump_json() == expected.model_dump_json()
+    assert type(response.role_type) is type(expected.role_type)
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        _organization_row(),
+        _organization_row(settings=None, status="suspended"),
+        _without(_organization_row(), "domain", "status", "settings"),
+    ],
+)
+def test_organization_response_matches_validated_model(row: Dict[str, Any]) -> None:
+    response = OrganizationService(FakeZeroDB())._row_to_response(row)
+
+    expected = OrganizationResponse.model_validate({
+        "status": "active",
+        **row,
+        "settings": row.get("settings") or {},
+    })
+    assert response.model_dump() == expected.model_dump()
+    assert response.model_dump_json() == expected.model_dump_json()
+    assert type(response.status) is type(expected.status)
+
+
+@pytest.mark.asyncio
+async def test_cached_organization_settings_cannot_be_changed_by_callers() -> None:
+    db = FakeZeroDB({"organizations": [_organization_row(id="org-cache", slug="cache-co")]})
+    service = OrganizationService(db)
+
+    first = await service.get_organization_by_id("org-cache")
+    first.settings["timezone"] = "Europe/Paris"
+    second = await service.get_organization_by_id("org-cache")
+    by_slug = await service.get_organization_by_slug("cache-co")
+
+    assert second.settings == {"timezone": "UTC"}
+    assert by_slug.settings == {"timezone": "UTC"}
@@ -0,0 +1,150 @@
+"""Tests for the review queue and review decisions."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes.review import (
+    _apply_review_update,
+    _decode_queue_cursor,
+    _encode_queue_cursor,
+    get_review_queue,
+)
+from app.schemas.review import ReviewQueueResponse
+from tests.fakes import FakeZeroDB
+
+USER = {"id": "user-1", "org_id": "org-1", "role": "hr_manager"}
+
+
+def _document(index: int, submitted_at: Optional[str], **overrides: Any) -> Dict[str, Any]:
+    document = {
+        "id": f"doc-{index:03d}",
+        "org_id": "org-1",
+        "status": "needs_review",
+        "employee_id": "emp-1",
+        "employee_name": "Ada Lovelace",
+        "category": "tax_form",
+        "submission_channel": "email",
+        "submitted_at": submitted_at,
+        "created_at": "2024-01-01T00:00:00",
+    }
+    document.update(overrides)
+    return document
+
+
+def _documents() -> List[Dict[str, Any]]:
+    # Shared timestamps, documents without submitted_at, and rows that
+    # the queue filters must leave out
+    documents = [
+        _document(i, f"2024-01-{1 + i // 3:02d}T09:00:00" if i < 30 else None)
+        for i in range(40)
+    ]
+    documents.append(_document(90, "2024-02-01T09:00:00", status="approved"))
+    documents.append(_document(91, "2024-02-01T09:00:00", org_id="org-2"))
+    return documents
+
+
+async def _queue(
+    db: FakeZeroDB,
+    page: int = 1,
+    page_size: int = 7,
+    cursor: Optional[str] = None,
+    disable_count: bool = False,
+) -> ReviewQueueResponse:
+    return await get_review_queue(
+        request=None,
+        db=db,
+        current_user=USER,
+        request_id="req-1",
+        page=page,
+        page_size=page_size,
+        category=None,
+        submission_channel=None,
+        disable_count=disable_count,
+        cursor=cursor,
+    )
+
+
+def _expected_order() -> List[str]:
+    dated = sorted(
+        (d for d in _documents()[:40] if d["submitted_at"]),
+        key=lambda d: (d["submitted_at"], d["id"]),
+        reverse=True,
+    )
+    undated = sorted(
+        (d for d in _documents()[:40] if not d["submitted_at"]),
+        key=lambda d: d["id"],
+        reverse=True,
+    )
+    return [d["id"] for d in dated + undated]
+
+
+@pytest.mark.asyncio
+async def test_cursor_walk_returns_every_document_once_in_order() -> None:
+    db = FakeZeroDB({"documents": _documents()})
+
+    ids = []
+    response = await _queue(db)
+    while True:
+        ids.extend(item.document_id for item in response.items)
+        if not response.has_next:
+            break
+        assert response.next_cursor
+        response = await _queue(db, cursor=response.next_cursor, disable_count=True)
+        assert response.has_previous
+        assert response.total is None
+
+    assert ids == _expected_order()
+    assert response.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_offset_page_matches_queue_order() -> None:
+    db = FakeZeroDB({"documents": _documents()})
+
+    response = await _queue(db, page=2)
+
+    assert [item.document_id for item in response.items] == _expected_order()[7:14]
+    assert response.total == 40
+    assert response.has_next
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected() -> None:
+    db = FakeZeroDB({"documents": _documents()})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _queue(db, cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("submitted_at", ["2024-01-01T09:00:00Z", None])
+def test_cursor_round_trip(submitted_at: Optional[str]) -> None:
+    cursor = _encode_queue_cursor({"id": "doc-1", "submitted_at": submitted_at})
+
+    assert _decode_queue_cursor(cursor) == (submitted_at, "doc-1")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("current_status", ["pending_review", "needs_review"])
+async def test_review_decision_updates_reviewable_document(current_status: str) -> None:
+    db = FakeZeroDB({"documents": [_document(1, None, status=current_status)]})
+
+    document = await _apply_review_update(db, "doc-001", "org-1", {"status": "approved"}, "approved")
+
+    assert document["status"] == current_status
+    assert db.tables["documents"][0]["status"] == "approved"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("current_status", ["approved", "rejected", "expired"])
+async def test_review_decision_rejects_disallowed_transition(current_status: str) -> None:
+    db = FakeZeroDB({"documents": [_document(1, None, status=current_status)]})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _apply_review_update(db, "doc-001", "org-1", {"status": "rejected"}, "rejected")
+
+    assert exc_info.value.status_code == 409
+    assert db.tables["documents"][0]["status"] == current_status
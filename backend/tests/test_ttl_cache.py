@@ -0,0 +1,74 @@
+"""Tests for the in-process TTL cache."""
+
+import asyncio
+
+import pytest
+
+from app.core import ttl_cache
+from app.core.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch the cache's clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_entries_expire_after_ttl(clock: FakeClock) -> None:
+    cache = TTLCache(ttl=10)
+    cache.set("user-1", {"id": "user-1"})
+
+    clock.now += 9
+    assert cache.get("user-1") == {"id": "user-1"}
+
+    clock.now += 2
+    assert cache.get("user-1") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock: FakeClock) -> None:
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_drops_entry(clock: FakeClock) -> None:
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.invalidate("a")
+
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(clock: FakeClock) -> None:
+    cache = TTLCache()
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("key", load) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert calls == 1
@@ -0,0 +1,69 @@
+"""Tests for the ZeroDB client's local sort and count fallbacks."""
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from app.core.exceptions import DatabaseError, ValidationError
+from app.db import zerodb_client
+from app.db.zerodb_client import ZeroDBClient
+
+
+class UnsortedServerClient(ZeroDBClient):
+    """Client whose server rejects order_by and has no count endpoint."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        super().__init__(base_url="http://zerodb.test", api_key="key", project_id="project")
+        self.rows = rows
+        self.requests: List[Optional[str]] = []
+
+    async def _query_rows(
+        self,
+        table_name: str,
+        filters: Optional[Dict[str, Any]],
+        limit: int,
+        offset: int,
+        order_by: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        self.requests.append(order_by)
+        if order_by:
+            raise ValidationError(message="order_by not supported")
+        return self.rows[offset:offset + limit]
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        raise DatabaseError(message="count not supported")
+
+
+@pytest.fixture(autouse=True)
+def small_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(zerodb_client, "FALLBACK_PAGE_SIZE", 2)
+    monkeypatch.setattr(zerodb_client, "FALLBACK_MAX_ROWS", 4)
+
+
+@pytest.mark.asyncio
+async def test_query_sorts_locally_and_retries_server_each_call() -> None:
+    client = UnsortedServerClient([{"id": i} for i in (2, 0, 3)])
+
+    first = await client.table_query("t", limit=2, order_by="id DESC")
+    second = await client.table_query("t", limit=2, offset=2, order_by="id DESC")
+
+    assert [row["id"] for row in first + second] == [3, 2, 0]
+    # Each call asks the server to sort before falling back
+    assert client.requests.count("id DESC") == 2
+
+
+@pytest.mark.asyncio
+async def test_local_sort_is_capped() -> None:
+    client = UnsortedServerClient([{"id": i} for i in range(5)])
+
+    with pytest.raises(DatabaseError):
+        await client.table_query("t", order_by="id DESC")
+
+
+@pytest.mark.asyncio
+async def test_count_falls_back_within_cap() -> None:
+    assert await UnsortedServerClient([{"id": i} for i in range(4)]).table_count("t") == 4
+
+    with pytest.raises(DatabaseError):
+        await UnsortedServerClient([{"id": i} for i in range(5)]).table_count("t")